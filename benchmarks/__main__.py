@@ -0,0 +1,55 @@
+# ------------------------------------------------------------------------------
+#  GNU General Public License
+#
+#  Copyright (c) 2020, Hieu Pham.
+#
+#  This file is part of Py-Architect.
+#  <https://github.com/hieupth/pyarchitect>
+#
+#  Py-Architect is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Py-Architect is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import sys
+from argparse import ArgumentParser
+from benchmarks.runner import run, compare
+
+
+def main(argv=None):
+    """
+    Command line of benchmark suite.
+        python -m benchmarks run [-k pattern] [--scale n] [--repeat n] [-o results.json]
+        python -m benchmarks compare baseline.json current.json [--threshold 0.1]
+    Compare exits with status 1 when any case regresses.
+    :param argv:    command line arguments.
+    """
+    parser = ArgumentParser(prog='python -m benchmarks')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+    runs = commands.add_parser('run', help='run benchmarks and save results as JSON.')
+    runs.add_argument('-k', '--pattern', help='regular expression selecting cases by name.')
+    runs.add_argument('--scale', type=int, default=1, help='scale of workloads.')
+    runs.add_argument('--repeat', type=int, default=5, help='number of timed runs of each case.')
+    runs.add_argument('-o', '--output', help='path of JSON results.')
+    compares = commands.add_parser('compare', help='compare results against a baseline.')
+    compares.add_argument('baseline', help='path of baseline results.')
+    compares.add_argument('current', help='path of current results.')
+    compares.add_argument('--threshold', type=float, default=0.1, help='relative slowdown flagged as regression.')
+    args = parser.parse_args(argv)
+    if args.command == 'run':
+        run(args.pattern, args.scale, args.repeat, args.output)
+    elif len(compare(args.baseline, args.current, args.threshold)) > 0:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,258 @@
+# ------------------------------------------------------------------------------
+#  GNU General Public License
+#
+#  Copyright (c) 2020, Hieu Pham.
+#
+#  This file is part of Py-Architect.
+#  <https://github.com/hieupth/pyarchitect>
+#
+#  Py-Architect is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Py-Architect is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+from threading import Thread, Barrier
+from pyarchitect.datastructs.gentree import Node
+from pyarchitect.kwargparse import KwargParse
+from pyarchitect.utils.dicts import update
+from pyarchitect.patterns.locator import Locator
+from pyarchitect.patterns.singleton import Singleton
+
+
+# Registered cases by name, each is a setup function of scale returning the function under benchmark
+# and the number of operations it performs.
+CASES = dict()
+# Tree shapes, each maps a number of nodes to the parent index of each node after root.
+SHAPES = {
+    'wide': lambda size: [0] * (size - 1),
+    'deep': lambda size: list(range(size - 1)),
+    'balanced': lambda size: [i // 4 for i in range(size - 1)]
+}
+# Number of threads of contention cases, and of the singleton sweep.
+THREADS = 4
+SWEEP = (1, 2, 4, 8)
+
+
+def case(name):
+    """
+    Register a benchmark case.
+    :param name:    name of case.
+    :return:        decorator of setup function.
+    """
+    def decorator(setup):
+        CASES[name] = setup
+        return setup
+    return decorator
+
+
+def build(shape, size):
+    """
+    Build a tree of a shape.
+    :param shape:   name of shape.
+    :param size:    number of nodes.
+    :return:        list of nodes, root first.
+    """
+    # Names are positive, so none of them falls back to 'none'.
+    nodes = [Node(size)]
+    for i, parent in enumerate(SHAPES[shape](size)):
+        nodes.append(nodes[parent].attach(Node(i + 1))[1])
+    return nodes
+
+
+def contend(calls, target, threads=THREADS):
+    """
+    Call a function from many threads at the same time.
+    :param calls:   number of calls per thread.
+    :param target:  function to be called.
+    :param threads: number of threads.
+    """
+    barrier = Barrier(threads)
+
+    def worker():
+        barrier.wait()
+        for _ in range(calls):
+            target()
+
+    workers = [Thread(target=worker) for _ in range(threads)]
+    for worker_thread in workers:
+        worker_thread.start()
+    for worker_thread in workers:
+        worker_thread.join()
+
+
+def _gentree_cases(shape):
+    """
+    Register gentree cases of a shape.
+    :param shape:   name of shape.
+    """
+    @case('gentree.attach.%s' % shape)
+    def attach(scale):
+        size = 20000 * scale
+        return lambda: build(shape, size), size - 1
+
+    @case('gentree.detach.%s' % shape)
+    def detach(scale):
+        size = 20000 * scale
+        nodes = build(shape, size)
+
+        def run():
+            # Leaves go first, so every node is detached from a tree.
+            for node in reversed(nodes[1:]):
+                node.__parent__.detach(node.name)
+        return run, size - 1
+
+    @case('gentree.search.%s' % shape)
+    def search(scale):
+        size = 20000 * scale
+        root = build(shape, size)[0]
+        # No node matches, so the whole tree is walked whatever its shape.
+        return lambda: root.search(lambda node: node.name < 0), size
+
+    @case('gentree.tops.%s' % shape)
+    def tops(scale):
+        size = 20000 * scale
+        root = build(shape, size)[0]
+        return lambda: root.tops, size
+
+
+for item in SHAPES:
+    _gentree_cases(item)
+
+
+def _parser(width=10, depth=2):
+    """
+    Build a kwarg parse with nested groups.
+    :param width:   number of leaves of each group.
+    :param depth:   number of nested group levels.
+    :return:        kwarg parse and matching keyword arguments.
+    """
+    root, kwargs = KwargParse('root', ignore=True), dict()
+    lookup = [(root, kwargs, depth)]
+    while len(lookup) > 0:
+        parse, args, level = lookup.pop()
+        for i in range(width):
+            name = 'arg%d' % i
+            _, leaf = parse.attach(name, key='key%d' % i, default=i)
+            if level > 0 and i % 2 == 0:
+                args[name] = dict()
+                lookup.append((leaf, args[name], level - 1))
+            elif i % 3 != 0:
+                args[name] = i * 10
+    return root, kwargs
+
+
+def _parse(scale, compiled, cached=False):
+    """
+    Set up parsing keyword arguments.
+    :param scale:       scale of case.
+    :param compiled:    parse with compiled plan or by walking the tree?
+    :param cached:      parse through the result cache or not?
+    :return:            function under benchmark and number of operations.
+    """
+    calls = 2000 * scale
+    parser, kwargs = _parser()
+    if compiled:
+        parser.compile()
+    if cached:
+        parser.cache()
+
+    def run():
+        for _ in range(calls):
+            parser.parse(**kwargs)
+    return run, calls
+
+
+@case('kwargparse.parse')
+def kwargparse_parse(scale):
+    return _parse(scale, False)
+
+
+@case('kwargparse.parse.compiled')
+def kwargparse_parse_compiled(scale):
+    return _parse(scale, True)
+
+
+@case('kwargparse.parse.cached')
+def kwargparse_parse_cached(scale):
+    return _parse(scale, True, True)
+
+
+@case('kwargparse.to_dict')
+def kwargparse_to_dict(scale):
+    calls = 2000 * scale
+    parser, _ = _parser()
+
+    def run():
+        for _ in range(calls):
+            parser.to_dict()
+    return run, calls
+
+
+def _nested(width, depth, offset=0):
+    """
+    Build a nested dict.
+    :param width:   number of keys of each dict.
+    :param depth:   number of nested levels.
+    :param offset:  offset of values.
+    :return:        nested dict.
+    """
+    if depth == 0:
+        return {'k%d' % i: i + offset for i in range(width)}
+    return {'k%d' % i: _nested(width, depth - 1, offset) for i in range(width)}
+
+
+@case('dicts.update')
+def dicts_update(scale):
+    calls = 10 * scale
+    x, y = _nested(10, 3), _nested(10, 3, 1)
+
+    def run():
+        for _ in range(calls):
+            update(x, y)
+    return run, calls
+
+
+@case('locator.get.threads')
+def locator_get(scale):
+    calls = 50000 * scale
+    locator = Locator()
+    locator.set('service', object())
+    return lambda: contend(calls, lambda: locator.get('service')), calls * THREADS
+
+
+@case('locator.set.threads')
+def locator_set(scale):
+    calls = 50000 * scale
+    locator, service = Locator(), object()
+    return lambda: contend(calls, lambda: locator.set('service', service, True)), calls * THREADS
+
+
+class Service(metaclass=Singleton):
+    """
+    Singleton class under benchmark.
+    """
+    pass
+
+
+def _singleton_case(threads):
+    """
+    Register singleton case under contention of a number of threads.
+    :param threads: number of threads.
+    """
+    @case('singleton.threads.%d' % threads)
+    def singleton_threads(scale):
+        calls = 50000 * scale
+        Service()
+        return lambda: contend(calls, Service, threads), calls * threads
+
+
+for item in SWEEP:
+    _singleton_case(item)
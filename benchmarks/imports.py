@@ -0,0 +1,85 @@
+# ------------------------------------------------------------------------------
+#  GNU General Public License
+#
+#  Copyright (c) 2020, Hieu Pham.
+#
+#  This file is part of Py-Architect.
+#  <https://github.com/hieupth/pyarchitect>
+#
+#  Py-Architect is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Py-Architect is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import sys
+import subprocess
+
+
+# Statements under benchmark, each runs in a fresh interpreter.
+STATEMENTS = (
+    'import pyarchitect',
+    'from pyarchitect.patterns import Singleton',
+    'from pyarchitect.patterns import Locator',
+    'from pyarchitect.datastructs.gentree import Node',
+    'from pyarchitect.kwargparse import KwargParse',
+    'from pyarchitect.utils.dicts import update'
+)
+# Script timing a statement and checking it leaves logging untouched.
+SCRIPT = '''
+import time
+start = time.perf_counter()
+%s
+elapsed = time.perf_counter() - start
+import logging
+root = logging.getLogger()
+print(elapsed, int(len(root.handlers) > 0 or root.level != logging.WARNING))
+'''
+
+
+def measure(statement, repeat):
+    """
+    Time a statement in fresh interpreters.
+    :param statement:   import statement.
+    :param repeat:      number of interpreters.
+    :return:            best seconds and whether logging was configured.
+    """
+    best, configured = None, False
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', SCRIPT % statement], check=True,
+                                stdout=subprocess.PIPE, universal_newlines=True).stdout.split()
+        elapsed, configured = float(output[0]), configured or output[1] == '1'
+        best = elapsed if best is None else min(best, elapsed)
+    return best, configured
+
+
+def main(repeat=10, budget=None):
+    """
+    Report best import time of each statement, exit with error if importing the package exceeds the budget
+    or configures logging.
+    :param repeat:  number of interpreters per statement.
+    :param budget:  milliseconds allowed to import the package, none to skip the check.
+    """
+    failed = False
+    for statement in STATEMENTS:
+        elapsed, configured = measure(statement, repeat)
+        print('%-50s %8.2f ms%s' % (statement, elapsed * 1000, ' (configures logging)' if configured else ''))
+        failed = failed or configured
+    if budget is not None:
+        elapsed = measure(STATEMENTS[0], repeat)[0] * 1000
+        if elapsed > budget:
+            print('import pyarchitect takes %.2f ms, over budget of %.2f ms.' % (elapsed, budget))
+            failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:2]), *map(float, sys.argv[2:3]))
@@ -0,0 +1,114 @@
+# ------------------------------------------------------------------------------
+#  GNU General Public License
+#
+#  Copyright (c) 2020, Hieu Pham.
+#
+#  This file is part of Py-Architect.
+#  <https://github.com/hieupth/pyarchitect>
+#
+#  Py-Architect is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Py-Architect is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import re
+import sys
+import json
+import time
+import platform
+import tracemalloc
+from statistics import median
+from benchmarks.cases import CASES
+
+
+def measure(setup, scale=1, repeat=5):
+    """
+    Measure a case, each repeat runs on a fresh setup. Memory is traced in an extra run,
+    since tracing slows down the timed runs.
+    :param setup:   setup function of case.
+    :param scale:   scale of case.
+    :param repeat:  number of timed runs.
+    :return:        dict of result.
+    """
+    times, ops = [], 0
+    for _ in range(repeat):
+        run, ops = setup(scale)
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    run, ops = setup(scale)
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    seconds = median(times)
+    return dict(ops=ops, seconds=seconds, best=min(times), worst=max(times), ops_per_sec=ops / seconds,
+                ns_per_op=seconds / ops * 1e9, peak_bytes=peak)
+
+
+def run(pattern=None, scale=1, repeat=5, output=None, stream=sys.stdout):
+    """
+    Run cases and save results as JSON.
+    :param pattern: regular expression selecting cases by name, none to run all.
+    :param scale:   scale of cases.
+    :param repeat:  number of timed runs of each case.
+    :param output:  path of JSON results, none to skip saving.
+    :param stream:  stream of report.
+    :return:        dict of results.
+    """
+    results = dict()
+    for name, setup in CASES.items():
+        if pattern is not None and re.search(pattern, name) is None:
+            continue
+        result = results[name] = measure(setup, scale, repeat)
+        stream.write('%-32s %12.0f ops/s %10.1f ns/op %10.1f KiB peak\n'
+                     % (name, result['ops_per_sec'], result['ns_per_op'], result['peak_bytes'] / 1024))
+    document = dict(meta=dict(python=platform.python_version(), implementation=platform.python_implementation(),
+                              machine=platform.machine(), time=time.strftime('%Y-%m-%dT%H:%M:%S'),
+                              scale=scale, repeat=repeat),
+                    results=results)
+    if output is not None:
+        with open(output, 'w') as fp:
+            json.dump(document, fp, indent=2, sort_keys=True)
+    return document
+
+
+def compare(baseline, current, threshold=0.1, stream=sys.stdout):
+    """
+    Compare results against a baseline.
+    :param baseline:    baseline results or path of them.
+    :param current:     current results or path of them.
+    :param threshold:   relative slowdown of ns per op flagged as regression.
+    :param stream:      stream of report.
+    :return:            names of regressed cases.
+    """
+    documents = []
+    for item in (baseline, current):
+        if isinstance(item, str):
+            with open(item) as fp:
+                item = json.load(fp)
+        documents.append(item['results'])
+    baseline, current = documents
+    regressions = []
+    for name in sorted(set(baseline) & set(current)):
+        ratio = current[name]['ns_per_op'] / baseline[name]['ns_per_op']
+        memory = current[name]['peak_bytes'] / max(baseline[name]['peak_bytes'], 1)
+        flag = ratio > 1 + threshold
+        if flag:
+            regressions.append(name)
+        stream.write('%-32s %10.1f -> %10.1f ns/op %+7.1f%% time %+7.1f%% memory%s\n'
+                     % (name, baseline[name]['ns_per_op'], current[name]['ns_per_op'], (ratio - 1) * 100,
+                        (memory - 1) * 100, '  REGRESSION' if flag else ''))
+    for name in sorted(set(baseline) ^ set(current)):
+        stream.write('%-32s only in %s\n' % (name, 'baseline' if name in baseline else 'current'))
+    return regressions
@@ -20,16 +20,28 @@
 #  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
 # ------------------------------------------------------------------------------
 from __future__ import absolute_import
-import logging
+from pyarchitect.lazy import lazy_exports
 
 
 # --------------------------------------------------------------------------------
-# When this library is imported, it configures logging system formats
-# automatically to generate easier readable logs.
+# Importing this library has no side effect, subpackages and modules are only
+# imported when they are used. Call configure_logging to set up library log formats.
 # --------------------------------------------------------------------------------
-# Assign logging formats.
-LOG_FORMAT = '%(levelname)s (%(asctime)s) pid=%(process)d: %(message)s'
-LOG_DATE_FORMAT = 'UTC%Z %d.%m.%y %H:%M:%S'
-# Setting up logging system.
-logging.getLogger().setLevel(logging.INFO)
-logging.basicConfig(format=LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
\ No newline at end of file
+EXPORTS = {
+    'LOG_FORMAT': 'logs',
+    'LOG_DATE_FORMAT': 'logs',
+    'configure_logging': 'logs',
+    'stop_logging': 'logs',
+    'ValidationError': 'generic',
+    'trusted': 'generic',
+    'generic': None,
+    'lazy': None,
+    'logs': None,
+    'metrics': None,
+    'kwargparse': None,
+    'datastructs': None,
+    'patterns': None,
+    'utils': None
+}
+__all__ = list(EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, EXPORTS)
@@ -20,3 +20,15 @@
 #  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
 # ------------------------------------------------------------------------------
 from __future__ import absolute_import
+from pyarchitect.lazy import lazy_exports
+
+
+# Public names and their modules, imported on first use.
+EXPORTS = {
+    'CompactTree': 'compact',
+    'CompactNode': 'compact',
+    'ConcurrentTree': 'cowtree',
+    'FrozenNode': 'cowtree'
+}
+__all__ = list(EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, EXPORTS)
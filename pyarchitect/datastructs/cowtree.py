@@ -0,0 +1,388 @@
+# ------------------------------------------------------------------------------
+#  GNU General Public License
+#
+#  Copyright (c) 2020, Hieu Pham.
+#
+#  This file is part of Py-Architect.
+#  <https://github.com/hieupth/pyarchitect>
+#
+#  Py-Architect is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Py-Architect is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+from numbers import Number
+from threading import Lock
+from pyarchitect.generic import Object, examine
+from pyarchitect.datastructs.gentree import Node, _iter_bfs, _iter_dfs, _split_path
+
+
+class FrozenNode(Object):
+    """
+    Immutable node of a concurrent tree snapshot. A frozen node does not know its parent,
+    so a subtree is shared by every snapshot it has not changed in.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    __slots__ = ('__nick__', '__leaves__')
+
+    @property
+    def name(self):
+        """Get node name."""
+        return self.__nick__
+
+    @property
+    def leaves(self):
+        """Get all leaf nodes."""
+        return list(self.__leaves__.values())
+
+    @property
+    def is_top(self):
+        """Check this node is top leaf or not?"""
+        return len(self.__leaves__) == 0
+
+    @property
+    def tops(self):
+        """Get top leaves of this subtree."""
+        return list(_iter_bfs(self, lambda node: len(node.__leaves__) == 0))
+
+    def __init__(self, name=None, leaves=()):
+        """
+        Class constructor.
+        :param name:    node name.
+        :param leaves:  frozen leaf nodes.
+        """
+        name = name if name else 'none'
+        self.examine(isinstance(name, (str, bool, Number)), 'node name must be a string, boolean or number.')
+        leaves = {leaf.__nick__: leaf for leaf in leaves}
+        object.__setattr__(self, '__nick__', name)
+        object.__setattr__(self, '__leaves__', leaves)
+
+    def __setattr__(self, key, value):
+        raise AttributeError('%s is immutable.' % self.__class__.__name__)
+
+    def __repr__(self):
+        return '<%s %r>' % (self.__class__.__name__, self.__nick__)
+
+    @classmethod
+    def _make(cls, name, leaves):
+        """
+        Create a frozen node without validation, leaves dict is taken over and must not be changed afterward.
+        :param name:    node name.
+        :param leaves:  dict of leaf name and frozen leaf node.
+        :return:        frozen node.
+        """
+        node = cls.__new__(cls)
+        object.__setattr__(node, '__nick__', name)
+        object.__setattr__(node, '__leaves__', leaves)
+        return node
+
+    @classmethod
+    def freeze(cls, node):
+        """
+        Freeze a gentree node with its subtree.
+        :param node:    node to be frozen.
+        :return:        frozen node.
+        """
+        frozen = dict()
+        # Leaves are frozen before their parent in post-order.
+        for item in _iter_dfs(node, post_order=True):
+            leaves = {name: frozen.pop(id(leaf)) for name, leaf in item.__leaves__.items()}
+            frozen[id(item)] = cls._make(item.__nick__, leaves)
+        return frozen[id(node)]
+
+    def thaw(self, cls=Node):
+        """
+        Convert this subtree to mutable gentree nodes.
+        :param cls: node class to be created.
+        :return:    root of converted subtree.
+        """
+        root = cls._trusted(self.__nick__)
+        lookup = [(root, self)]
+        while len(lookup) > 0:
+            node, item = lookup.pop()
+            leaves = node.__leaves__
+            for name, leaf in item.__leaves__.items():
+                created = leaves[name] = cls._trusted(name)
+                created.__parent__ = node
+                lookup.append((created, leaf))
+        return root
+
+    def iter_leaves(self):
+        """
+        Iterate over leaf nodes without copying them into a list.
+        :return:    iterator of leaf nodes.
+        """
+        return iter(self.__leaves__.values())
+
+    def leaf(self, name):
+        """
+        Get leaf node by name.
+        :param name:    leaf name.
+        :return:        leaf node or None.
+        """
+        return self.__leaves__.get(name if name else 'none')
+
+    def get_path(self, path, default=None):
+        """
+        Get node by path relative to this node.
+        :param path:    string of names separated by '/', or sequence of names.
+        :param default: value returned when there is no such node.
+        :return:        found node or default.
+        """
+        node = self
+        for name in _split_path(path):
+            node = node.__leaves__.get(name)
+            if node is None:
+                return default
+        return node
+
+    def iter_bfs(self, cond=None, prune=None, max_depth=None, nested=True):
+        """
+        Lazily walk this subtree in breadth-first order.
+        :param cond:        only yield nodes that meet the condition.
+        :param prune:       do not walk into leaves of nodes that meet this condition.
+        :param max_depth:   do not walk deeper than this depth, this node is at depth 0.
+        :param nested:      walk into leaves of nodes that meet the condition or not?
+        :return:            generator of nodes.
+        """
+        return _iter_bfs(self, cond, prune, max_depth, nested)
+
+    def iter_dfs(self, cond=None, prune=None, max_depth=None, nested=True, post_order=False):
+        """
+        Lazily walk this subtree in depth-first order.
+        :param cond:        only yield nodes that meet the condition.
+        :param prune:       do not walk into leaves of nodes that meet this condition.
+        :param max_depth:   do not walk deeper than this depth, this node is at depth 0.
+        :param nested:      walk into leaves of nodes that meet the condition or not?
+        :param post_order:  yield nodes after their leaves or before them?
+        :return:            generator of nodes.
+        """
+        return _iter_dfs(self, cond, prune, max_depth, nested, post_order)
+
+    def find_first(self, cond=None, prune=None, max_depth=None, depth_first=False):
+        """
+        Find the first node that meets the condition, the walk stops as soon as it is found.
+        :param cond:        condition expression.
+        :param prune:       do not walk into leaves of nodes that meet this condition.
+        :param max_depth:   do not walk deeper than this depth, this node is at depth 0.
+        :param depth_first: walk in depth-first order instead of breadth-first order.
+        :return:            found node or None.
+        """
+        walk = _iter_dfs if depth_first else _iter_bfs
+        return next(walk(self, cond, prune, max_depth), None)
+
+    def search(self, cond=None):
+        """
+        Exhausted search for nodes that meet the condition.
+        Leaves of found nodes are not searched any further.
+        :param cond: condition expression.
+        """
+        self.examine(callable(cond), 'condition must be callable with 1 param.')
+        return list(_iter_bfs(self, cond, nested=False))
+
+    def to_dict(self):
+        """
+        Convert this subtree to a nested dict of leaf names.
+        """
+        _dict = dict()
+        lookup = [(_dict, self)]
+        while len(lookup) > 0:
+            item, node = lookup.pop()
+            for name, leaf in node.__leaves__.items():
+                item[name] = dict()
+                lookup.append((item[name], leaf))
+        return _dict
+
+
+class ConcurrentTree(Object):
+    """
+    General tree shared between threads. Readers take an immutable snapshot, which is a single attribute read,
+    and walk it without any lock while writers keep changing the tree. Writers copy only the nodes on the path
+    from the root to the change, then publish the new root by compare-and-swap: the lock is only held to check
+    that no other writer published meanwhile, otherwise the change is computed again on the newer snapshot.
+    Nodes are addressed by their path from root, since frozen nodes do not know their parents.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+
+    @property
+    def version(self):
+        """Get number of changes published."""
+        return self._state[1]
+
+    @property
+    def retries(self):
+        """Get number of changes computed again because another writer published first."""
+        return self._retries
+
+    @property
+    def tops(self):
+        """Get top leaves of current snapshot."""
+        return self.snapshot().tops
+
+    def __init__(self, root=None):
+        """
+        Class constructor.
+        :param root:    root name, gentree node or frozen node.
+        """
+        if isinstance(root, Node):
+            root = FrozenNode.freeze(root)
+        elif not isinstance(root, FrozenNode):
+            root = FrozenNode(root)
+        # Current root and version are published together, so readers never see a mismatched pair.
+        self._state = (root, 0)
+        # Lock for publishing.
+        self._lock = Lock()
+        self._retries = 0
+
+    def snapshot(self):
+        """
+        Get root of current snapshot, it never changes afterward.
+        :return:    frozen root node.
+        """
+        return self._state[0]
+
+    def commit(self, change):
+        """
+        Apply a change and publish its result. The change may run more than once when writers race,
+        so it must not have side effects.
+        :param change:  callable of current frozen root returning new frozen root.
+        :return:        published root.
+        """
+        while True:
+            root, version = self._state
+            updated = change(root)
+            with self._lock:
+                if self._state[0] is root:
+                    self._state = (updated, version + 1)
+                    return updated
+                self._retries += 1
+
+    @staticmethod
+    def _replace(root, path, change):
+        """
+        Replace the node at a path, copying only its ancestors.
+        :param root:    frozen root node.
+        :param path:    tuple of names from root.
+        :param change:  callable of frozen node returning its replacement.
+        :return:        new frozen root node.
+        """
+        chain, node = [root], root
+        for name in path:
+            node = node.__leaves__.get(name)
+            if node is None:
+                examine(False, 'there is no node at path %s.', '/'.join(map(str, path)))
+            chain.append(node)
+        node = change(node)
+        for i in range(len(path) - 1, -1, -1):
+            leaves = dict(chain[i].__leaves__)
+            leaves[path[i]] = node
+            node = FrozenNode._make(chain[i].__nick__, leaves)
+        return node
+
+    def update(self, path, change):
+        """
+        Replace the subtree at a path.
+        :param path:    path of subtree, string of names separated by '/' or sequence of names.
+        :param change:  callable of frozen node returning its replacement with the same name,
+                        it may run more than once when writers race.
+        :return:        published root.
+        """
+        path = _split_path(path) if path else ()
+        return self.commit(lambda root: self._replace(root, path, change))
+
+    def attach(self, path, node=None):
+        """
+        Attach a leaf node under the node at a path, a leaf of the same name is replaced.
+        :param path:    path of parent node.
+        :param node:    leaf name, gentree node or frozen node.
+        :return:        attached frozen node.
+        """
+        if isinstance(node, Node):
+            node = FrozenNode.freeze(node)
+        elif not isinstance(node, FrozenNode):
+            node = FrozenNode(node)
+
+        def change(parent):
+            leaves = dict(parent.__leaves__)
+            leaves[node.__nick__] = node
+            return FrozenNode._make(parent.__nick__, leaves)
+        self.update(path, change)
+        return node
+
+    def detach(self, path):
+        """
+        Detach the node at a path.
+        :param path:    path of node.
+        :return:        detached frozen node or None.
+        """
+        path = _split_path(path) if path else ()
+        self.examine(len(path) > 0, 'root node cannot be detached.')
+        name, detached = path[-1], []
+
+        def change(parent):
+            leaves = dict(parent.__leaves__)
+            detached[:] = [leaves.pop(name, None)]
+            return FrozenNode._make(parent.__nick__, leaves)
+        self.update(path[:-1], change)
+        return detached[0]
+
+    def rename(self, path, name):
+        """
+        Rename the node at a path, its position among siblings is kept.
+        :param path:    path of node.
+        :param name:    new name.
+        """
+        path = _split_path(path) if path else ()
+        name = name if name else 'none'
+        self.examine(isinstance(name, (str, bool, Number)), 'node name must be a string, boolean or number.')
+        if len(path) == 0:
+            self.update(path, lambda root: FrozenNode._make(name, root.__leaves__))
+            return
+        old = path[-1]
+
+        def change(parent):
+            leaves = parent.__leaves__
+            if old not in leaves:
+                examine(False, 'there is no node at path %s.', '/'.join(map(str, path)))
+            if name != old and name in leaves:
+                examine(False, 'leaf name already exists.')
+            leaves = {(name if key == old else key): (FrozenNode._make(name, leaf.__leaves__) if key == old else leaf)
+                      for key, leaf in leaves.items()}
+            return FrozenNode._make(parent.__nick__, leaves)
+        self.update(path[:-1], change)
+
+    def get_path(self, path, default=None):
+        """
+        Get node by path in current snapshot.
+        :param path:    string of names separated by '/', or sequence of names.
+        :param default: value returned when there is no such node.
+        :return:        found frozen node or default.
+        """
+        return self.snapshot().get_path(path, default)
+
+    def search(self, cond=None):
+        """
+        Exhausted search in current snapshot for nodes that meet the condition.
+        :param cond: condition expression.
+        """
+        return self.snapshot().search(cond)
+
+    def thaw(self, cls=Node):
+        """
+        Convert current snapshot to mutable gentree nodes.
+        :param cls: node class to be created.
+        :return:    root node.
+        """
+        return self.snapshot().thaw(cls)
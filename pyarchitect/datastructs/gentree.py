@@ -21,7 +21,429 @@
 # ------------------------------------------------------------------------------
 from numbers import Number
 from types import LambdaType
-from pyarchitect.generic import Object
+from collections import deque
+from pyarchitect.generic import Object, examine, TRUSTED
+
+
+def _iter_bfs(node, cond=None, prune=None, max_depth=None, nested=True):
+    """
+    Lazily walk a tree in breadth-first order.
+    :param node:        root node of the walk.
+    :param cond:        only yield nodes that meet the condition.
+    :param prune:       do not walk into leaves of nodes that meet this condition.
+    :param max_depth:   do not walk deeper than this depth, root is at depth 0.
+    :param nested:      walk into leaves of nodes that meet the condition or not?
+    :return:            generator of nodes.
+    """
+    # A deque pops from its head in constant time, so the walk is linear in the number of nodes.
+    lookup = deque(((node, 0),))
+    while len(lookup) > 0:
+        node, depth = lookup.popleft()
+        found = cond is None or cond(node)
+        if found:
+            yield node
+        if (found and not nested) or (prune is not None and prune(node)) or depth == max_depth:
+            continue
+        depth += 1
+        lookup.extend((leaf, depth) for leaf in node.__leaves__.values())
+
+
+def _iter_dfs(node, cond=None, prune=None, max_depth=None, nested=True, post_order=False):
+    """
+    Lazily walk a tree in depth-first order.
+    :param node:        root node of the walk.
+    :param cond:        only yield nodes that meet the condition.
+    :param prune:       do not walk into leaves of nodes that meet this condition.
+    :param max_depth:   do not walk deeper than this depth, root is at depth 0.
+    :param nested:      walk into leaves of nodes that meet the condition or not?
+    :param post_order:  yield nodes after their leaves or before them?
+    :return:            generator of nodes.
+    """
+    # We keep an iterator of leaves per level instead of recursion to avoid stack-overflow when the tree is deep.
+    lookup = [(None, False, iter((node,)))]
+    while len(lookup) > 0:
+        node = next(lookup[-1][2], None)
+        # All leaves of the current level are walked.
+        if node is None:
+            node, found, _ = lookup.pop()
+            if post_order and found:
+                yield node
+            continue
+        depth = len(lookup) - 1
+        found = cond is None or cond(node)
+        if found and not post_order:
+            yield node
+        if (found and not nested) or (prune is not None and prune(node)) or depth == max_depth:
+            if found and post_order:
+                yield node
+            continue
+        lookup.append((node, found, iter(node.__leaves__.values())))
+
+
+class Ancestry:
+    """
+    Ancestry index of a tree, it keeps pre-order entry and exit positions (Euler tour) of nodes for constant time
+    ancestor checks and a binary lifting table of ancestors for logarithmic time lowest common ancestor queries.
+    Changes of the tree mark the index invalid, then it is rebuilt by Node.index_ancestry.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    __slots__ = ('root', 'valid', 'nodes', 'positions', 'exits', 'depths', 'ups')
+
+    def __init__(self, root):
+        """
+        Class constructor.
+        :param root:    root node of tree.
+        """
+        self.root = root
+        self.build()
+
+    def build(self):
+        """
+        Build the index over the whole tree.
+        """
+        # The indexed node may be attached to another tree since the last build.
+        root = self.root
+        while root.__parent__ is not None:
+            root = root.__parent__
+        self.root = root
+        # Walk the tree in pre-order to assign positions, parents and depths.
+        nodes, parents, depths = [], [], []
+        lookup = [(root, 0, 0)]
+        while len(lookup) > 0:
+            node, parent, depth = lookup.pop()
+            position = len(nodes)
+            nodes.append(node)
+            parents.append(parent)
+            depths.append(depth)
+            node.__ancestry__ = self
+            lookup.extend((leaf, position, depth + 1) for leaf in reversed(list(node.__leaves__.values())))
+        # Exit position of a node is its last descendant position.
+        sizes = [1] * len(nodes)
+        for position in range(len(nodes) - 1, 0, -1):
+            sizes[parents[position]] += sizes[position]
+        # Each level of the lifting table jumps twice as far as the previous one.
+        ups = [parents]
+        for _ in range(max(depths).bit_length() - 1):
+            up = ups[-1]
+            ups.append([up[item] for item in up])
+        # Assign index.
+        self.nodes = nodes
+        self.positions = {node: position for position, node in enumerate(nodes)}
+        self.exits = [position + size - 1 for position, size in enumerate(sizes)]
+        self.depths = depths
+        self.ups = ups
+        self.valid = True
+
+    def position(self, node):
+        """
+        Get position of a node, the index is rebuilt first if it is invalid.
+        :param node:    node to be looked up.
+        :return:        position of node or None if node is no longer in the tree.
+        """
+        if not self.valid:
+            self.build()
+        return self.positions.get(node)
+
+    def is_ancestor(self, x, y):
+        """
+        Check node at position x is ancestor of node at position y or the same node.
+        :param x:   position of ancestor.
+        :param y:   position of descendant.
+        """
+        return x <= y <= self.exits[x]
+
+    def lowest_common_ancestor(self, x, y):
+        """
+        Get position of lowest common ancestor.
+        :param x:   position of first node.
+        :param y:   position of second node.
+        :return:    position of lowest common ancestor.
+        """
+        if self.is_ancestor(x, y):
+            return x
+        if self.is_ancestor(y, x):
+            return y
+        # Jump as far as possible while staying below the common ancestor.
+        for up in reversed(self.ups):
+            if not self.is_ancestor(up[x], y):
+                x = up[x]
+        return self.ups[0][x]
+
+
+def _iter_paths(node, prefix):
+    """
+    Lazily walk a subtree in pre-order together with paths of nodes.
+    :param node:    root node of the walk.
+    :param prefix:  path of root node.
+    :return:        generator of node and path pairs.
+    """
+    lookup = [(node, prefix)]
+    while len(lookup) > 0:
+        node, path = lookup.pop()
+        yield node, path
+        lookup.extend((leaf, path + (name,)) for name, leaf in node.__leaves__.items())
+
+
+def _split_path(path):
+    """
+    Split a path into a tuple of names.
+    :param path:    string of names separated by '/', or sequence of names.
+    :return:        tuple of names.
+    """
+    if isinstance(path, str):
+        return tuple(name for name in path.split('/') if name)
+    return tuple(path) if isinstance(path, (tuple, list)) else (path,)
+
+
+class PathIndex:
+    """
+    Hash index of a tree which maps full paths of nodes from the indexed root, and node names, to nodes.
+    It is kept up to date incrementally by attach, detach and renaming nodes. Indexes may be nested, so a node
+    belongs to the indexes of all its indexed ancestors.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    __slots__ = ('root', 'paths', 'names')
+
+    def __init__(self, root):
+        """
+        Class constructor.
+        :param root:    root node of index.
+        """
+        self.root = root
+        # Nodes by path.
+        self.paths = dict()
+        # Nodes by name, each value is a dict used as ordered set.
+        self.names = dict()
+        self.add(root, ())
+
+    def path_of(self, node):
+        """
+        Get path of an indexed node.
+        :param node:    indexed node.
+        :return:        tuple of names from the indexed root.
+        """
+        path = []
+        while node is not self.root:
+            path.append(node.__nick__)
+            node = node.__parent__
+        return tuple(reversed(path))
+
+    def add(self, node, prefix):
+        """
+        Add a subtree to index.
+        :param node:    root of subtree.
+        :param prefix:  path of subtree root.
+        """
+        for item, path in _iter_paths(node, prefix):
+            self.paths[path] = item
+            self.names.setdefault(item.__nick__, dict())[item] = None
+            if self not in item.__paths__:
+                item.__paths__ += (self,)
+
+    def remove(self, node, prefix):
+        """
+        Remove a subtree from index.
+        :param node:    root of subtree.
+        :param prefix:  path of subtree root.
+        """
+        for item, path in _iter_paths(node, prefix):
+            self.paths.pop(path, None)
+            named = self.names.get(item.__nick__)
+            if named is not None:
+                named.pop(item, None)
+                if len(named) == 0:
+                    del self.names[item.__nick__]
+            item.__paths__ = tuple(index for index in item.__paths__ if index is not self)
+
+
+class Aggregate:
+    """
+    User-defined subtree aggregate, such as sum, min or max of a node payload. The aggregate of a subtree is the
+    value of its root combined with the aggregates of its leaves, so combine must be associative and commutative.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    __slots__ = ('name', 'value', 'combine', 'inverse')
+
+    def __init__(self, name, value, combine, inverse=None):
+        """
+        Class constructor.
+        :param name:    name of aggregate.
+        :param value:   callable of node returning its own value.
+        :param combine: callable of two aggregates returning their combination, such as operator.add or max.
+        :param inverse: callable which takes a combined part back out, such as operator.sub. Without it,
+                        ancestors are combined again from their leaves when a subtree is detached.
+        """
+        self.name = name
+        self.value = value
+        self.combine = combine
+        self.inverse = inverse
+
+
+class Aggregates:
+    """
+    Subtree aggregates of a tree: size, number of top leaves, height and user-defined aggregates of every node,
+    and the top leaves of the whole tree in breadth-first order. Attach and detach update aggregates along the
+    ancestor path only, and drop top leaves to be walked again when they are asked for.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    __slots__ = ('root', 'aggregates', 'names', 'values', 'tops')
+    # Positions of built-in aggregates in node records, user-defined ones follow.
+    SIZE, TOPS, HEIGHT = 0, 1, 2
+
+    def __init__(self, root, aggregates=()):
+        """
+        Class constructor.
+        :param root:        root node of tree.
+        :param aggregates:  user-defined aggregates.
+        """
+        self.root = root
+        self.aggregates = tuple(aggregates)
+        # Positions of user-defined aggregates by name.
+        self.names = {item.name: i for i, item in enumerate(self.aggregates, 3)}
+        # Records of nodes, each is a list of aggregates.
+        self.values = dict()
+        # Top leaves of tree in breadth-first order, none when they must be walked again.
+        self.tops = None
+        self.build()
+
+    def build(self):
+        """
+        Build aggregates over the whole tree.
+        """
+        root = self.root
+        while root.__parent__ is not None:
+            root = root.__parent__
+        self.root = root
+        self.values.clear()
+        self.tops = None
+        self._compute(root)
+
+    def _record(self, node):
+        """
+        Compute record of a node from records of its leaves.
+        :param node:    node.
+        :return:        record.
+        """
+        values, aggregates = self.values, self.aggregates
+        record = [1, 0, 0]
+        record.extend(item.value(node) for item in aggregates)
+        if len(node.__leaves__) == 0:
+            record[1] = 1
+            return record
+        for leaf in node.__leaves__.values():
+            other = values[leaf]
+            record[0] += other[0]
+            record[1] += other[1]
+            if other[2] >= record[2]:
+                record[2] = other[2] + 1
+            for i, item in enumerate(aggregates, 3):
+                record[i] = item.combine(record[i], other[i])
+        return record
+
+    def _compute(self, node):
+        """
+        Compute records of a subtree in post-order.
+        :param node:    root of subtree.
+        :return:        record of subtree root.
+        """
+        values = self.values
+        # A single node is the common case of attach.
+        if len(node.__leaves__) == 0:
+            values[node] = record = self._record(node)
+            node.__aggregates__ = self
+            return record
+        for item in _iter_dfs(node, post_order=True):
+            values[item] = self._record(item)
+            item.__aggregates__ = self
+        return values[node]
+
+    def _drop(self, node):
+        """
+        Drop records of a subtree.
+        :param node:    root of subtree.
+        """
+        for item in _iter_dfs(node):
+            self.values.pop(item, None)
+            item.__aggregates__ = None
+
+    def refresh(self, node):
+        """
+        Compute records of a node and its ancestors again from their leaves, such as after a payload changes.
+        :param node:    node.
+        """
+        while node is not None and node.__aggregates__ is self:
+            self.values[node] = self._record(node)
+            node = node.__parent__
+
+    def add(self, node, replaced=None):
+        """
+        Add an attached subtree and update its ancestors.
+        :param node:        root of attached subtree.
+        :param replaced:    leaf of the same name replaced by it.
+        """
+        parent, self.tops = node.__parent__, None
+        if replaced is not None:
+            # Replacing is rare, so ancestors are simply computed again.
+            self._drop(replaced)
+            self._compute(node)
+            self.refresh(parent)
+            return
+        other = self._compute(node)
+        # Parent is no longer a top leaf if the subtree is its only leaf.
+        was_top = len(parent.__leaves__) == 1
+        size, tops, height = other[0], other[1] - int(was_top), other[2] + 1
+        values, aggregates = self.values, tuple(enumerate(self.aggregates, 3))
+        while parent is not None and parent.__aggregates__ is self:
+            record = values[parent]
+            record[0] += size
+            record[1] += tops
+            if height > record[2]:
+                record[2] = height
+            height = record[2] + 1
+            for i, item in aggregates:
+                record[i] = item.combine(record[i], other[i])
+            parent = parent.__parent__
+
+    def remove(self, node, parent):
+        """
+        Remove a detached subtree and update its former ancestors.
+        :param node:    root of detached subtree.
+        :param parent:  former parent.
+        """
+        values = self.values
+        other = values.get(node)
+        if other is None:
+            return
+        self._drop(node)
+        self.tops = None
+        # Parent becomes a top leaf when it has no more leaves.
+        became_top = len(parent.__leaves__) == 0
+        tops, heights = int(became_top) - other[1], True
+        while parent is not None and parent.__aggregates__ is self:
+            record, leaves = values[parent], parent.__leaves__.values()
+            record[0] -= other[0]
+            record[1] += tops
+            # Heights of further ancestors only change while heights on the way change.
+            if heights:
+                height = max((values[leaf][2] + 1 for leaf in leaves), default=0)
+                heights, record[2] = height != record[2], height
+            for i, item in enumerate(self.aggregates, 3):
+                if item.inverse is not None:
+                    record[i] = item.inverse(record[i], other[i])
+                else:
+                    value = item.value(parent)
+                    for leaf in leaves:
+                        value = item.combine(value, values[leaf][i])
+                    record[i] = value
+            parent = parent.__parent__
 
 
 class Node(Object):
@@ -30,7 +452,13 @@ class Node(Object):
     ---------
     @author:    Hieu Pham.
     @created:   17th August, 2020.
+    @modified:  18th October, 2026.
     """
+    # Slots keep nodes small and their attributes fast to access.
+    __slots__ = ('__nick__', '__parent__', '__leaves__', '__watched__', '__ancestry__', '__paths__', '__aggregates__',
+                 '__weakref__')
+    # Methods measured by pyarchitect.metrics when it is enabled.
+    __instrumented__ = ('attach', 'detach', 'search', 'find_first', 'tops', 'from_dict', 'to_dict')
 
     @property
     def name(self):
@@ -45,9 +473,27 @@ class Node(Object):
         """
         # First validate name.
         name = name if name else 'none'
-        self.examine(isinstance(name, (str, bool, Number)), 'node name must be a string, boolean or number.')
+        if not TRUSTED.get():
+            self.examine(isinstance(name, (str, bool, Number)), 'node name must be a string, boolean or number.')
+        old, parent, indexes = self.__nick__, self.__parent__, self.__paths__
+        if old == name and type(old) is type(name):
+            return
+        # Leaves of parent are kept by name, so rename the key in order.
+        if parent is not None:
+            if not TRUSTED.get():
+                self.examine(name not in parent.__leaves__, 'leaf name already exists.')
+            parent.__leaves__ = {(name if leaf is self else key): leaf for key, leaf in parent.__leaves__.items()}
+        # Paths of the whole subtree change with the name in every index it belongs to.
+        prefixes = [index.path_of(self) for index in indexes]
+        for index, prefix in zip(indexes, prefixes):
+            index.remove(self, prefix)
         # Assign node name.
         self.__nick__ = name
+        for index, prefix in zip(indexes, prefixes):
+            index.add(self, prefix[:-1] + (name,) if len(prefix) > 0 else ())
+        # Parsers and indexes built over this subtree depend on node names.
+        if self.__watched__:
+            self._changed()
 
     @property
     def parent(self):
@@ -61,7 +507,8 @@ class Node(Object):
         :param parent: parent node.
         """
         # First validate parent node.
-        self.examine(isinstance(parent, Node) or parent is None, 'parent node must be an instance of %s.' % Node)
+        if not TRUSTED.get():
+            self.examine(isinstance(parent, Node) or parent is None, 'parent node must be an instance of %s.', Node)
         # Attach to parent.
         if self.parent != parent:
             # Detach old parent first.
@@ -84,20 +531,66 @@ class Node(Object):
     @property
     def root(self):
         """Get root node of current tree."""
+        index = self._ancestry(rebuild=False)
+        if index is not None:
+            return index.root
         node = self
         while not node.is_root:
             node = node.parent
         return node
 
+    @property
+    def depth(self):
+        """Get depth of this node, root is at depth 0."""
+        index = self._ancestry(rebuild=False)
+        if index is not None:
+            return index.depths[index.positions[self]]
+        depth, node = 0, self.__parent__
+        while node is not None:
+            depth, node = depth + 1, node.__parent__
+        return depth
+
     @property
     def is_top(self):
         """Check this node is top lead or not?"""
-        return len(self.leaves) == 0
+        return len(self.__leaves__) == 0
 
     @property
     def tops(self):
-        """Get top leaves of current tree."""
-        return self.search(lambda node: node.is_top)
+        """Get top leaves of current tree in breadth-first order, a tracked root keeps them until the tree changes."""
+        index = self.__aggregates__
+        if index is not None and index.root is self:
+            if index.tops is None:
+                index.tops = list(_iter_bfs(self, lambda node: len(node.__leaves__) == 0))
+            return list(index.tops)
+        return list(_iter_bfs(self, lambda node: len(node.__leaves__) == 0))
+
+    @property
+    def size(self):
+        """Get number of nodes of this subtree."""
+        index = self.__aggregates__
+        if index is not None:
+            return index.values[self][Aggregates.SIZE]
+        return sum(1 for _ in _iter_bfs(self))
+
+    @property
+    def top_count(self):
+        """Get number of top leaves of this subtree."""
+        index = self.__aggregates__
+        if index is not None:
+            return index.values[self][Aggregates.TOPS]
+        return sum(1 for _ in _iter_bfs(self, lambda node: len(node.__leaves__) == 0))
+
+    @property
+    def height(self):
+        """Get height of this subtree, a top leaf has height 0."""
+        index = self.__aggregates__
+        if index is not None:
+            return index.values[self][Aggregates.HEIGHT]
+        height, level = -1, [self]
+        while len(level) > 0:
+            height, level = height + 1, [leaf for node in level for leaf in node.__leaves__.values()]
+        return height
 
     def __init__(self, name=None, parent=None):
         """
@@ -111,23 +604,127 @@ class Node(Object):
         self.__parent__ = None
         # Leaf nodes of this node.
         self.__leaves__ = dict()
+        # Some ancestor or this node keeps state derived from the subtree or not?
+        self.__watched__ = False
+        # Ancestry index of the tree this node belongs to.
+        self.__ancestry__ = None
+        # Path indexes of this node and its ancestors.
+        self.__paths__ = ()
+        # Subtree aggregates of the tree this node belongs to.
+        self.__aggregates__ = None
         # Now, we validate and assign node name.
         self.name = name
         # Then, we validate and assign parent node.
         self.parent = parent
 
+    @classmethod
+    def _trusted(cls, name):
+        """
+        Create a node without validation, it is used by bulk builders which validate their input once up front.
+        Subclasses with additional state override it to assign their state.
+        :param name:    node name.
+        :return:        created node.
+        """
+        node = cls.__new__(cls)
+        node.__nick__ = name if name else 'none'
+        node.__parent__ = None
+        node.__leaves__ = dict()
+        node.__watched__ = False
+        node.__ancestry__ = None
+        node.__paths__ = ()
+        node.__aggregates__ = None
+        return node
+
+    @classmethod
+    def from_dict(cls, data, name=None):
+        """
+        Build a whole tree in one pass from a nested dict of leaf names, the inverse of to_dict.
+        :param data:    nested dict where each key is a leaf name and each value is a dict of its leaves.
+        :param name:    root name.
+        :return:        root node.
+        """
+        # Validate all input once.
+        lookup, names = [data], [name]
+        while len(lookup) > 0:
+            item = lookup.pop()
+            if not isinstance(item, dict):
+                examine(False, 'leaves must be given as dict.')
+            names.extend(item.keys())
+            lookup.extend(item.values())
+        if not all(isinstance(key, (str, bool, Number)) or not key for key in names):
+            examine(False, 'node name must be a string, boolean or number.')
+        # Then build the tree without validation.
+        root = cls._trusted(name)
+        lookup = [(root, data)]
+        while len(lookup) > 0:
+            node, item = lookup.pop()
+            leaves = node.__leaves__
+            for key, value in item.items():
+                leaf = cls._trusted(key)
+                leaf.__parent__ = node
+                leaves[leaf.__nick__] = leaf
+                lookup.append((leaf, value))
+        return root
+
+    def to_dict(self):
+        """
+        Convert this subtree to a nested dict of leaf names.
+        """
+        _dict = dict()
+        lookup = [(_dict, self)]
+        while len(lookup) > 0:
+            item, node = lookup.pop()
+            for leaf in node.__leaves__.values():
+                item[leaf.__nick__] = dict()
+                lookup.append((item[leaf.__nick__], leaf))
+        return _dict
+
+    def iter_leaves(self):
+        """
+        Iterate over leaf nodes without copying them into a list.
+        :return:    iterator of leaf nodes.
+        """
+        return iter(self.__leaves__.values())
+
+    def leaf(self, name):
+        """
+        Get leaf node by name.
+        :param name:    leaf name.
+        :return:        leaf node or None.
+        """
+        return self.__leaves__.get(name if name else 'none')
+
     def attach(self, node=None):
         """
         Attach a leaf node.
         :param node: node to be attached.
         """
         # Validate leaf node.
-        if node:
-            self.examine(isinstance(node, Node), 'attached node must be a %s.' % Node)
-            self.examine(node.parent == self or node.parent is None, 'cannot attach node of another tree.')
+        if node and not TRUSTED.get():
+            self.examine(isinstance(node, Node), 'attached node must be a %s.', Node)
+            self.examine(node.__parent__ is self or node.__parent__ is None, 'cannot attach node of another tree.')
         # Assign leaf node.
+        replaced = self.__leaves__.get(node.name)
         node.__parent__ = self
         self.__leaves__[node.name] = node
+        # Path indexes of this node and its ancestors take over the attached subtree.
+        if replaced is not node:
+            for index in self.__paths__:
+                prefix = index.path_of(self) + (node.name,)
+                if replaced is not None:
+                    index.remove(replaced, prefix)
+                index.add(node, prefix)
+        # Subtree aggregates of this tree take over the attached subtree.
+        aggregates = self.__aggregates__
+        if aggregates is not None and replaced is not node:
+            aggregates.add(node, replaced)
+        if self.__watched__:
+            self._changed()
+        # Ancestry indexes of both trees are no longer valid.
+        if self.__ancestry__ is not None:
+            self.__ancestry__.valid = False
+        if node.__ancestry__ is not None:
+            node.__ancestry__.valid = False
         # Return results.
         return self, node
 
@@ -138,30 +735,261 @@ class Node(Object):
         """
         # Validate node name.
         name = name if name else 'none'
-        self.examine(isinstance(name, (str, Number, bool)), 'name must be a string, number or bool.')
+        if not TRUSTED.get():
+            self.examine(isinstance(name, (str, Number, bool)), 'name must be a string, number or bool.')
         # Detach leaf node.
         node = self.__leaves__.pop(name, None)
         # Reassign variables.
         if node is not None:
+            for index in self.__paths__:
+                index.remove(node, index.path_of(node))
             node.__parent__ = None
+            if self.__aggregates__ is not None:
+                self.__aggregates__.remove(node, self)
+            if self.__watched__:
+                self._changed()
+            if self.__ancestry__ is not None:
+                self.__ancestry__.valid = False
         # Return results
         return self, node
 
-    def search(self, cond=None):
+    @property
+    def path(self):
+        """Get path of names from root node to this node."""
+        path, node = [], self
+        while node.__parent__ is not None:
+            path.append(node.__nick__)
+            node = node.__parent__
+        return tuple(reversed(path))
+
+    def __getitem__(self, path):
+        """
+        Get node by path, such as node['a/b/c'] or node[('a', 'b', 'c')].
+        :param path:    string of names separated by '/', or sequence of names.
+        :return:        found node, KeyError is raised if there is none.
+        """
+        node = self.get_path(path)
+        if node is None:
+            raise KeyError(path)
+        return node
+
+    def get_path(self, path, default=None):
+        """
+        Get node by path relative to this node. It takes one hash lookup when this node holds a path index,
+        otherwise one lookup per name of the path.
+        :param path:    string of names separated by '/', or sequence of names.
+        :param default: value returned when there is no such node.
+        :return:        found node or default.
+        """
+        path = _split_path(path)
+        index = self._paths()
+        if index is not None:
+            return index.paths.get(path, default)
+        node = self
+        for name in path:
+            node = node.__leaves__.get(name)
+            if node is None:
+                return default
+        return node
+
+    def find(self, name):
+        """
+        Find all nodes of this subtree having the name.
+        :param name:    node name.
+        :return:        list of found nodes.
+        """
+        index = self._paths()
+        if index is not None:
+            return list(index.names.get(name, ()))
+        return list(_iter_bfs(self, lambda node: node.__nick__ == name))
+
+    def index_paths(self):
+        """
+        Build a path index over the subtree of this node, so get_path and find on this node are hash lookups.
+        The index is kept up to date incrementally by attach, detach and renaming nodes, together with indexes
+        of ancestors and of nodes inside the subtree.
+        :return:    path index.
+        """
+        index = self._paths()
+        return index if index is not None else PathIndex(self)
+
+    def _paths(self):
+        """
+        Get the path index built over the subtree of this node.
+        :return:    path index or None if there is no index.
+        """
+        for index in self.__paths__:
+            if index.root is self:
+                return index
+        return None
+
+    def index_ancestry(self):
+        """
+        Build an ancestry index over the tree this node belongs to, so root, depth, ancestor and
+        lowest common ancestor queries run in constant or logarithmic time. Attach and detach invalidate
+        the index, queries then walk the parent chain until it is built again by calling this method.
+        :return:    ancestry index.
+        """
+        index = self._ancestry()
+        return index if index is not None else Ancestry(self)
+
+    def _ancestry(self, rebuild=True):
+        """
+        Get the valid ancestry index of this node.
+        :param rebuild: rebuild an invalid index or not?
+        :return:        ancestry index or None if there is no valid index.
+        """
+        index = self.__ancestry__
+        if index is not None and not index.valid and not rebuild:
+            return None
+        if index is not None and index.position(self) is None:
+            # This node is no longer in the indexed tree.
+            self.__ancestry__ = index = None
+        return index
+
+    def track(self, *aggregates):
+        """
+        Track subtree aggregates over the tree this node belongs to, so size, top_count, height, aggregate and
+        tops of the root take constant time. Attach and detach keep them up to date along the ancestor path,
+        and detached subtrees are no longer tracked. Tops of a tracked root are walked once after each change.
+        :param aggregates:  user-defined aggregates.
+        :return:            subtree aggregates.
+        """
+        return Aggregates(self, aggregates)
+
+    def aggregate(self, name):
+        """
+        Get a user-defined aggregate of this subtree.
+        :param name:    name of aggregate.
+        :return:        aggregate value.
+        """
+        index = self.__aggregates__
+        if index is None or name not in index.names:
+            examine(False, 'aggregate %s is not tracked.', name)
+        return index.values[self][index.names[name]]
+
+    def refresh_aggregates(self):
+        """
+        Compute aggregates of this node and its ancestors again, after values of this node changed.
+        """
+        if self.__aggregates__ is not None:
+            self.__aggregates__.refresh(self)
+
+    def is_ancestor_of(self, node):
+        """
+        Check this node is a (proper) ancestor of another node.
+        :param node:    node to be checked.
+        """
+        self.examine(isinstance(node, Node), 'node must be a %s.', Node)
+        index = self._ancestry(rebuild=False)
+        if index is not None and node._ancestry(rebuild=False) is index:
+            x, y = index.positions[self], index.positions[node]
+            return x != y and index.is_ancestor(x, y)
+        # Without index, we walk up the parent chain.
+        node = node.__parent__
+        while node is not None and node is not self:
+            node = node.__parent__
+        return node is self
+
+    def lowest_common_ancestor(self, node):
+        """
+        Get the lowest common ancestor of this node and another node.
+        :param node:    other node.
+        :return:        lowest common ancestor or None if nodes are in different trees.
+        """
+        self.examine(isinstance(node, Node), 'node must be a %s.', Node)
+        index = self._ancestry(rebuild=False)
+        if index is not None and node._ancestry(rebuild=False) is index:
+            return index.nodes[index.lowest_common_ancestor(index.positions[self], index.positions[node])]
+        # Without index, we lift the deeper node to the same depth, then lift both together.
+        x, y = self, node
+        dx, dy = x.depth, y.depth
+        while dx > dy:
+            x, dx = x.__parent__, dx - 1
+        while dy > dx:
+            y, dy = y.__parent__, dy - 1
+        while x is not y:
+            x, y = x.__parent__, y.__parent__
+        return x
+
+    def _reset(self):
+        """
+        Drop any state derived from the subtree of this node.
+        It is called whenever the subtree changes, subclasses override it to invalidate their caches.
+        """
+        pass
+
+    def _watch(self):
+        """
+        Mark this subtree as watched once some state derived from it is kept on this node,
+        so changes inside the subtree are propagated to this node.
+        """
+        for node in _iter_bfs(self):
+            node.__watched__ = True
+
+    def _changed(self):
+        """
+        Notify watched ancestors that the subtree has changed.
+        A node which is not watched has no ancestor keeping derived state, so the walk stops there
+        and changes of trees that nobody watches do not cost a walk to the root.
+        """
+        node = self
+        while node is not None and node.__watched__:
+            node._reset()
+            node.__watched__ = False
+            node = node.__parent__
+
+    def iter_bfs(self, cond=None, prune=None, max_depth=None, nested=True):
+        """
+        Lazily walk this subtree in breadth-first order.
+        :param cond:        only yield nodes that meet the condition.
+        :param prune:       do not walk into leaves of nodes that meet this condition.
+        :param max_depth:   do not walk deeper than this depth, this node is at depth 0.
+        :param nested:      walk into leaves of nodes that meet the condition or not?
+        :return:            generator of nodes.
+        """
+        self.examine(cond is None or callable(cond), 'condition must be callable with 1 param.')
+        self.examine(prune is None or callable(prune), 'prune must be callable with 1 param.')
+        return _iter_bfs(self, cond, prune, max_depth, nested)
+
+    def iter_dfs(self, cond=None, prune=None, max_depth=None, nested=True, post_order=False):
+        """
+        Lazily walk this subtree in depth-first order.
+        :param cond:        only yield nodes that meet the condition.
+        :param prune:       do not walk into leaves of nodes that meet this condition.
+        :param max_depth:   do not walk deeper than this depth, this node is at depth 0.
+        :param nested:      walk into leaves of nodes that meet the condition or not?
+        :param post_order:  yield nodes after their leaves or before them?
+        :return:            generator of nodes.
+        """
+        self.examine(cond is None or callable(cond), 'condition must be callable with 1 param.')
+        self.examine(prune is None or callable(prune), 'prune must be callable with 1 param.')
+        return _iter_dfs(self, cond, prune, max_depth, nested, post_order)
+
+    def find_first(self, cond=None, prune=None, max_depth=None, depth_first=False):
+        """
+        Find the first node that meets the condition, the walk stops as soon as it is found.
+        :param cond:        condition expression.
+        :param prune:       do not walk into leaves of nodes that meet this condition.
+        :param max_depth:   do not walk deeper than this depth, this node is at depth 0.
+        :param depth_first: walk in depth-first order instead of breadth-first order.
+        :return:            found node or None.
+        """
+        self.examine(isinstance(cond, LambdaType) or callable(cond), 'condition must be callable with 1 param.')
+        walk = self.iter_dfs if depth_first else self.iter_bfs
+        return next(walk(cond, prune, max_depth), None)
+
+    def search(self, cond=None, executor=None, workers=None):
         """
         Exhausted search for nodes that meet the condition.
-        :param cond: condition expression.
+        Leaves of found nodes are not searched any further.
+        :param cond:        condition expression.
+        :param executor:    thread or process pool to evaluate expensive conditions concurrently on subtrees,
+                            found nodes come in the same order. Conditions for process pools must be picklable.
+        :param workers:     number of workers of executor, default is the number of CPUs.
         """
         self.examine(isinstance(cond, LambdaType) or callable(cond), 'condition must be callable with 1 param.')
-        # Assign variables.
-        founds, lookup = [], [self]
-        # We use dynamic programming algorithm with two list: founds and lookup
-        # to avoid recursive which could cause stack-overflow when the tree is large.
-        while len(lookup) > 0:
-            node = lookup.pop(0)
-            if cond(node):
-                founds.append(node)
-            else:
-                lookup.extend(node.leaves)
-        # Return founded results.
-        return founds
+        if executor is not None:
+            from pyarchitect.datastructs.parallel import search
+            return search(self, cond, executor, workers)
+        return list(_iter_bfs(self, cond, nested=False))
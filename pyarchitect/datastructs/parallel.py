@@ -0,0 +1,209 @@
+# ------------------------------------------------------------------------------
+#  GNU General Public License
+#
+#  Copyright (c) 2020, Hieu Pham.
+#
+#  This file is part of Py-Architect.
+#  <https://github.com/hieupth/pyarchitect>
+#
+#  Py-Architect is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Py-Architect is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import os
+from heapq import heappush, heappop
+from concurrent.futures import ProcessPoolExecutor
+from pyarchitect.datastructs.gentree import _iter_dfs
+
+
+# Slots which hold the tree structure and indexes, they are rebuilt instead of shipped to worker processes.
+STRUCTURE = frozenset(('__nick__', '__parent__', '__leaves__', '__watched__', '__ancestry__', '__paths__',
+                       '__aggregates__', '__weakref__', '__dict__'))
+# Number of chunks per worker, more chunks balance skewed trees better at the cost of more tasks.
+CHUNKS_PER_WORKER = 4
+# Payload slots of each node class.
+_slots = dict()
+
+
+def _payload_slots(cls):
+    """
+    Get payload slots of a node class, which are all slots except the tree structure ones.
+    :param cls: node class.
+    :return:    tuple of slot names.
+    """
+    slots = _slots.get(cls)
+    if slots is None:
+        names = []
+        for klass in reversed(cls.__mro__):
+            items = klass.__dict__.get('__slots__', ())
+            names.extend((items,) if isinstance(items, str) else items)
+        slots = _slots[cls] = tuple(name for name in dict.fromkeys(names) if name not in STRUCTURE)
+    return slots
+
+
+def pack(roots):
+    """
+    Pack subtrees into a compact picklable form, a flat pre-order list of node class, name, payload and
+    number of leaves. Payload is the tuple of payload slot values and the instance dict if there is one.
+    :param roots:   root nodes of subtrees.
+    :return:        list of packed subtrees.
+    """
+    packs = []
+    for root in roots:
+        items = []
+        for node in _iter_dfs(root):
+            cls = type(node)
+            state = tuple(getattr(node, slot, None) for slot in _payload_slots(cls))
+            items.append((cls, node.__nick__, state, getattr(node, '__dict__', None), len(node.__leaves__)))
+        packs.append(items)
+    return packs
+
+
+def unpack(items):
+    """
+    Rebuild a packed subtree.
+    :param items:   packed subtree.
+    :return:        list of nodes in pre-order, root first.
+    """
+    nodes, lookup = [], []
+    for cls, name, state, extra, count in items:
+        node = cls._trusted(name)
+        for slot, value in zip(_payload_slots(cls), state):
+            setattr(node, slot, value)
+        if extra:
+            node.__dict__.update(extra)
+        # Attach to the deepest node which still expects leaves.
+        if len(lookup) > 0:
+            parent = lookup[-1]
+            parent[1] -= 1
+            node.__parent__ = parent[0]
+            parent[0].__leaves__[name] = node
+            if parent[1] == 0:
+                lookup.pop()
+        if count > 0:
+            lookup.append([node, count])
+        nodes.append(node)
+    return nodes
+
+
+def _search(root, cond):
+    """
+    Search a subtree in breadth-first order, leaves of found nodes are not searched any further.
+    :param root:    root node of subtree.
+    :param cond:    condition expression.
+    :return:        list of found nodes, each with its depth and path of leaf positions relative to root.
+    """
+    found, lookup, head = [], [(root, 0, ())], 0
+    while head < len(lookup):
+        node, depth, path = lookup[head]
+        head += 1
+        if cond(node):
+            found.append(((depth, path), node))
+            continue
+        depth += 1
+        lookup.extend((leaf, depth, path + (i,)) for i, leaf in enumerate(node.__leaves__.values()))
+    return found
+
+
+def _search_nodes(roots, cond):
+    """
+    Search subtrees in the same process, it is the task of thread pools.
+    :param roots:   root nodes of subtrees.
+    :param cond:    condition expression.
+    :return:        list of found nodes with their relative keys of each subtree.
+    """
+    return [_search(root, cond) for root in roots]
+
+
+def _search_packs(packs, cond):
+    """
+    Search packed subtrees, it is the task of process pools.
+    :param packs:   packed subtrees.
+    :param cond:    condition expression.
+    :return:        list of pre-order positions of found nodes with their relative keys of each subtree.
+    """
+    results = []
+    for items in packs:
+        nodes = unpack(items)
+        positions = {id(node): i for i, node in enumerate(nodes)}
+        results.append([(key, positions[id(node)]) for key, node in _search(nodes[0], cond)])
+    return results
+
+
+def _split(root, cond, workers):
+    """
+    Split a tree into chunks of subtrees of about the same size. The largest subtree is expanded until none is
+    larger than its share, and the condition is evaluated on expanded nodes on the way.
+    :param root:    root node.
+    :param cond:    condition expression.
+    :param workers: number of workers.
+    :return:        found nodes with their keys, and list of chunks, each is a list of subtree roots with keys.
+    """
+    # Count subtree sizes in post-order.
+    sizes = dict()
+    for node in _iter_dfs(root, post_order=True):
+        sizes[id(node)] = 1 + sum(sizes[id(leaf)] for leaf in node.__leaves__.values())
+    share = max(1, sizes[id(root)] // (workers * CHUNKS_PER_WORKER))
+    found, heap, counter = [], [(-sizes[id(root)], 0, root, (0, ()))], 1
+    while len(heap) > 0 and -heap[0][0] > share:
+        _, _, node, (depth, path) = heappop(heap)
+        if cond(node):
+            found.append(((depth, path), node))
+            continue
+        for i, leaf in enumerate(node.__leaves__.values()):
+            heappush(heap, (-sizes[id(leaf)], counter, leaf, (depth + 1, path + (i,))))
+            counter += 1
+    # Group remaining subtrees into chunks in breadth-first order, so each chunk is about a share.
+    chunks, chunk, total = [], [], 0
+    for size, _, node, key in sorted(heap, key=lambda item: item[3]):
+        chunk.append((node, key))
+        total -= size
+        if total >= share:
+            chunks.append(chunk)
+            chunk, total = [], 0
+    if len(chunk) > 0:
+        chunks.append(chunk)
+    return found, chunks
+
+
+def search(root, cond, executor, workers=None):
+    """
+    Search a tree for nodes that meet the condition on a thread or process pool, the result is the same as
+    the sequential search, in breadth-first order. Process pools get subtrees packed in a compact form,
+    so the condition must be picklable and only sees the shipped subtree.
+    :param root:        root node.
+    :param cond:        condition expression.
+    :param executor:    thread or process pool executor.
+    :param workers:     number of workers of executor the tree is split for, default is the number of CPUs.
+    :return:            list of found nodes.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    workers = workers or os.cpu_count() or 1
+    found, chunks = _split(root, cond, workers)
+    processes = isinstance(executor, ProcessPoolExecutor)
+    futures = []
+    for chunk in chunks:
+        roots = [node for node, _ in chunk]
+        if processes:
+            futures.append(executor.submit(_search_packs, pack(roots), cond))
+        else:
+            futures.append(executor.submit(_search_nodes, roots, cond))
+    for chunk, future in zip(chunks, futures):
+        for (node, (depth, path)), results in zip(chunk, future.result()):
+            nodes = list(_iter_dfs(node)) if processes else None
+            for (offset, suffix), item in results:
+                found.append(((depth + offset, path + suffix), nodes[item] if processes else item))
+    # Breadth-first order is the order of depth, then of leaf positions along the path.
+    found.sort(key=lambda item: item[0])
+    return [node for _, node in found]
@@ -0,0 +1,501 @@
+# ------------------------------------------------------------------------------
+#  GNU General Public License
+#
+#  Copyright (c) 2020, Hieu Pham.
+#
+#  This file is part of Py-Architect.
+#  <https://github.com/hieupth/pyarchitect>
+#
+#  Py-Architect is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Py-Architect is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import os
+import sys
+import json
+import mmap
+import marshal
+import struct
+from array import array
+from pyarchitect.generic import Object, examine
+from pyarchitect.datastructs.gentree import Node, _split_path
+from pyarchitect.kwargparse import KwargParse
+
+
+# --------------------------------------------------------------------------------
+# Binary format of a tree file, all numbers are little-endian:
+#   header:     magic, version, kind, number of nodes, offset of sizes, offset of values table.
+#   records:    one fixed-size record per node in pre-order, streamed while nodes are written.
+#   sizes:      subtree size of each node, so leaves of a node are found without reading its subtree.
+#   values:     table of names and other values referenced by records, other than primitives they are
+#               marshalled so their types are kept, values which cannot be marshalled are rejected.
+# --------------------------------------------------------------------------------
+MAGIC = b'PYTR'
+VERSION = 1
+HEADER = struct.Struct('<4sBBQQQ')
+# Records of node kinds: name id for nodes; name, key and default ids and ignore flag for kwarg parses.
+KINDS = (Node, KwargParse)
+RECORDS = (struct.Struct('<I'), struct.Struct('<IIIB'))
+# Tags of values table.
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _MARSHAL = range(7)
+_U32, _I64, _F64 = struct.Struct('<I'), struct.Struct('<q'), struct.Struct('<d')
+
+
+def _kind(node):
+    """
+    Get kind of node.
+    :param node:    tree node.
+    :return:        index of node kind.
+    """
+    return 1 if isinstance(node, KwargParse) else 0
+
+
+class TreeWriter(Object):
+    """
+    Streaming writer of tree files. Nodes are written one by one in pre-order with begin and end,
+    so a tree can be written while it is produced without building it in memory.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+
+    def __init__(self, fp, kind=Node):
+        """
+        Class constructor.
+        :param fp:      binary file object opened for writing, it must be seekable.
+        :param kind:    class of written nodes, Node or KwargParse.
+        """
+        self.examine(kind in KINDS, 'kind must be one of %s.', KINDS)
+        self._fp = fp
+        self._kind = KINDS.index(kind)
+        self._record = RECORDS[self._kind]
+        # Subtree sizes are patched when nodes end, so only them are kept in memory.
+        self._sizes = array('I')
+        self._stack = []
+        # Packed values table and its lookup.
+        self._values, self._lookup = [], dict()
+        self._start = fp.tell()
+        fp.write(HEADER.pack(MAGIC, VERSION, self._kind, 0, 0, 0))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, kind, *args):
+        # A failed write is not completed, so it is never taken as a whole tree.
+        if kind is None:
+            self.close()
+
+    def value(self, value):
+        """
+        Get id of a value in values table, it is packed at once so unsupported values are rejected
+        before anything of their node is written.
+        :param value:   value to be stored.
+        :return:        value id.
+        """
+        try:
+            key = (type(value), value)
+            found = self._lookup.get(key)
+        except TypeError:
+            # Unhashable values are stored without sharing.
+            key = found = None
+        if found is None:
+            packed = _pack_value(value)
+            found = len(self._values)
+            self._values.append(packed)
+            if key is not None:
+                self._lookup[key] = found
+        return found
+
+    def begin(self, name, key=None, default=None, ignore=False):
+        """
+        Begin a node, it is a leaf of the last begun node which has not ended yet.
+        :param name:    node name.
+        :param key:     name replacement of kwarg parse.
+        :param default: default value of kwarg parse.
+        :param ignore:  ignore flag of kwarg parse.
+        """
+        if self._kind == 0:
+            self._fp.write(self._record.pack(self.value(name)))
+        else:
+            self._fp.write(self._record.pack(self.value(name), self.value(key), self.value(default), bool(ignore)))
+        self._stack.append(len(self._sizes))
+        self._sizes.append(0)
+
+    def end(self):
+        """
+        End the last begun node.
+        """
+        self.examine(len(self._stack) > 0, 'there is no node to end.')
+        index = self._stack.pop()
+        self._sizes[index] = len(self._sizes) - index
+
+    def write(self, node):
+        """
+        Write a whole subtree.
+        :param node:    root of subtree.
+        """
+        self.examine(_kind(node) == self._kind, 'node must be a %s.', KINDS[self._kind])
+        lookup = [node]
+        # None marks the end of a node.
+        while len(lookup) > 0:
+            node = lookup.pop()
+            if node is None:
+                self.end()
+                continue
+            if self._kind == 0:
+                self.begin(node.name)
+            else:
+                self.begin(node.name, node.key, node.default, node.ignore)
+            lookup.append(None)
+            lookup.extend(reversed(node.leaves))
+
+    def close(self):
+        """
+        Write sizes and values table, then complete header.
+        """
+        self.examine(len(self._stack) == 0, 'all nodes must be ended before closing.')
+        fp = self._fp
+        sizes_offset = fp.tell() - self._start
+        sizes = array('I', self._sizes)
+        if sys.byteorder != 'little':
+            sizes.byteswap()
+        fp.write(sizes.tobytes())
+        table_offset = fp.tell() - self._start
+        fp.write(_U32.pack(len(self._values)))
+        fp.writelines(self._values)
+        # Complete header.
+        end = fp.tell()
+        fp.seek(self._start)
+        fp.write(HEADER.pack(MAGIC, VERSION, self._kind, len(self._sizes), sizes_offset, table_offset))
+        fp.seek(end)
+
+
+def _pack_value(value):
+    """
+    Pack a value of values table.
+    :param value:   value to be packed.
+    :return:        packed bytes.
+    """
+    if value is None:
+        return bytes((_NONE,))
+    if value is False or value is True:
+        return bytes((_TRUE if value else _FALSE,))
+    if type(value) is int and -2 ** 63 <= value < 2 ** 63:
+        return bytes((_INT,)) + _I64.pack(value)
+    if type(value) is float:
+        return bytes((_FLOAT,)) + _F64.pack(value)
+    if type(value) is str:
+        tag, data = _STR, value.encode('utf-8')
+    else:
+        try:
+            tag, data = _MARSHAL, marshal.dumps(value, 4)
+        except ValueError:
+            examine(False, 'value %r cannot be stored in a tree file.', value)
+    return bytes((tag,)) + _U32.pack(len(data)) + data
+
+
+def _unpack_values(buffer, offset):
+    """
+    Unpack values table.
+    :param buffer:  buffer of tree file.
+    :param offset:  offset of values table.
+    :return:        list of values.
+    """
+    values = []
+    count, = _U32.unpack_from(buffer, offset)
+    offset += _U32.size
+    for _ in range(count):
+        tag = buffer[offset]
+        offset += 1
+        if tag <= _TRUE:
+            values.append((None, False, True)[tag])
+        elif tag == _INT:
+            values.append(_I64.unpack_from(buffer, offset)[0])
+            offset += _I64.size
+        elif tag == _FLOAT:
+            values.append(_F64.unpack_from(buffer, offset)[0])
+            offset += _F64.size
+        else:
+            size, = _U32.unpack_from(buffer, offset)
+            offset += _U32.size
+            data = bytes(buffer[offset:offset + size])
+            values.append(data.decode('utf-8') if tag == _STR else marshal.loads(data))
+            offset += size
+    return values
+
+
+class StoredNode:
+    """
+    Lazy view of a node stored in a tree file, nothing is read until it is asked for.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    __slots__ = ('file', 'index')
+
+    @property
+    def name(self):
+        """Get node name."""
+        return self.file.name(self.index)
+
+    @property
+    def leaves(self):
+        """Get all leaf nodes."""
+        return [StoredNode(self.file, index) for index in self.file.leaves(self.index)]
+
+    @property
+    def is_top(self):
+        """Check this node is top lead or not?"""
+        return self.file.sizes[self.index] == 1
+
+    def __init__(self, file, index):
+        """
+        Class constructor.
+        :param file:    tree file.
+        :param index:   pre-order index of node.
+        """
+        self.file = file
+        self.index = index
+
+    def __repr__(self):
+        return '<%s %r at %d>' % (self.__class__.__name__, self.name, self.index)
+
+    def leaf(self, name):
+        """
+        Get leaf node by name.
+        :param name:    leaf name.
+        :return:        leaf node or None.
+        """
+        for index in self.file.leaves(self.index):
+            if self.file.name(index) == name:
+                return StoredNode(self.file, index)
+        return None
+
+    def get_path(self, path, default=None):
+        """
+        Get node by path, only nodes along the path are read.
+        :param path:    string of names separated by '/', or sequence of names.
+        :param default: value returned when there is no such node.
+        :return:        found node or default.
+        """
+        node = self
+        for name in _split_path(path):
+            node = node.leaf(name)
+            if node is None:
+                return default
+        return node
+
+    def load(self):
+        """
+        Load this subtree into tree nodes.
+        :return:    root of loaded subtree.
+        """
+        return self.file.load(self.index)
+
+
+class TreeFile(Object):
+    """
+    Tree file loaded by memory mapping, subtrees are loaded lazily and the mapped pages are shared
+    between all processes which open the same file.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+
+    @property
+    def root(self):
+        """Get lazy view of root node."""
+        return StoredNode(self, 0)
+
+    def __init__(self, path):
+        """
+        Class constructor.
+        :param path:    path of tree file.
+        """
+        with open(path, 'rb') as fp:
+            self._map = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(self._map)
+        magic, version, kind, count, sizes_offset, table_offset = HEADER.unpack_from(buffer, 0)
+        self.examine(magic == MAGIC and version == VERSION, 'unsupported tree file.')
+        self.examine(table_offset > 0, 'tree file was not completely written.')
+        self.kind = KINDS[kind]
+        self._record = RECORDS[kind]
+        self._count = count
+        # Subtree sizes are read in place.
+        sizes = buffer[sizes_offset:sizes_offset + 4 * count]
+        if sys.byteorder == 'little':
+            self.sizes = sizes.cast('I')
+        else:
+            self.sizes = array('I', sizes)
+            self.sizes.byteswap()
+        self._values = _unpack_values(buffer, table_offset)
+        self._buffer = buffer
+
+    def __len__(self):
+        return self._count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """
+        Release the memory mapping, views and loaded nodes no longer read from it.
+        """
+        if isinstance(self.sizes, memoryview):
+            self.sizes.release()
+        self._buffer.release()
+        self._map.close()
+
+    def record(self, index):
+        """
+        Get record of a node.
+        :param index:   pre-order index of node.
+        :return:        tuple of value ids, and ignore flag of kwarg parses.
+        """
+        return self._record.unpack_from(self._buffer, HEADER.size + index * self._record.size)
+
+    def name(self, index):
+        """
+        Get name of a node.
+        :param index:   pre-order index of node.
+        """
+        return self._values[self.record(index)[0]]
+
+    def leaves(self, index):
+        """
+        Iterate over indexes of leaf nodes, subtrees in between are skipped by their sizes.
+        :param index:   pre-order index of node.
+        :return:        generator of leaf indexes.
+        """
+        end, index = index + self.sizes[index], index + 1
+        while index < end:
+            yield index
+            index += self.sizes[index]
+
+    def node(self, index, record=None):
+        """
+        Create a tree node from its record, without validation since the file was written from valid nodes.
+        :param index:   pre-order index of node.
+        :param record:  record of node if it is already read.
+        :return:        tree node.
+        """
+        record, values = record if record else self.record(index), self._values
+        if self.kind is Node:
+            return Node._trusted(values[record[0]])
+        return KwargParse._trusted(values[record[0]], values[record[1]], values[record[2]], bool(record[3]))
+
+    def load(self, index=0):
+        """
+        Load a subtree into tree nodes.
+        :param index:   pre-order index of subtree root.
+        :return:        root of loaded subtree.
+        """
+        end, size = index + self.sizes[index], self._record.size
+        records = self._record.iter_unpack(self._buffer[HEADER.size + index * size:HEADER.size + end * size])
+        root = self.node(index, next(records))
+        # Each item of stack is a node and the index where its subtree ends.
+        stack = [(root, end)]
+        for item, record in enumerate(records, index + 1):
+            while stack[-1][1] <= item:
+                stack.pop()
+            node, parent = self.node(item, record), stack[-1][0]
+            node.__parent__ = parent
+            parent.__leaves__[node.__nick__] = node
+            stack.append((node, item + self.sizes[item]))
+        return root
+
+
+def dump(node, path):
+    """
+    Write a tree into a tree file. It is written aside and then moved in place, so a failed write
+    never leaves a broken file at the path.
+    :param node:    root node of tree.
+    :param path:    path of tree file.
+    """
+    temp = '%s.%d.tmp' % (path, os.getpid())
+    try:
+        with open(temp, 'wb') as fp:
+            with TreeWriter(fp, KINDS[_kind(node)]) as writer:
+                writer.write(node)
+        os.replace(temp, path)
+    except BaseException:
+        if os.path.exists(temp):
+            os.remove(temp)
+        raise
+
+
+def load(path):
+    """
+    Load a whole tree from a tree file.
+    :param path:    path of tree file.
+    :return:        root node of tree.
+    """
+    with TreeFile(path) as file:
+        return file.load()
+
+
+def iter_json(node):
+    """
+    Lazily encode a tree into JSON lines, without recursion. The first line tells the node kind,
+    then each line is a node in pre-order given as [depth, name] or [depth, name, key, default, ignore].
+    :param node:    root node of tree.
+    :return:        generator of JSON lines.
+    """
+    kind = _kind(node)
+    yield json.dumps(dict(kind=KINDS[kind].__name__)) + '\n'
+    lookup = [(node, 0)]
+    while len(lookup) > 0:
+        node, depth = lookup.pop()
+        item = [depth, node.name] if kind == 0 else [depth, node.name, node.key, node.default, node.ignore]
+        yield json.dumps(item) + '\n'
+        lookup.extend((leaf, depth + 1) for leaf in reversed(node.leaves))
+
+
+def dump_json(node, fp):
+    """
+    Write a tree into a text file as JSON lines.
+    :param node:    root node of tree.
+    :param fp:      text file object opened for writing.
+    """
+    fp.writelines(iter_json(node))
+
+
+def load_json(lines):
+    """
+    Decode a tree from JSON lines, without recursion.
+    :param lines:   iterable of JSON lines, such as a text file object.
+    :return:        root node of tree.
+    """
+    lines = iter(lines)
+    header = json.loads(next(lines))
+    kinds = {kind.__name__: kind for kind in KINDS}
+    examine(isinstance(header, dict) and header.get('kind') in kinds, 'unsupported tree lines.')
+    kind, root, stack = kinds[header['kind']], None, []
+    for line in lines:
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        depth = item[0]
+        examine(0 < depth <= len(stack) if root is not None else depth == 0, 'broken tree lines.')
+        node = kind._trusted(*item[1:])
+        # The parent is the last node of previous depth.
+        del stack[depth:]
+        if len(stack) > 0:
+            node.__parent__ = stack[-1]
+            stack[-1].__leaves__[node.__nick__] = node
+        else:
+            root = node
+        stack.append(node)
+    return root
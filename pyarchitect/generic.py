@@ -19,22 +19,129 @@
 #  You should have received a copy of the GNU General Public License
 #  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
 # ------------------------------------------------------------------------------
-import logging as log
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
 
 
-def examine(expression=True, message=None):
+class ValidationError(AssertionError):
     """
-    Raise an assert error with a message if expression is false.
+    Raised when a check of examine fails.
     ---------
     @author:    Hieu Pham.
-    @created:   16th August, 2020.
+    @created:   18th October, 2026.
+    """
+    pass
+
+
+# Trusted mode of the current context, each thread and asyncio task has its own. It starts enabled when
+# environment variable PYARCHITECT_TRUSTED is set to 1, and hot paths read it directly.
+TRUSTED = ContextVar('pyarchitect_trusted', default=os.environ.get('PYARCHITECT_TRUSTED', '0').lower()
+                     in ('1', 'true', 'yes'))
+
+
+class Validation:
     """
+    Switches of validation.
+    In trusted mode, checks guarded by the trusted flag in hot paths, such as attaching and renaming nodes,
+    are skipped without evaluating their conditions. It is enabled by setting environment variable
+    PYARCHITECT_TRUSTED to 1, or temporarily by the trusted context manager, and it is kept per context
+    so enabling it in one thread or task does not affect the others.
+    With counting enabled, each check is counted by its message, so the number of checks tells where
+    validation costs time.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    __slots__ = ('counting', 'counts')
+
+    @property
+    def trusted(self):
+        """Check trusted mode of the current context is enabled or not?"""
+        return TRUSTED.get()
+
+    @trusted.setter
+    def trusted(self, enabled):
+        """
+        Enable or disable trusted mode of the current context.
+        :param enabled: trust or validate.
+        """
+        TRUSTED.set(enabled)
+
+    def __init__(self):
+        """
+        Class constructor.
+        """
+        self.counting = False
+        # Number of checks by message.
+        self.counts = dict()
+
+
+# Validation switches of this process.
+validation = Validation()
+
+
+@contextmanager
+def trusted(enabled=True):
+    """
+    Skip checks of hot paths inside the with block, only in the current thread or asyncio task.
+    :param enabled: trust or validate inside the block.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    @modified:  18th October, 2026.
+    """
+    token = TRUSTED.set(enabled)
     try:
-        message = message if message else 'something wrong.'
-        assert expression, message
-    except AssertionError:
-        log.error(message, exc_info=True)
-        exit(1)
+        yield validation
+    finally:
+        TRUSTED.reset(token)
+
+
+@contextmanager
+def counting():
+    """
+    Count checks inside the with block.
+    :return:    dict of message and number of checks, it is filled while the block runs.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    previous, counts = validation.counting, validation.counts
+    validation.counting, validation.counts = True, dict()
+    try:
+        yield validation.counts
+    finally:
+        validation.counting, validation.counts = previous, counts
+
+
+def _format(message, args):
+    """
+    Format a failure message.
+    :param message: message string, format string of args or callable returning the message.
+    :param args:    format args.
+    :return:        message string.
+    """
+    if callable(message):
+        message = message()
+    elif len(args) > 0:
+        message = message % args
+    return message if message else 'something wrong.'
+
+
+def examine(expression=True, message=None, *args):
+    """
+    Raise a validation error with a message if expression is false.
+    The message is only formatted on failure, it can be a format string of args or a callable.
+    ---------
+    @author:    Hieu Pham.
+    @created:   16th August, 2020.
+    @modified:  18th October, 2026.
+    """
+    if validation.counting:
+        validation.counts[message] = validation.counts.get(message, 0) + 1
+    if not expression:
+        raise ValidationError(_format(message, args))
 
 
 class Object:
@@ -43,7 +150,19 @@ class Object:
     ---------
     @author:    Hieu Pham.
     @created:   16th August, 2020.
+    @modified:  18th October, 2026.
     """
+    # No instance dictionary, so subclasses are free to use slots.
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Register subclasses which list instrumented methods in __instrumented__ to pyarchitect.metrics.
+        """
+        super().__init_subclass__(**kwargs)
+        if '__instrumented__' in cls.__dict__:
+            from pyarchitect import metrics
+            metrics.register(cls)
 
     def message(self, message=None):
         """
@@ -53,10 +172,14 @@ class Object:
         message = message if message else 'silent is gold.'
         return '%s %s' % (self, message)
 
-    def examine(self, expression=True, message=None):
+    def examine(self, expression=True, message=None, *args):
         """
-        Raise an assert error with a message if expression is false.
+        Raise a validation error with a message if expression is false, the message is only formatted on failure.
         :param expression:  boolean expression.
-        :param message:     message string.
+        :param message:     message string, format string of args or callable returning the message.
+        :param args:        format args.
         """
-        examine(expression, self.message(message if message else 'something wrong.'))
\ No newline at end of file
+        if validation.counting:
+            validation.counts[message] = validation.counts.get(message, 0) + 1
+        if not expression:
+            raise ValidationError(self.message(_format(message, args)))
\ No newline at end of file
@@ -19,17 +19,438 @@
 #  You should have received a copy of the GNU General Public License
 #  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
 # ------------------------------------------------------------------------------
+import os
+import marshal
+from threading import Lock
+from types import MappingProxyType
+from collections import deque, OrderedDict, namedtuple
+from itertools import islice
+from numbers import Number
+from pyarchitect.generic import examine
 from pyarchitect.datastructs.gentree import Node
 
 
+# Steps of a parse plan.
+_LEAF, _ENTER, _EXIT = 0, 1, 2
+# Marks the start of each level of keyword arguments in fingerprints.
+_LEVEL = object()
+# Immutable types whose values are serialized by marshal in a form telling their types apart.
+_FROZEN = frozenset((type(None), bool, int, float, complex, str))
+# Statistics of parse cache.
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'uncached', 'maxsize', 'currsize'])
+
+
+class ParsePlan:
+    """
+    Flat, precomputed form of a kwarg parse tree.
+    Each step of the plan is a tuple (op, name, key, default) in pre-order where ignored levels are already
+    folded into their parents, so parsing is a single loop over the steps instead of a tree walk.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+
+    def __init__(self, parse):
+        """
+        Class constructor.
+        :param parse:   root kwarg parse to be compiled.
+        """
+        steps, lookup = [], [parse]
+        # We use a stack instead of recursion to avoid stack-overflow when the tree is large.
+        while len(lookup) > 0:
+            node = lookup.pop()
+            if node is None:
+                steps.append((_EXIT, None, None, None))
+                continue
+            key = node.key if node.key else node.name
+            leaves = node.leaves
+            if node.ignore:
+                lookup.extend(reversed(leaves))
+            elif len(leaves) == 0:
+                steps.append((_LEAF, node.name, key, node.default))
+            else:
+                steps.append((_ENTER, node.name, key, None))
+                lookup.append(None)
+                lookup.extend(reversed(leaves))
+        # Plan steps.
+        self.steps = tuple(steps)
+        # Names read at each level of keyword arguments, each level is a set of names whose values are read
+        # as a whole and a dict of names and their nested levels.
+        self.reads = (set(), dict())
+        levels, lookup = [self.reads], [self.reads]
+        for op, name, _, _ in steps:
+            if op == _LEAF:
+                lookup[-1][0].add(name)
+            elif op == _ENTER:
+                level = lookup[-1][1].setdefault(name, (set(), dict()))
+                levels.append(level)
+                lookup.append(level)
+            else:
+                lookup.pop()
+        # A name read both as a value and as a nested level is read as a whole.
+        for leaves, nested in levels:
+            for name in leaves.intersection(nested):
+                del nested[name]
+
+    def __call__(self, **kwargs):
+        """
+        Parse arguments from keyword arguments.
+        :param kwargs:  keyword arguments to be parsed.
+        """
+        return self.run(kwargs)
+
+    def run(self, kwargs):
+        """
+        Parse arguments from a dictionary of keyword arguments.
+        :param kwargs:  dictionary of keyword arguments.
+        :return:        parsed arguments.
+        """
+        args, stack = dict(), []
+        for op, name, key, default in self.steps:
+            if op == _LEAF:
+                args[key] = kwargs.get(name, default)
+            elif op == _ENTER:
+                stack.append((kwargs, args))
+                kwargs = kwargs.get(name, {})
+                # Nested keyword arguments are unpacked just like the tree walk does.
+                if type(kwargs) is not dict:
+                    kwargs = dict(**kwargs)
+                args[key] = dict()
+                args = args[key]
+            else:
+                kwargs, args = stack.pop()
+        # Return parsed arguments.
+        return args
+
+    def fingerprint(self, kwargs):
+        """
+        Fingerprint the given keyword arguments this plan reads, other keyword arguments do not change the result.
+        It costs a step per given argument instead of a step per parse. Values of different types are told apart,
+        such as 1 and True, and the same arguments given in another order get another fingerprint.
+        :param kwargs:  dictionary of keyword arguments.
+        :return:        tuple of read names, values and their types, it is unhashable if some value is.
+        """
+        values, lookup = [], [(self.reads, kwargs)]
+        while len(lookup) > 0:
+            (leaves, nested), kwargs = lookup.pop()
+            values.append(_LEVEL)
+            # Levels of values only, which are all read, are taken as a whole.
+            if len(nested) == 0 and leaves.issuperset(kwargs):
+                values.extend(kwargs.items())
+                values.extend(map(type, kwargs.values()))
+                continue
+            for name, value in kwargs.items():
+                if name in nested:
+                    values.append(name)
+                    # Nested keyword arguments are unpacked just like parsing does.
+                    lookup.append((nested[name], value if type(value) is dict else dict(**value)))
+                elif name in leaves:
+                    values.append((name, value))
+                    values.append(type(value))
+        return tuple(values)
+
+    def frozen(self, kwargs):
+        """
+        Check all given keyword arguments this plan reads are immutable values of builtin types, such as numbers,
+        strings and tuples of them. Such values have the same marshal serialization only if they are equal
+        and of the same types.
+        :param kwargs:  dictionary of keyword arguments.
+        """
+        lookup = [(self.reads, kwargs)]
+        while len(lookup) > 0:
+            (leaves, nested), kwargs = lookup.pop()
+            for name, value in kwargs.items():
+                if name in nested:
+                    lookup.append((nested[name], value if type(value) is dict else dict(**value)))
+                elif name in leaves and not _frozen(value):
+                    return False
+        return True
+
+    def run_columns(self, columns, size):
+        """
+        Parse arguments of many records given as columns.
+        :param columns: dictionary of keyword name and list of values, one per record.
+        :param size:    number of records.
+        :return:        parsed arguments where each parsed value is a list of values, one per record.
+        """
+        args, stack, rows = dict(), [], None
+        for op, name, key, default in self.steps:
+            if op == _EXIT:
+                rows, args = stack.pop()
+                continue
+            # Gather values of all records, top level arguments are still given by columns.
+            fallback = default if op == _LEAF else {}
+            if rows is None:
+                values = list(columns[name]) if name in columns else [fallback] * size
+            else:
+                values = [row.get(name, fallback) for row in rows]
+            if op == _LEAF:
+                args[key] = values
+            else:
+                stack.append((rows, args))
+                # Nested keyword arguments are unpacked just like the tree walk does.
+                rows = [value if type(value) is dict else dict(**value) for value in values]
+                args[key] = dict()
+                args = args[key]
+        # Return parsed arguments.
+        return args
+
+
+def _parse_chunk(plan, records):
+    """
+    Parse a chunk of records, it is shipped to executor workers.
+    :param plan:    compiled parse plan.
+    :param records: list of keyword arguments dictionaries.
+    :return:        list of parsed arguments.
+    """
+    run = plan.run
+    return [run(record if type(record) is dict else dict(**record)) for record in records]
+
+
+def _parse_columns(plan, columns, size):
+    """
+    Parse a chunk of columns, it is shipped to executor workers.
+    :param plan:    compiled parse plan.
+    :param columns: dictionary of keyword name and list of values.
+    :param size:    number of records.
+    :return:        parsed columns.
+    """
+    return plan.run_columns(columns, size)
+
+
+def _concat_columns(parts):
+    """
+    Concatenate parsed columns of consecutive chunks, all of them share the same structure.
+    :param parts:   list of parsed columns.
+    :return:        concatenated parsed columns.
+    """
+    result = dict()
+    lookup = deque((result, part) for part in parts)
+    # We use a queue instead of recursion to avoid stack-overflow when the structure is deep,
+    # first-in first-out keeps chunks concatenated in order.
+    while len(lookup) > 0:
+        target, source = lookup.popleft()
+        for key, value in source.items():
+            if isinstance(value, list):
+                target.setdefault(key, []).extend(value)
+            else:
+                lookup.append((target.setdefault(key, dict()), value))
+    return result
+
+
+def _frozen(value):
+    """
+    Check a value is immutable and made of builtin types only.
+    :param value:   value to be checked.
+    """
+    lookup = [value]
+    while len(lookup) > 0:
+        item = lookup.pop()
+        kind = type(item)
+        if kind is tuple or kind is frozenset:
+            lookup.extend(item)
+        elif kind not in _FROZEN:
+            return False
+    return True
+
+
+def _copy(value):
+    """
+    Copy parsed arguments with all of their nested dicts.
+    :param value:   parsed arguments.
+    :return:        copied parsed arguments.
+    """
+    result = dict(value)
+    lookup = [result]
+    while len(lookup) > 0:
+        item = lookup.pop()
+        for k, v in item.items():
+            if isinstance(v, dict):
+                item[k] = v = dict(v)
+                lookup.append(v)
+    return result
+
+
+def _readonly(value):
+    """
+    Copy parsed arguments with all of their nested dicts into read-only mapping proxies.
+    :param value:   parsed arguments.
+    :return:        read-only parsed arguments.
+    """
+    result, order = _copy(value), []
+    lookup = [result]
+    while len(lookup) > 0:
+        item = lookup.pop()
+        order.append(item)
+        lookup.extend(v for v in item.values() if isinstance(v, dict))
+    # Nested dicts are wrapped before the dicts holding them.
+    proxies = dict()
+    for item in reversed(order):
+        for k, v in item.items():
+            if isinstance(v, dict):
+                item[k] = proxies[id(v)]
+        proxies[id(item)] = MappingProxyType(item)
+    return proxies[id(result)]
+
+
+class ParseCache:
+    """
+    Bounded LRU cache of parsed arguments. Keyword arguments of builtin types are keyed by their marshal
+    serialization, which is made in C and costs much less than parsing them. Others are keyed by the fingerprint
+    of the arguments read by the compiled plan. Results are only cached when all read values are immutable
+    builtins, since values such as Decimal('1.0') and Decimal('1.00') are equal but parsed apart, others are
+    parsed without the cache. Cached results are never handed out to be changed, they are read-only proxies or copies.
+    Clearing the cache starts a new generation, so results of parses which started before are not cached.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    __slots__ = ('maxsize', 'readonly', 'entries', 'generation', 'hits', 'misses', 'uncached', 'lock')
+
+    def __init__(self, maxsize=256, readonly=True):
+        """
+        Class constructor.
+        :param maxsize:     maximum number of cached results.
+        :param readonly:    return read-only mapping proxies or copies of cached results?
+        """
+        examine(isinstance(maxsize, int) and maxsize > 0, 'cache size must be a positive integer.')
+        self.maxsize = maxsize
+        self.readonly = readonly
+        # Fingerprints and results by hash of fingerprint, least recently used first.
+        self.entries = OrderedDict()
+        # Number of times the cache was cleared.
+        self.generation = 0
+        self.hits = self.misses = self.uncached = 0
+        self.lock = Lock()
+
+    def __reduce__(self):
+        # Caches are shipped to other processes empty.
+        return ParseCache, (self.maxsize, self.readonly)
+
+    def parse(self, node, kwargs):
+        """
+        Parse keyword arguments through the cache.
+        :param node:    kwarg parse.
+        :param kwargs:  keyword arguments to be parsed.
+        :return:        parsed arguments.
+        """
+        plan = node.compile()
+        try:
+            key = marshal.dumps(kwargs, 2)
+        except ValueError:
+            key = plan.fingerprint(kwargs)
+        # Key is hashed once, entries are looked up by its hash and confirmed by comparing keys.
+        try:
+            code = hash(key)
+        except TypeError:
+            code = None
+        entry = None
+        if code is not None:
+            with self.lock:
+                entry = self.entries.get(code)
+                if entry is not None and entry[0] == key:
+                    self.entries.move_to_end(code)
+                    if entry[1] is not None:
+                        self.hits += 1
+                        return entry[1] if self.readonly else _copy(entry[1])
+                else:
+                    entry, generation = None, self.generation
+        result = plan.run(kwargs)
+        if self.readonly:
+            result = _readonly(result)
+        # Equal keys only tell read values are the same when they are immutable builtins, keys of other
+        # arguments are kept without a result, so they are parsed without the cache next time.
+        cached = code is not None and entry is None and plan.frozen(kwargs)
+        with self.lock:
+            if cached:
+                self.misses += 1
+            else:
+                self.uncached += 1
+            # The tree may have changed while parsing, then the result is stale.
+            if code is not None and entry is None and generation == self.generation:
+                self.entries[code] = (key, result if cached else None)
+                self.entries.move_to_end(code)
+                while len(self.entries) > self.maxsize:
+                    self.entries.popitem(last=False)
+        return _copy(result) if cached and not self.readonly else result
+
+    def clear(self):
+        """
+        Drop all cached results and start a new generation, statistics are kept.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.generation += 1
+
+    def info(self):
+        """
+        Get statistics of cache.
+        :return:    hits, misses, uncached parses, maxsize and current size, which counts kept keys of arguments
+                    parsed without the cache.
+        """
+        with self.lock:
+            return CacheInfo(self.hits, self.misses, self.uncached, self.maxsize, len(self.entries))
+
+
 class KwargParse(Node):
     """
     Parse arguments from keyword arguments.
     ---------
     @author:    Hieu Pham.
     @created:   16th August, 2020.
-    @modified:  18th August, 2020.
+    @modified:  18th October, 2026.
     """
+    __slots__ = ('_key', '_default', '_ignore', '_plan', '_cache')
+    # Methods measured by pyarchitect.metrics when it is enabled.
+    __instrumented__ = ('attach', 'parse', 'compile', 'parse_columns', 'from_dict', 'to_dict')
+    # Fields of a parse in its dict form, other fields are leaves.
+    FIELDS = frozenset(('name', 'key', 'default', 'ignore'))
+
+    @property
+    def key(self):
+        """Get name replacement when parsed."""
+        return self._key
+
+    @key.setter
+    def key(self, key):
+        """
+        Set name replacement when parsed.
+        :param key: name replacement.
+        """
+        self.examine(not key or isinstance(key, (str, bool, Number)), 'key must be a string, boolean or number.')
+        self._key = key
+        if self.__watched__:
+            self._changed()
+
+    @property
+    def default(self):
+        """Get default value when parsed."""
+        return self._default
+
+    @default.setter
+    def default(self, default):
+        """
+        Set default value when parsed.
+        :param default: default value.
+        """
+        self._default = default
+        if self.__watched__:
+            self._changed()
+
+    @property
+    def ignore(self):
+        """Get ignore parse or not?"""
+        return self._ignore
+
+    @ignore.setter
+    def ignore(self, ignore):
+        """
+        Set ignore parse or not?
+        :param ignore:  ignore parse or not?
+        """
+        self._ignore = ignore
+        if self.__watched__:
+            self._changed()
 
     def __init__(self, name=None, key=None, default=None, ignore=False):
         """
@@ -39,11 +460,80 @@ class KwargParse(Node):
         :param default: default value when parsed.
         :param ignore:  ignore parse or not?
         """
-        self.key = key
-        self.ignore = ignore
-        self.default = default
+        self.examine(not key or isinstance(key, (str, bool, Number)), 'key must be a string, boolean or number.')
+        self._key = key
+        self._ignore = ignore
+        self._default = default
+        # Compiled plan of this parse.
+        self._plan = None
+        # Cache of parsed arguments.
+        self._cache = None
         super(KwargParse, self).__init__(name)
 
+    @classmethod
+    def _trusted(cls, name, key=None, default=None, ignore=False):
+        """
+        Create a parse without validation, it is used by bulk builders.
+        :param name:    name of parse.
+        :param key:     name replacement when parsed.
+        :param default: default value when parsed.
+        :param ignore:  ignore parse or not?
+        :return:        created parse.
+        """
+        node = super(KwargParse, cls)._trusted(name)
+        node._key = key
+        node._ignore = ignore
+        node._default = default
+        node._plan = None
+        node._cache = None
+        return node
+
+    @classmethod
+    def from_dict(cls, data, name=None):
+        """
+        Build a whole parse tree in one pass from its dict form, the inverse of to_dict.
+        :param data:    dict of parse fields where every other field is a leaf in dict form.
+        :param name:    root name, used when data has no name field.
+        :return:        root parse.
+        """
+        # Validate all input once, with the same checks as attach.
+        lookup = [(data, name)]
+        while len(lookup) > 0:
+            item, nick = lookup.pop()
+            if not isinstance(item, dict):
+                examine(False, 'parse must be given as dict.')
+            nick, key = item.get('name', nick), item.get('key')
+            if nick and not isinstance(nick, (str, bool, Number)):
+                examine(False, 'node name must be a string, boolean or number.')
+            if key and not isinstance(key, (str, bool, Number)):
+                examine(False, 'key must be a string, boolean or number.')
+            names = set()
+            for field, value in item.items():
+                if field not in cls.FIELDS:
+                    leaf = value.get('name', field) if isinstance(value, dict) else field
+                    leaf = leaf if leaf else 'none'
+                    if not isinstance(leaf, (str, bool, Number)):
+                        examine(False, 'node name must be a string, boolean or number.')
+                    if leaf in names:
+                        examine(False, 'leaf name already exists.')
+                    names.add(leaf)
+                    lookup.append((value, field))
+        # Then build the tree without validation.
+        fields, trusted = cls.FIELDS, cls._trusted
+        root = trusted(data.get('name', name), data.get('key'), data.get('default'), data.get('ignore', False))
+        lookup = [(root, data)]
+        while len(lookup) > 0:
+            node, item = lookup.pop()
+            leaves = node.__leaves__
+            for key, value in item.items():
+                if key not in fields:
+                    leaf = trusted(value.get('name', key), value.get('key'), value.get('default'),
+                                   value.get('ignore', False))
+                    leaf.__parent__ = node
+                    leaves[leaf.__nick__] = leaf
+                    lookup.append((leaf, value))
+        return root
+
     def attach(self, name=None, key=None, default=None, ignore=False):
         """
         Attach a kwarg parse.
@@ -59,6 +549,21 @@ class KwargParse(Node):
         Parse arguments from keyword arguments.
         :param kwargs:  keyword arguments to be parsed.
         """
+        # Use cache if there is one, the subtree is watched again after a change so later changes drop the cache.
+        if self._cache is not None:
+            if not self.__watched__:
+                self._watch()
+            return self._cache.parse(self, kwargs)
+        return self._parse(kwargs)
+
+    def _parse(self, kwargs):
+        """
+        Parse arguments from keyword arguments without cache.
+        :param kwargs:  keyword arguments to be parsed.
+        """
+        # Use compiled plan if there is one.
+        if self._plan is not None:
+            return self._plan.run(kwargs)
         args = dict()
         # Assign keyword.
         key = self.key if self.key else self.name
@@ -74,6 +579,102 @@ class KwargParse(Node):
         # Return parsed arguments.
         return args
 
+    def compile(self):
+        """
+        Compile this parse into a flat plan, then it is used by parse until the tree changes.
+        :return:    compiled parse plan.
+        """
+        if self._plan is None:
+            self._plan = ParsePlan(self)
+            self._watch()
+        return self._plan
+
+    def cache(self, maxsize=256, readonly=True):
+        """
+        Cache results of this parse, so keyword arguments of the same structure and values are parsed once.
+        Cached results are dropped when the tree changes.
+        :param maxsize:     maximum number of cached results, least recently used ones are dropped first.
+        :param readonly:    return read-only mapping proxies, or copies which can be changed freely?
+        :return:            parse cache.
+        """
+        self._cache = ParseCache(maxsize, readonly)
+        self._watch()
+        return self._cache
+
+    def uncache(self):
+        """
+        Stop caching results of this parse.
+        """
+        self._cache = None
+
+    def cache_info(self):
+        """
+        Get statistics of parse cache.
+        :return:    hits, misses, uncached parses, maxsize and current size, or None if it is not cached.
+        """
+        return None if self._cache is None else self._cache.info()
+
+    def _reset(self):
+        """
+        Drop compiled plan and cached results since the tree has changed.
+        """
+        self._plan = None
+        if self._cache is not None:
+            self._cache.clear()
+
+    def parse_many(self, records, executor=None, chunksize=1024, prefetch=None):
+        """
+        Lazily parse arguments of many records, results are identical to calling parse on each record.
+        :param records:     iterable of keyword arguments dictionaries.
+        :param executor:    optional concurrent.futures executor to parse chunks of records in parallel.
+        :param chunksize:   number of records per chunk shipped to the executor.
+        :param prefetch:    maximum number of chunks in flight, defaults to twice the number of cpus.
+        :return:            generator of parsed arguments.
+        """
+        plan = self.compile()
+        # Parse records one by one.
+        if executor is None:
+            run = plan.run
+            for record in records:
+                yield run(record if type(record) is dict else dict(**record))
+            return
+        # Parse chunks of records concurrently while keeping a bounded number of chunks in memory.
+        self.examine(isinstance(chunksize, int) and chunksize > 0, 'chunk size must be a positive integer.')
+        prefetch = prefetch if prefetch else 2 * (os.cpu_count() or 1)
+        records, pending = iter(records), deque()
+        while True:
+            while len(pending) < prefetch:
+                chunk = list(islice(records, chunksize))
+                if len(chunk) == 0:
+                    break
+                pending.append(executor.submit(_parse_chunk, plan, chunk))
+            if len(pending) == 0:
+                return
+            yield from pending.popleft().result()
+
+    def parse_columns(self, columns, executor=None, chunksize=65536):
+        """
+        Parse arguments of many records given as columns, the columnar form of parse_many.
+        :param columns:     dictionary of keyword name and list of values, one per record.
+        :param executor:    optional concurrent.futures executor to parse chunks of rows in parallel.
+        :param chunksize:   number of rows per chunk shipped to the executor.
+        :return:            parsed arguments where each parsed value is a list of values, one per record.
+        """
+        self.examine(isinstance(columns, dict), 'columns must be a dict of lists.')
+        sizes = set(len(column) for column in columns.values())
+        self.examine(len(sizes) <= 1, 'columns must have the same length.')
+        size = sizes.pop() if len(sizes) > 0 else 0
+        plan = self.compile()
+        # Parse all rows at once.
+        if executor is None or size <= chunksize:
+            return plan.run_columns(columns, size)
+        # Parse chunks of rows concurrently, then concatenate them in order.
+        futures = []
+        for start in range(0, size, chunksize):
+            chunk = {name: column[start:start + chunksize] for name, column in columns.items()}
+            futures.append(executor.submit(_parse_columns, plan, chunk, min(chunksize, size - start)))
+        return _concat_columns([future.result() for future in futures])
+
     def parse_leaves(self, **kwargs):
         """
         Parse arguments of leaf nodes from keyword arguments.
@@ -81,7 +682,7 @@ class KwargParse(Node):
         """
         args = dict()
         # Parse arguments.
-        for item in self.leaves:
+        for item in self.__leaves__.values():
             args.update(item.parse(**kwargs))
         # Return arguments.
         return args
@@ -95,6 +696,6 @@ class KwargParse(Node):
             _dict.update(key=self.key)
         if self.default:
             _dict.update(default=self.default)
-        for leaf in self.leaves:
+        for leaf in self.__leaves__.values():
             _dict.update({leaf.name: leaf.to_dict()})
         return _dict
@@ -0,0 +1,53 @@
+# ------------------------------------------------------------------------------
+#  GNU General Public License
+#
+#  Copyright (c) 2020, Hieu Pham.
+#
+#  This file is part of Py-Architect.
+#  <https://github.com/hieupth/pyarchitect>
+#
+#  Py-Architect is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Py-Architect is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+from importlib import import_module
+
+
+def lazy_exports(package, exports):
+    """
+    Make public names of a package imported on first use, so importing the package does not import its modules.
+    Usage in package init: __getattr__, __dir__ = lazy_exports(__name__, EXPORTS).
+    :param package: name of package.
+    :param exports: dict of public name and the module it is imported from, relative to package.
+                    A name which is a module itself maps to None.
+    :return:        module __getattr__ and __dir__ functions.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    namespace = import_module(package).__dict__
+
+    def __getattr__(name):
+        if name not in exports:
+            raise AttributeError('module %r has no attribute %r' % (package, name))
+        module = exports[name]
+        value = import_module('.' + (name if module is None else module), package)
+        if module is not None:
+            value = getattr(value, name)
+        # Cache it, so next lookups do not go through this function.
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
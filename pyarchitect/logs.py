@@ -0,0 +1,194 @@
+# ------------------------------------------------------------------------------
+#  GNU General Public License
+#
+#  Copyright (c) 2020, Hieu Pham.
+#
+#  This file is part of Py-Architect.
+#  <https://github.com/hieupth/pyarchitect>
+#
+#  Py-Architect is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Py-Architect is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import copy
+import atexit
+import logging
+from queue import Queue, Full
+from logging.handlers import QueueHandler, QueueListener
+
+
+# --------------------------------------------------------------------------------
+# Logging is not configured on import, applications opt in by calling
+# configure_logging to get easier readable logs.
+# --------------------------------------------------------------------------------
+# Assign logging formats.
+LOG_FORMAT = '%(levelname)s (%(asctime)s) pid=%(process)d: %(message)s'
+LOG_DATE_FORMAT = 'UTC%Z %d.%m.%y %H:%M:%S'
+
+
+# Policies when log queue is full, drop the record or block the logging thread until there is room.
+DROP = 'drop'
+BLOCK = 'block'
+# Listener of the queue set up by configure_logging.
+_listener = None
+# Root handlers moved behind the listener, they are put back when it stops.
+_moved = []
+# Formats exceptions of records in logging threads.
+_formatter = logging.Formatter()
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Queue handler which puts records to a bounded queue without formatting them, so logging threads never
+    wait for formatting and log I/O. Messages are merged with their arguments before they are queued,
+    and records are formatted by handlers of the listener thread.
+    When queue is full, records are dropped and counted, or the logging thread blocks until there is room.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+
+    def __init__(self, queue, policy=DROP, timeout=None):
+        """
+        Class constructor.
+        :param queue:   bounded queue.
+        :param policy:  drop or block when queue is full.
+        :param timeout: maximum seconds to block before dropping, none to block until there is room.
+        """
+        if policy not in (DROP, BLOCK):
+            raise ValueError('policy must be one of %s.' % ((DROP, BLOCK),))
+        super().__init__(queue)
+        self.policy = policy
+        self.timeout = timeout
+        # Number of dropped records.
+        self.dropped = 0
+
+    def prepare(self, record):
+        """
+        Merge message with its arguments and render exception in logging thread, so arguments changed
+        after logging are not seen by listener thread. The rest of record is formatted in listener thread.
+        Records only cross threads, so they do not have to be made picklable.
+        :param record:  log record.
+        :return:        copy of log record.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        """
+        Put a record to queue with respect to policy.
+        :param record:  log record.
+        """
+        try:
+            if self.policy == DROP:
+                self.queue.put_nowait(record)
+            else:
+                self.queue.put(record, timeout=self.timeout)
+        except Full:
+            # Handler lock is reentrant, emit may also be called without it.
+            with self.lock:
+                self.dropped += 1
+
+
+class FlushingQueueListener(QueueListener):
+    """
+    Queue listener which waits for room to stop, so records queued before stopping are all handled
+    even when queue is full.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+
+    def enqueue_sentinel(self):
+        """
+        Put the stop sentinel behind queued records.
+        """
+        self.queue.put(self._sentinel)
+
+
+def configure_logging(level=logging.INFO, fmt=LOG_FORMAT, datefmt=LOG_DATE_FORMAT, queue=False,
+                      maxsize=10000, policy=DROP, timeout=None, handlers=None):
+    """
+    Set up root logger with library formats, as importing this library used to do.
+    With queue enabled, logging threads only put records to a bounded queue, and a listener thread formats and
+    writes them to handlers, so slow log sinks do not stall logging threads. Handlers already on root logger
+    are moved behind the listener, so records are not written twice. The listener is stopped at exit
+    after all queued records are written.
+    :param level:       level of root logger.
+    :param fmt:         log record format.
+    :param datefmt:     date format.
+    :param queue:       log through a queue and a listener thread or not?
+    :param maxsize:     maximum number of queued records.
+    :param policy:      drop or block when queue is full.
+    :param timeout:     maximum seconds to block before dropping.
+    :param handlers:    handlers of listener thread besides those moved from root logger, default is a
+                        stream handler to stderr when root logger has no handlers.
+    :return:            queue handler when queue is enabled, its dropped counts dropped records.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    global _listener
+    root = logging.getLogger()
+    root.setLevel(level)
+    if not queue:
+        logging.basicConfig(format=fmt, datefmt=datefmt)
+        return None
+    # Replace queue set up before.
+    stop_logging()
+    _moved[:] = root.handlers
+    for handler in _moved:
+        root.removeHandler(handler)
+    if handlers is None:
+        handlers = [] if len(_moved) > 0 else [logging.StreamHandler()]
+    handlers = _moved + list(handlers)
+    formatter = logging.Formatter(fmt, datefmt)
+    for handler in handlers:
+        if handler.formatter is None:
+            handler.setFormatter(formatter)
+    handler = BoundedQueueHandler(Queue(maxsize), policy, timeout)
+    _listener = FlushingQueueListener(handler.queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    root.addHandler(handler)
+    return handler
+
+
+def stop_logging():
+    """
+    Stop the queue set up by configure_logging, after all queued records are written.
+    Handlers moved from root logger are put back.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    global _listener
+    if _listener is None:
+        return
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, BoundedQueueHandler) and handler.queue is _listener.queue:
+            root.removeHandler(handler)
+    _listener.stop()
+    _listener = None
+    for handler in _moved:
+        root.addHandler(handler)
+    _moved.clear()
+
+
+# Queued records are written before interpreter exits.
+atexit.register(stop_logging)
@@ -0,0 +1,334 @@
+# ------------------------------------------------------------------------------
+#  GNU General Public License
+#
+#  Copyright (c) 2020, Hieu Pham.
+#
+#  This file is part of Py-Architect.
+#  <https://github.com/hieupth/pyarchitect>
+#
+#  Py-Architect is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Py-Architect is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+from time import perf_counter_ns
+from threading import Lock
+from functools import wraps
+from contextlib import contextmanager
+
+
+# --------------------------------------------------------------------------------
+# Opt-in instrumentation. Classes list their instrumented methods in __instrumented__,
+# and enable wraps those methods to count calls, errors and latencies. Disable puts
+# original methods back, so there is no cost at all while instrumentation is off.
+# --------------------------------------------------------------------------------
+# Number of latency buckets, bucket i counts calls which took less than 2^i nanoseconds.
+BUCKETS = 40
+# Instrumented classes, original methods replaced by wrappers, metrics by operation name and hooks.
+_classes = []
+_originals = dict()
+_metrics = dict()
+_hooks = []
+_lock = Lock()
+
+
+class Metric:
+    """
+    Counters and latency histogram of an operation, latencies are kept in power of two nanosecond buckets.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    __slots__ = ('name', 'calls', 'errors', 'total', 'buckets', 'lock')
+
+    def __init__(self, name):
+        """
+        Class constructor.
+        :param name:    operation name.
+        """
+        self.name = name
+        self.calls = 0
+        self.errors = 0
+        # Total nanoseconds.
+        self.total = 0
+        self.buckets = [0] * (BUCKETS + 1)
+        self.lock = Lock()
+
+    def observe(self, elapsed, failed=False):
+        """
+        Record a call.
+        :param elapsed: nanoseconds of call.
+        :param failed:  call raised or not?
+        """
+        with self.lock:
+            self.calls += 1
+            self.errors += int(failed)
+            self.total += elapsed
+            self.buckets[min(elapsed.bit_length(), BUCKETS)] += 1
+
+    def quantile(self, q):
+        """
+        Estimate a latency quantile by the upper bound of its bucket.
+        :param q:   quantile between 0 and 1.
+        :return:    seconds.
+        """
+        rank, seen = q * self.calls, 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if count > 0 and seen >= rank:
+                return (1 << i) / 1e9
+        return 0.0
+
+    def to_dict(self):
+        """
+        Convert to dict.
+        :return:    dict of counters, latencies in seconds and non-empty buckets by their upper bound in seconds.
+        """
+        return dict(calls=self.calls, errors=self.errors, seconds=self.total / 1e9,
+                    mean=self.total / self.calls / 1e9 if self.calls > 0 else 0.0,
+                    p50=self.quantile(0.5), p99=self.quantile(0.99),
+                    buckets={(1 << i) / 1e9: count for i, count in enumerate(self.buckets) if count > 0})
+
+
+def register(cls):
+    """
+    Register a class whose methods named in __instrumented__ are wrapped while instrumentation is enabled.
+    Subclasses of Object are registered when they are created. Methods, class methods, static methods,
+    properties and coroutine functions are supported.
+    :param cls: class to be registered.
+    :return:    registered class.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    with _lock:
+        _classes.append(cls)
+        enabled = len(_originals) > 0
+    if enabled:
+        _instrument(cls)
+    return cls
+
+
+def _metric(name):
+    """
+    Get metric of an operation, it is created on first use.
+    :param name:    operation name.
+    :return:        metric.
+    """
+    with _lock:
+        metric = _metrics.get(name)
+        if metric is None:
+            metric = _metrics[name] = Metric(name)
+        return metric
+
+
+def _timed(function, name):
+    """
+    Wrap a function to record its calls.
+    :param function:    function to be wrapped.
+    :param name:        operation name.
+    :return:            wrapper.
+    """
+    # Inspect is only imported when instrumentation is enabled, it is costly to import.
+    from inspect import iscoroutinefunction
+    metric = _metric(name)
+
+    def record(start, failed):
+        elapsed = perf_counter_ns() - start
+        metric.observe(elapsed, failed)
+        for hook in _hooks:
+            hook(name, elapsed / 1e9, failed)
+
+    if iscoroutinefunction(function):
+        @wraps(function)
+        async def wrapper(*args, **kwargs):
+            start, failed = perf_counter_ns(), True
+            try:
+                result = await function(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                record(start, failed)
+    else:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            start, failed = perf_counter_ns(), True
+            try:
+                result = function(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                record(start, failed)
+    return wrapper
+
+
+def _instrument(cls):
+    """
+    Wrap instrumented methods of a class.
+    :param cls: registered class.
+    """
+    for attr in cls.__dict__.get('__instrumented__', ()):
+        original = cls.__dict__.get(attr)
+        if original is None or (cls, attr) in _originals:
+            continue
+        name = '%s.%s' % (cls.__name__, attr)
+        if isinstance(original, property):
+            wrapped = property(_timed(original.fget, name), original.fset, original.fdel, original.__doc__)
+        elif isinstance(original, (classmethod, staticmethod)):
+            wrapped = type(original)(_timed(original.__func__, name))
+        else:
+            wrapped = _timed(original, name)
+        _originals[(cls, attr)] = original
+        setattr(cls, attr, wrapped)
+
+
+def enable():
+    """
+    Enable instrumentation of all registered classes.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    with _lock:
+        classes = list(_classes)
+    for cls in classes:
+        _instrument(cls)
+
+
+def disable():
+    """
+    Disable instrumentation, original methods are put back. Collected metrics are kept.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    for (cls, attr), original in list(_originals.items()):
+        setattr(cls, attr, original)
+        del _originals[(cls, attr)]
+
+
+def enabled():
+    """
+    Check instrumentation is enabled or not?
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    return len(_originals) > 0
+
+
+def add_hook(hook):
+    """
+    Add a hook called after each instrumented call.
+    :param hook:    callable of operation name, seconds and whether the call raised.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    _hooks.append(hook)
+
+
+def remove_hook(hook):
+    """
+    Remove a hook.
+    :param hook:    hook to be removed.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    _hooks.remove(hook)
+
+
+def snapshot():
+    """
+    Get collected metrics.
+    :return:    dict of operation name and its metric as dict.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    with _lock:
+        metrics = list(_metrics.values())
+    return {metric.name: metric.to_dict() for metric in metrics if metric.calls > 0}
+
+
+def reset():
+    """
+    Reset collected metrics.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    with _lock:
+        for metric in _metrics.values():
+            with metric.lock:
+                metric.calls = metric.errors = metric.total = 0
+                metric.buckets = [0] * (BUCKETS + 1)
+
+
+def prometheus(prefix='pyarchitect'):
+    """
+    Dump collected metrics in Prometheus text exposition format.
+    :param prefix:  prefix of metric names.
+    :return:        text of metrics.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    with _lock:
+        metrics = sorted(_metrics.values(), key=lambda item: item.name)
+    lines = ['# HELP %s_call_errors_total Number of instrumented calls which raised.' % prefix,
+             '# TYPE %s_call_errors_total counter' % prefix]
+    lines.extend('%s_call_errors_total{op="%s"} %d' % (prefix, metric.name, metric.errors) for metric in metrics)
+    lines.extend(['# HELP %s_call_seconds Latency of instrumented calls.' % prefix,
+                  '# TYPE %s_call_seconds histogram' % prefix])
+    for metric in metrics:
+        with metric.lock:
+            buckets, calls, total = list(metric.buckets), metric.calls, metric.total
+        seen = 0
+        for i, count in enumerate(buckets[:-1]):
+            seen += count
+            lines.append('%s_call_seconds_bucket{op="%s",le="%.9g"} %d' % (prefix, metric.name, (1 << i) / 1e9, seen))
+        lines.append('%s_call_seconds_bucket{op="%s",le="+Inf"} %d' % (prefix, metric.name, calls))
+        lines.append('%s_call_seconds_sum{op="%s"} %.9g' % (prefix, metric.name, total / 1e9))
+        lines.append('%s_call_seconds_count{op="%s"} %d' % (prefix, metric.name, calls))
+    return '\n'.join(lines) + '\n'
+
+
+@contextmanager
+def memory(limit=10, key_type='lineno'):
+    """
+    Trace memory allocated inside the with block, for example by building a tree, with tracemalloc.
+    :param limit:       number of top allocation sites to report.
+    :param key_type:    group allocation sites by lineno, filename or traceback.
+    :return:            dict filled on exit with net allocated bytes, peak traced bytes and top allocation sites.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    import tracemalloc
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    result = dict()
+    before = tracemalloc.take_snapshot()
+    if hasattr(tracemalloc, 'reset_peak'):
+        tracemalloc.reset_peak()
+    try:
+        yield result
+    finally:
+        after = tracemalloc.take_snapshot()
+        peak = tracemalloc.get_traced_memory()[1]
+        if started:
+            tracemalloc.stop()
+        stats = after.compare_to(before, key_type)
+        result.update(size=sum(stat.size_diff for stat in stats), peak=peak,
+                      top=[(str(stat.traceback), stat.size_diff) for stat in stats[:limit]])
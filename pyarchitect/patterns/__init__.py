@@ -20,5 +20,15 @@
 #  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
 # ------------------------------------------------------------------------------
 from __future__ import absolute_import
-from .singleton import Singleton
-from .locator import Locator
+from pyarchitect.lazy import lazy_exports
+
+
+# Public names and their modules, imported on first use.
+EXPORTS = {
+    'Singleton': 'singleton',
+    'Multiton': 'multiton',
+    'Pool': 'pool',
+    'Locator': 'locator'
+}
+__all__ = list(EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, EXPORTS)
@@ -19,17 +19,79 @@
 #  You should have received a copy of the GNU General Public License
 #  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
 # ------------------------------------------------------------------------------
-from threading import Lock
+from time import perf_counter
+from weakref import WeakKeyDictionary
+from threading import Lock, Condition, local, get_ident
+from functools import partial
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pyarchitect.generic import Object, examine
+from pyarchitect.patterns.pool import Pool
 
 
-class Locator:
+# Marks a service which is not built yet, since a factory may build None.
+_UNSET = object()
+# Services of context lifetime in the current scope, kept per locator.
+_SCOPE = ContextVar('locator_scope', default=None)
+
+
+def _wake(future):
+    """
+    Wake an async waiter of a singleton build, unless it was cancelled.
+    :param future:  future of waiter.
+    """
+    if not future.done():
+        future.set_result(None)
+
+
+class Registration:
+    """
+    Registration of a service factory in locator.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    __slots__ = ('name', 'factory', 'lifetime', 'depends', 'cond', 'coroutine', 'building', 'owner', 'waiters')
+
+    def __init__(self, name, factory, lifetime, depends):
+        """
+        Class constructor.
+        :param name:        name of service.
+        :param factory:     callable which builds the service from its dependencies.
+        :param lifetime:    lifetime of built service.
+        :param depends:     names of services passed to factory.
+        """
+        self.name = name
+        self.factory = factory
+        self.lifetime = lifetime
+        self.depends = depends
+        # Factory is a coroutine function or not? Inspect is imported here since it is costly to import.
+        from inspect import iscoroutinefunction
+        self.coroutine = iscoroutinefunction(factory)
+        # Singleton is built once by get or aget, the others wait on the condition or keep their loop and future.
+        self.cond = Condition()
+        self.building = False
+        self.owner = None
+        self.waiters = []
+
+
+class Locator(Object):
     """
     Encapsulating the processes involved in obtaining a service with a strong abstraction layer.
     Supported multi-thread safe.
     ---------
     @author:    Hieu Pham.
     @created:   24th June, 2020.
+    @modified:  18th October, 2026.
     """
+    # Lifetimes of services built by factories.
+    SINGLETON = 'singleton'
+    TRANSIENT = 'transient'
+    THREAD = 'thread'
+    CONTEXT = 'context'
+    LIFETIMES = (SINGLETON, TRANSIENT, THREAD, CONTEXT)
+    # Methods measured by pyarchitect.metrics when it is enabled.
+    __instrumented__ = ('get', 'set', 'aget', 'warm_up', 'warm_up_async')
 
     def __init__(self):
         """
@@ -39,14 +101,31 @@ class Locator:
         self._container = dict()
         # Lock for thread-safe.
         self._lock = Lock()
+        # Registered service factories.
+        self._factories = dict()
+        # Services of thread lifetime.
+        self._local = local()
+        # Seconds spent in factory of each built service.
+        self._timings = dict()
+        # Pools of resources checked out per use.
+        self._pools = dict()
+
+    @property
+    def timings(self):
+        """Get seconds spent in factory of each built service, the latest build is kept."""
+        return dict(self._timings)
 
     def get(self, name: str) -> object:
         """
-        Get service by name.
+        Get service by name, registered services are built on first use.
         :param name:    name of service.
         :return:        service object.
         """
-        return self._container.get(name)
+        service = self._container.get(name, _UNSET)
+        if service is _UNSET:
+            registration = self._factories.get(name)
+            return None if registration is None else self._resolve(registration)
+        return service
 
     def set(self, name, service, overwrite=False):
         """
@@ -58,3 +137,344 @@ class Locator:
         with self._lock:
             if (name in self._container and overwrite) or name not in self._container:
                 self._container[name] = service
+
+    def register(self, name, factory, lifetime=SINGLETON, depends=(), overwrite=False):
+        """
+        Register a service factory, so the service is only built when it is used.
+        :param name:        name of service.
+        :param factory:     callable which builds the service, services named in depends are passed to it in order.
+        :param lifetime:    singleton is built once, transient on every get, thread once per thread,
+                            and context once per context scope.
+        :param depends:     names of services the factory depends on, they may be registered later
+                            but must be registered or set before the service is built.
+        :param overwrite:   overwrite existed or not.
+        """
+        examine(callable(factory), 'factory must be callable.')
+        examine(lifetime in self.LIFETIMES, 'lifetime must be one of %s.', self.LIFETIMES)
+        depends = tuple(depends)
+        with self._lock:
+            if name in self._factories and not overwrite:
+                return
+            # A new registration must not close a dependency cycle.
+            path = self._find_cycle(name, depends)
+            if path is not None:
+                examine(False, 'dependency cycle: %s.' % ' -> '.join(path))
+            # Services of thread or context lifetime built by a replaced registration are dropped on lookup.
+            self._factories[name] = Registration(name, factory, lifetime, depends)
+            if overwrite:
+                self._container.pop(name, None)
+
+    def register_pool(self, name, factory, min_size=0, max_size=8, validate=None, destroy=None,
+                      idle_timeout=None, overwrite=False):
+        """
+        Register a pool of resources which must not be shared, such as parsers or connections.
+        Resources are checked out with checkout or acheckout and returned to pool afterward.
+        :param name:            name of pool.
+        :param factory:         callable which creates a resource.
+        :param min_size:        number of resources kept even when they are idle.
+        :param max_size:        maximum number of resources.
+        :param validate:        callable which checks a returned resource is still usable.
+        :param destroy:         callable which releases a resource when it is dropped from pool.
+        :param idle_timeout:    seconds an idle resource above min size is kept, none to keep them forever.
+        :param overwrite:       overwrite existed or not, a replaced pool is closed.
+        :return:                registered pool.
+        """
+        with self._lock:
+            if name in self._pools and not overwrite:
+                return self._pools[name]
+            pool = Pool(factory, min_size, max_size, validate, destroy, idle_timeout)
+            previous, self._pools[name] = self._pools.get(name), pool
+        # Idle resources of replaced pool are destroyed now, checked out ones are destroyed on return.
+        if previous is not None:
+            previous.close()
+        return pool
+
+    def pool(self, name):
+        """
+        Get pool by name, its stats tell size, wait times and utilisation.
+        :param name:    name of pool.
+        :return:        pool or None.
+        """
+        return self._pools.get(name)
+
+    def checkout(self, name, timeout=None):
+        """
+        Check out a resource from pool for the with block, it is returned when the block exits.
+        :param name:    name of pool.
+        :param timeout: maximum seconds to wait when pool is exhausted, none to wait forever.
+        :return:        context manager giving the resource.
+        """
+        pool = self._pools.get(name)
+        if pool is None:
+            examine(False, 'pool %s is not registered.' % name)
+        return pool.checkout(timeout)
+
+    def acheckout(self, name, timeout=None):
+        """
+        Check out a resource from pool for the async with block, waiting does not block the event loop.
+        :param name:    name of pool.
+        :param timeout: maximum seconds to wait when pool is exhausted, none to wait forever.
+        :return:        async context manager giving the resource.
+        """
+        pool = self._pools.get(name)
+        if pool is None:
+            examine(False, 'pool %s is not registered.' % name)
+        return pool.acheckout(timeout)
+
+    def _find_cycle(self, name, depends):
+        """
+        Find a dependency path which leads back to a service.
+        :param name:    name of service.
+        :param depends: names of services it depends on.
+        :return:        list of names along the cycle or None.
+        """
+        lookup, seen = [(item, (name, item)) for item in depends], set()
+        while len(lookup) > 0:
+            item, path = lookup.pop()
+            if item == name:
+                return path
+            if item in seen or item not in self._factories:
+                continue
+            seen.add(item)
+            lookup.extend((depend, path + (depend,)) for depend in self._factories[item].depends)
+        return None
+
+    def _resolve(self, registration, run=False):
+        """
+        Get a registered service with respect to its lifetime.
+        :param registration:    service registration.
+        :param run:             run async factory in its own event loop or not?
+        :return:                service object.
+        """
+        if registration.lifetime == self.SINGLETON:
+            with registration.cond:
+                # Another thread or coroutine may be building it, the build is waited for instead of repeated.
+                while True:
+                    service = self._container.get(registration.name, _UNSET)
+                    if service is not _UNSET:
+                        return service
+                    if not registration.building:
+                        break
+                    if registration.owner == get_ident():
+                        examine(False, 'service %s is being built by aget in this thread.' % registration.name)
+                    registration.cond.wait()
+                registration.building, registration.owner = True, get_ident()
+            service = _UNSET
+            try:
+                service = self._build(registration, run)
+            finally:
+                self._built(registration, service)
+            return service
+        if registration.lifetime == self.TRANSIENT:
+            return self._build(registration, run)
+        # Services are kept with their registration, so those of a replaced registration are built again.
+        services = self._services(registration)
+        entry = services.get(registration.name)
+        if entry is None or entry[0] is not registration:
+            entry = services[registration.name] = (registration, self._build(registration, run))
+        return entry[1]
+
+    def _built(self, registration, service):
+        """
+        Finish the build of a singleton and wake its waiters, they build it again if the build failed.
+        :param registration:    service registration.
+        :param service:         service object or unset if the build failed.
+        """
+        with registration.cond:
+            if service is not _UNSET:
+                self._keep(registration, service)
+            registration.building, registration.owner = False, None
+            waiters, registration.waiters = registration.waiters, []
+            registration.cond.notify_all()
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, future)
+            except RuntimeError:
+                # Event loop of waiter is closed.
+                pass
+
+    def _keep(self, registration, service):
+        """
+        Keep a built singleton service, unless its registration was replaced while it was built.
+        :param registration:    service registration.
+        :param service:         service object.
+        """
+        with self._lock:
+            if self._factories.get(registration.name) is registration:
+                self._container[registration.name] = service
+
+    def _services(self, registration):
+        """
+        Get the dict keeping services of thread or context lifetime for the current thread or scope.
+        :param registration:    service registration.
+        :return:                dict of name and tuple of registration and service.
+        """
+        if registration.lifetime == self.THREAD:
+            return self._local.__dict__
+        scopes = _SCOPE.get()
+        if scopes is None:
+            scopes = WeakKeyDictionary()
+            _SCOPE.set(scopes)
+        services = scopes.get(self)
+        if services is None:
+            services = scopes[self] = dict()
+        return services
+
+    def _build(self, registration, run=False):
+        """
+        Build a service from its factory.
+        :param registration:    service registration.
+        :param run:             run async factory in its own event loop or not?
+        :return:                service object.
+        """
+        self._check_depends(registration)
+        args = [self.get(name) for name in registration.depends]
+        start = perf_counter()
+        if registration.coroutine:
+            if not run:
+                examine(False, 'service %s has an async factory, get it with aget.' % registration.name)
+            import asyncio
+            service = asyncio.run(registration.factory(*args))
+        else:
+            service = registration.factory(*args)
+        self._timings[registration.name] = perf_counter() - start
+        return service
+
+    async def aget(self, name):
+        """
+        Get service by name from asyncio code. Registered services are built on first use, async factories are
+        awaited and sync factories run in the default executor, so neither of them blocks the event loop.
+        :param name:    name of service.
+        :return:        service object.
+        """
+        service = self._container.get(name, _UNSET)
+        if service is not _UNSET:
+            return service
+        registration = self._factories.get(name)
+        if registration is None:
+            return None
+        if registration.lifetime == self.SINGLETON:
+            # Asyncio is imported here since it is costly to import for sync users.
+            import asyncio
+            loop = asyncio.get_running_loop()
+            # Concurrent callers of get and aget wait for the same build.
+            while True:
+                with registration.cond:
+                    service = self._container.get(name, _UNSET)
+                    if service is not _UNSET:
+                        return service
+                    if not registration.building:
+                        registration.building, registration.owner = True, get_ident()
+                        break
+                    future = loop.create_future()
+                    registration.waiters.append((loop, future))
+                await future
+            # The build runs in its own task, so cancelling this caller does not cancel it for waiters,
+            # and it is finished by a callback which runs even when the task is cancelled before it starts.
+            task = loop.create_task(self._abuild(registration))
+            task.add_done_callback(partial(self._abuilt, registration))
+            return await asyncio.shield(task)
+        if registration.lifetime == self.TRANSIENT:
+            return await self._abuild(registration)
+        services = self._services(registration)
+        entry = services.get(name)
+        if entry is None or entry[0] is not registration:
+            entry = services[name] = (registration, await self._abuild(registration))
+        return entry[1]
+
+    def _abuilt(self, registration, task):
+        """
+        Finish the asyncio build of a singleton.
+        :param registration:    service registration.
+        :param task:            done task of the build.
+        """
+        failed = task.cancelled() or task.exception() is not None
+        self._built(registration, _UNSET if failed else task.result())
+
+    async def _abuild(self, registration):
+        """
+        Build a service from its factory in asyncio code, dependencies are got concurrently.
+        :param registration:    service registration.
+        :return:                service object.
+        """
+        import asyncio
+        self._check_depends(registration)
+        args = await asyncio.gather(*[self.aget(name) for name in registration.depends])
+        start = perf_counter()
+        if registration.coroutine:
+            service = await registration.factory(*args)
+        else:
+            loop = asyncio.get_running_loop()
+            service = await loop.run_in_executor(None, partial(registration.factory, *args))
+        self._timings[registration.name] = perf_counter() - start
+        return service
+
+    def _pending(self):
+        """
+        Get singleton registrations which are not built yet.
+        :return:    dict of name and registration.
+        """
+        return {name: registration for name, registration in self._factories.items()
+                if registration.lifetime == self.SINGLETON and name not in self._container}
+
+    def _check_depends(self, registration):
+        """
+        Check all dependencies of a service are registered or set, before its factory is called.
+        :param registration:    service registration.
+        """
+        for name in registration.depends:
+            if name not in self._container and name not in self._factories:
+                examine(False, 'service %s depends on %s which is not registered.', registration.name, name)
+
+    def warm_up(self, max_workers=None):
+        """
+        Build all singleton services which are not built yet on a thread pool. Services are built as soon as
+        all of their dependencies are built, so independent services are built concurrently.
+        Async factories run in their own event loop, use warm_up_async to build them in the running loop.
+        :param max_workers: maximum number of threads.
+        :return:            dict of name and seconds spent in factory of each service built.
+        """
+        # Thread pools are imported here since they are costly to import.
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+        pending = self._pending()
+        # Count unbuilt singleton dependencies of each service.
+        waiting = {name: set(depend for depend in registration.depends if depend in pending)
+                   for name, registration in pending.items()}
+        with ThreadPoolExecutor(max_workers) as executor:
+            running = dict()
+            while len(waiting) > 0 or len(running) > 0:
+                for name in [name for name, depends in waiting.items() if len(depends) == 0]:
+                    del waiting[name]
+                    running[executor.submit(self._resolve, pending[name], True)] = name
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    future.result()
+                    for depends in waiting.values():
+                        depends.discard(name)
+        return {name: self._timings[name] for name in pending}
+
+    async def warm_up_async(self):
+        """
+        Build all singleton services which are not built yet in the running event loop.
+        Each service waits only for its own dependencies, so independent services are built concurrently.
+        :return:    dict of name and seconds spent in factory of each service built.
+        """
+        import asyncio
+        pending = self._pending()
+        await asyncio.gather(*[self.aget(name) for name in pending])
+        return {name: self._timings[name] for name in pending}
+
+    @contextmanager
+    def scope(self):
+        """
+        Open a new scope for services of context lifetime, they are built again inside the scope.
+        Scopes of other locators are kept.
+        """
+        scopes = WeakKeyDictionary(_SCOPE.get() or ())
+        scopes[self] = dict()
+        token = _SCOPE.set(scopes)
+        try:
+            yield self
+        finally:
+            _SCOPE.reset(token)
@@ -0,0 +1,172 @@
+# ------------------------------------------------------------------------------
+#  GNU General Public License
+#
+#  Copyright (c) 2020, Hieu Pham.
+#
+#  This file is part of Py-Architect.
+#  <https://github.com/hieupth/pyarchitect>
+#
+#  Py-Architect is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Py-Architect is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import time
+from threading import Lock, RLock
+from weakref import ref
+from collections import OrderedDict, namedtuple
+from pyarchitect.generic import examine
+
+
+# Statistics of multiton instances cache.
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+# Separates positional and keyword arguments in cache keys, so different call shapes never share a key.
+_KWMARK = object()
+
+
+class Multiton(type):
+    """
+    Restricts the instantiation of a class to one instance per constructor arguments. Supported thread-safe.
+    Instances are cached by their hashed arguments, the cache is configured with class keywords:
+        maxsize:    maximum number of cached instances, least recently used ones are evicted first.
+        ttl:        seconds an instance lives in cache since it was created.
+        weak:       keep weak references, so instances nobody uses are garbage collected.
+    Instances of different arguments are created under different locks, so they never block each other.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    # Cache options and their defaults.
+    OPTIONS = dict(maxsize=None, ttl=None, weak=False)
+
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        """
+        Create a multiton class.
+        """
+        kwargs = {key: value for key, value in kwargs.items() if key not in mcs.OPTIONS}
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+    def __init__(cls, name, bases, namespace, **kwargs):
+        """
+        Initialize a multiton class with its own cache, options not given are inherited from base classes.
+        """
+        options = dict(getattr(cls, '__multiton_options__', Multiton.OPTIONS))
+        options.update((key, kwargs.pop(key)) for key in Multiton.OPTIONS if key in kwargs)
+        super().__init__(name, bases, namespace, **kwargs)
+        examine(options['maxsize'] is None or options['maxsize'] > 0, 'maxsize must be positive.')
+        examine(options['ttl'] is None or options['ttl'] > 0, 'ttl must be positive.')
+        cls.__multiton_options__ = options
+        # Cached instances by key, each value is the instance (or its weak reference) and its creation time.
+        cls.__multiton__ = OrderedDict()
+        # Lock of cache, reentrant since weak reference callbacks may run while it is held.
+        cls.__multiton_lock__ = RLock()
+        # Creation locks by key, each value is the lock and the number of threads using it.
+        cls.__multiton_keys__ = dict()
+        # Hits, misses and evictions.
+        cls.__multiton_stats__ = [0, 0, 0]
+
+    def __call__(cls, *args, **kwargs):
+        """
+        Where the instance of the class can behave and called like a function.
+        :param args:    additional arguments to be passed.
+        :param kwargs:  additional keyword arguments to be passed.
+        :return:        instance of the arguments.
+        """
+        key = args + (_KWMARK,) + tuple(sorted(kwargs.items())) if kwargs else args
+        try:
+            hashable = hash(key) is not None
+        except TypeError:
+            hashable = False
+        if not hashable:
+            examine(False, 'arguments of %s must be hashable.' % cls.__name__)
+        instance = cls._lookup(key)
+        if instance is not None:
+            return instance
+        # Take the creation lock of this key only.
+        with cls.__multiton_lock__:
+            lock = cls.__multiton_keys__.get(key)
+            if lock is None:
+                lock = cls.__multiton_keys__[key] = [Lock(), 0]
+            lock[1] += 1
+        try:
+            with lock[0]:
+                # Another thread may have created it while we were waiting.
+                instance = cls._lookup(key)
+                if instance is None:
+                    instance = super().__call__(*args, **kwargs)
+                    cls._store(key, instance)
+        finally:
+            with cls.__multiton_lock__:
+                lock[1] -= 1
+                if lock[1] == 0:
+                    del cls.__multiton_keys__[key]
+        return instance
+
+    def _lookup(cls, key):
+        """
+        Look up a cached instance, expired and collected instances are evicted.
+        :param key:     key of arguments.
+        :return:        cached instance or None.
+        """
+        options, stats = cls.__multiton_options__, cls.__multiton_stats__
+        with cls.__multiton_lock__:
+            entry = cls.__multiton__.get(key)
+            if entry is None:
+                return None
+            instance, created = entry
+            if options['weak']:
+                instance = instance()
+            if instance is None or (options['ttl'] is not None and time.monotonic() - created > options['ttl']):
+                del cls.__multiton__[key]
+                stats[2] += 1
+                return None
+            cls.__multiton__.move_to_end(key)
+            stats[0] += 1
+            return instance
+
+    def _store(cls, key, instance):
+        """
+        Cache an instance, least recently used instances are evicted when cache is full.
+        :param key:         key of arguments.
+        :param instance:    created instance.
+        """
+        options, stats, cache = cls.__multiton_options__, cls.__multiton_stats__, cls.__multiton__
+        if options['weak']:
+            def collected(reference):
+                with cls.__multiton_lock__:
+                    entry = cache.get(key)
+                    if entry is not None and entry[0] is reference:
+                        del cache[key]
+                        stats[2] += 1
+            instance = ref(instance, collected)
+        with cls.__multiton_lock__:
+            cache[key] = (instance, time.monotonic())
+            stats[1] += 1
+            while options['maxsize'] is not None and len(cache) > options['maxsize']:
+                cache.popitem(last=False)
+                stats[2] += 1
+
+    def cache_info(cls):
+        """
+        Get statistics of instances cache.
+        :return:    hits, misses, evictions, maxsize and current size.
+        """
+        with cls.__multiton_lock__:
+            hits, misses, evictions = cls.__multiton_stats__
+            return CacheInfo(hits, misses, evictions, cls.__multiton_options__['maxsize'], len(cls.__multiton__))
+
+    def cache_clear(cls):
+        """
+        Drop all cached instances and reset statistics.
+        """
+        with cls.__multiton_lock__:
+            cls.__multiton__.clear()
+            cls.__multiton_stats__[:] = [0, 0, 0]
@@ -0,0 +1,416 @@
+# ------------------------------------------------------------------------------
+#  GNU General Public License
+#
+#  Copyright (c) 2020, Hieu Pham.
+#
+#  This file is part of Py-Architect.
+#  <https://github.com/hieupth/pyarchitect>
+#
+#  Py-Architect is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Py-Architect is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+from time import monotonic
+from threading import Condition
+from collections import deque
+from contextlib import contextmanager, asynccontextmanager
+from pyarchitect.generic import examine
+
+
+# Placeholder handed to a waiter which may create a new resource instead of reusing one.
+_SLOT = object()
+
+
+class Pool:
+    """
+    Pool of expensive resources which must not be shared between threads, such as parsers or connections.
+    Resources are created on demand up to max size, checked out by one user at a time and reused when they
+    are returned. Idle resources above min size are evicted after idle timeout. Supported multi-thread safe
+    and asyncio, async waiters are woken from any thread.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+
+    @property
+    def closed(self):
+        """Check this pool is closed or not?"""
+        return self._closed
+
+    @property
+    def size(self):
+        """Get number of resources created by this pool, including those being created."""
+        return self._size
+
+    @property
+    def idle(self):
+        """Get number of idle resources."""
+        return len(self._idle)
+
+    @property
+    def in_use(self):
+        """Get number of checked out resources."""
+        return self._size - len(self._idle)
+
+    @property
+    def stats(self):
+        """Get pool statistics, wait times are in seconds and utilisation is in use over max size."""
+        with self._cond:
+            stats = dict(self._stats)
+            stats.update(size=self._size, idle=len(self._idle), in_use=self._size - len(self._idle),
+                         min_size=self.min_size, max_size=self.max_size)
+        stats['utilisation'] = stats['in_use'] / self.max_size
+        stats['mean_wait'] = stats['wait_time'] / stats['waits'] if stats['waits'] > 0 else 0.0
+        return stats
+
+    def __init__(self, factory, min_size=0, max_size=8, validate=None, destroy=None, idle_timeout=None):
+        """
+        Class constructor.
+        :param factory:         callable which creates a resource.
+        :param min_size:        number of resources kept even when they are idle, they are created on first use.
+        :param max_size:        maximum number of resources.
+        :param validate:        callable which checks a returned resource is still usable, unusable ones are
+                                destroyed and their places are freed.
+        :param destroy:         callable which releases a resource when it is dropped from pool.
+        :param idle_timeout:    seconds an idle resource is kept, none to keep them forever.
+        """
+        examine(callable(factory), 'factory must be callable.')
+        examine(0 <= min_size <= max_size and max_size > 0, 'pool sizes must meet 0 <= min_size <= max_size.')
+        examine(idle_timeout is None or idle_timeout > 0, 'idle timeout must be positive.')
+        self.factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.validate = validate
+        self.destroy = destroy
+        self.idle_timeout = idle_timeout
+        # Idle resources and the time they were returned, the most recently returned one is reused first.
+        self._idle = deque()
+        # Number of resources created, including those being created.
+        self._size = 0
+        # Condition for thread waiters, async waiters keep their loop and future.
+        self._cond = Condition()
+        self._waiters = deque()
+        # Closed pool destroys returned resources and refuses checkouts.
+        self._closed = False
+        self._stats = dict(checkouts=0, created=0, destroyed=0, waits=0, wait_time=0.0,
+                           max_wait=0.0, timeouts=0, peak=0)
+
+    def _take(self):
+        """
+        Take an idle resource or a place to create one, caller must hold the condition.
+        :return:    resource, slot or None when pool is exhausted.
+        """
+        if self._closed:
+            raise RuntimeError('pool is closed.')
+        if len(self._idle) > 0:
+            item = self._idle.pop()[0]
+        elif self._size < self.max_size:
+            self._size += 1
+            item = _SLOT
+        else:
+            return None
+        stats = self._stats
+        stats['checkouts'] += 1
+        stats['peak'] = max(stats['peak'], self._size - len(self._idle))
+        return item
+
+    def _waited(self, start, done):
+        """
+        Record a wait, caller must hold the condition.
+        :param start:   time the wait started.
+        :param done:    the wait got a resource or timed out.
+        """
+        stats, elapsed = self._stats, monotonic() - start
+        stats['waits'] += 1
+        stats['wait_time'] += elapsed
+        stats['max_wait'] = max(stats['max_wait'], elapsed)
+        if not done:
+            stats['timeouts'] += 1
+
+    def _create(self, item):
+        """
+        Create a resource if a slot was taken, the slot is freed when factory fails.
+        :param item:    resource or slot.
+        :return:        resource.
+        """
+        if item is not _SLOT:
+            return item
+        try:
+            resource = self.factory()
+        except BaseException:
+            self._free(False)
+            raise
+        with self._cond:
+            self._stats['created'] += 1
+        return resource
+
+    def _next_waiter(self):
+        """
+        Pop the first async waiter with an item for it, caller must hold the condition.
+        :return:    waiter and item, or None if there is no async waiter or nothing to take.
+        """
+        if len(self._waiters) == 0:
+            return None
+        item = self._take()
+        if item is None:
+            return None
+        waiter = self._waiters.popleft()
+        self._waited(waiter[2], True)
+        return waiter, item
+
+    def _handoff(self, handoff):
+        """
+        Hand an item to an async waiter in its event loop.
+        :param handoff: waiter and item.
+        """
+        (loop, future, _), item = handoff
+        try:
+            loop.call_soon_threadsafe(self._deliver, future, item)
+        except RuntimeError:
+            # Event loop of waiter is closed.
+            self._giveback(item)
+
+    def _deliver(self, future, item):
+        """
+        Set result of an async waiter, items of waiters which have gone are put back to pool.
+        :param future:  future of waiter.
+        :param item:    resource or slot.
+        """
+        if future.done():
+            self._giveback(item)
+        else:
+            future.set_result(item)
+
+    def _giveback(self, item):
+        """
+        Put an item which has never been used back to pool.
+        :param item:    resource or slot.
+        """
+        if item is _SLOT:
+            self._free(False)
+        else:
+            self._idle_add(item)
+
+    def _free(self, destroyed=True):
+        """
+        Free the place of a resource, so a waiter can create a new one.
+        :param destroyed:   the resource was created and is destroyed now, or it has never been created?
+        """
+        with self._cond:
+            self._size -= 1
+            self._stats['destroyed'] += int(destroyed)
+            handoff = self._next_waiter()
+            if handoff is None:
+                self._cond.notify()
+        if handoff is not None:
+            self._handoff(handoff)
+
+    def _idle_add(self, resource):
+        """
+        Put a resource to idle resources, or hand it to an async waiter.
+        :param resource:    resource to be put.
+        """
+        with self._cond:
+            closed = self._closed
+            if not closed:
+                self._idle.append((resource, monotonic()))
+                handoff = self._next_waiter()
+                if handoff is None:
+                    self._cond.notify()
+        if closed:
+            # Resources returned to a closed pool are destroyed.
+            self._drop(resource)
+            self._free()
+        elif handoff is not None:
+            self._handoff(handoff)
+
+    def fill(self):
+        """
+        Create resources until pool reaches min size.
+        """
+        while True:
+            with self._cond:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            self._idle_add(self._create(_SLOT))
+
+    def acquire(self, timeout=None):
+        """
+        Check out a resource, blocking until one is returned when pool is exhausted.
+        :param timeout: maximum seconds to wait, none to wait forever.
+        :return:        resource.
+        """
+        if self._size < self.min_size:
+            self.fill()
+        self.evict()
+        with self._cond:
+            item = self._take()
+            if item is None:
+                start = monotonic()
+                deadline = None if timeout is None else start + timeout
+                while item is None:
+                    remaining = None if deadline is None else deadline - monotonic()
+                    if remaining is not None and remaining <= 0:
+                        self._waited(start, False)
+                        raise TimeoutError('no resource is returned to pool in %s seconds.' % timeout)
+                    self._cond.wait(remaining)
+                    item = self._take()
+                self._waited(start, True)
+        return self._create(item)
+
+    async def aacquire(self, timeout=None):
+        """
+        Check out a resource from asyncio code, waiting does not block the event loop,
+        and sync factory runs in the default executor.
+        :param timeout: maximum seconds to wait, none to wait forever.
+        :return:        resource.
+        """
+        # Asyncio is imported here since it is costly to import for sync users.
+        import asyncio
+        loop = asyncio.get_running_loop()
+        if self._size < self.min_size:
+            await loop.run_in_executor(None, self.fill)
+        self.evict()
+        with self._cond:
+            item = self._take()
+            if item is None:
+                future = loop.create_future()
+                self._waiters.append((loop, future, monotonic()))
+        if item is None:
+            try:
+                item = await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
+                with self._cond:
+                    for waiter in self._waiters:
+                        if waiter[1] is future:
+                            self._waiters.remove(waiter)
+                            self._waited(waiter[2], False)
+                            break
+                raise TimeoutError('no resource is returned to pool in %s seconds.' % timeout) from None
+        if item is _SLOT:
+            return await loop.run_in_executor(None, self._create, item)
+        return item
+
+    def release(self, resource, discard=False):
+        """
+        Return a checked out resource, it is validated before it is reused.
+        :param resource:    resource to be returned.
+        :param discard:     drop the resource instead of reusing it?
+        """
+        if not discard and self.validate is not None:
+            try:
+                discard = not self.validate(resource)
+            except Exception:
+                discard = True
+        if discard:
+            self._drop(resource)
+            self._free()
+        else:
+            self._idle_add(resource)
+
+    def _drop(self, resource):
+        """
+        Destroy a resource, failures of destroy are ignored since the resource is dropped anyway.
+        :param resource:    resource to be dropped.
+        """
+        if self.destroy is not None:
+            try:
+                self.destroy(resource)
+            except Exception:
+                pass
+
+    def evict(self):
+        """
+        Drop resources idle for longer than idle timeout, pool does not shrink below min size.
+        :return:    number of dropped resources.
+        """
+        if self.idle_timeout is None:
+            return 0
+        expired, deadline = [], monotonic() - self.idle_timeout
+        with self._cond:
+            # Idle resources are ordered by their returned time, the oldest one is on the left.
+            while len(self._idle) > 0 and self._idle[0][1] < deadline and self._size > self.min_size:
+                expired.append(self._idle.popleft()[0])
+                self._size -= 1
+                self._stats['destroyed'] += 1
+        for resource in expired:
+            self._drop(resource)
+        return len(expired)
+
+    def clear(self):
+        """
+        Drop all idle resources.
+        """
+        with self._cond:
+            expired = [item[0] for item in self._idle]
+            self._idle.clear()
+            self._size -= len(expired)
+            self._stats['destroyed'] += len(expired)
+            self._cond.notify_all()
+        for resource in expired:
+            self._drop(resource)
+
+    def close(self):
+        """
+        Close pool, idle resources are destroyed now and checked out ones when they are returned,
+        and waiting checkouts fail.
+        """
+        with self._cond:
+            self._closed = True
+            expired = [item[0] for item in self._idle]
+            self._idle.clear()
+            self._size -= len(expired)
+            self._stats['destroyed'] += len(expired)
+            waiters, self._waiters = self._waiters, deque()
+            self._cond.notify_all()
+        for resource in expired:
+            self._drop(resource)
+        for loop, future, _ in waiters:
+            try:
+                loop.call_soon_threadsafe(self._reject, future)
+            except RuntimeError:
+                # Event loop of waiter is closed.
+                pass
+
+    @staticmethod
+    def _reject(future):
+        """
+        Fail an async waiter of a closed pool.
+        :param future:  future of waiter.
+        """
+        if not future.done():
+            future.set_exception(RuntimeError('pool is closed.'))
+
+    @contextmanager
+    def checkout(self, timeout=None):
+        """
+        Check out a resource for the with block, it is returned when the block exits.
+        :param timeout: maximum seconds to wait, none to wait forever.
+        """
+        resource = self.acquire(timeout)
+        try:
+            yield resource
+        finally:
+            self.release(resource)
+
+    @asynccontextmanager
+    async def acheckout(self, timeout=None):
+        """
+        Check out a resource for the async with block, it is returned when the block exits.
+        :param timeout: maximum seconds to wait, none to wait forever.
+        """
+        resource = await self.aacquire(timeout)
+        try:
+            yield resource
+        finally:
+            self.release(resource)
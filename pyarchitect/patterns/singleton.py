@@ -19,21 +19,53 @@
 #  You should have received a copy of the GNU General Public License
 #  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
 # ------------------------------------------------------------------------------
+import os
 from threading import Lock
-from typing import Optional
+from weakref import WeakSet
+from pyarchitect import metrics
+from pyarchitect.generic import examine
 
 
 class Singleton(type):
     """
     Restricts the instantiation of a class to one instance. Supported thread-safe.
+    Each class has its own instance and lock, and the lock is only taken while the instance is created.
+    After os.fork, child processes renew locks and, unless the class is declared with fork='keep',
+    drop the instance so it is built again in the child.
     ---------
     @author:    Hieu Pham.
     @created:   24th June, 2020.
+    @modified:  18th October, 2026.
     """
-    # Singleton instance.
-    _instance: Optional = None
-    # Lock for thread-safe mode,
-    _lock: Lock = Lock()
+    # Policies after fork.
+    RESET = 'reset'
+    KEEP = 'keep'
+    # All classes created by this metaclass.
+    _classes = WeakSet()
+    # Methods measured by pyarchitect.metrics when it is enabled.
+    __instrumented__ = ('__call__',)
+
+    def __new__(mcs, name, bases, namespace, fork=None, **kwargs):
+        """
+        Create a singleton class.
+        :param fork:    policy of instance after fork, reset or keep, inherited from base classes by default.
+        """
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+    def __init__(cls, name, bases, namespace, fork=None, **kwargs):
+        """
+        Initialize a singleton class with its own instance and lock.
+        :param fork:    policy of instance after fork, reset or keep, inherited from base classes by default.
+        """
+        super().__init__(name, bases, namespace, **kwargs)
+        fork = fork if fork else getattr(cls, '__singleton_fork__', Singleton.RESET)
+        examine(fork in (Singleton.RESET, Singleton.KEEP), 'fork policy must be reset or keep.')
+        # Singleton instance.
+        cls.__singleton__ = None
+        # Lock for thread-safe mode.
+        cls.__singleton_lock__ = Lock()
+        cls.__singleton_fork__ = fork
+        Singleton._classes.add(cls)
 
     def __call__(cls, *args, **kwargs):
         """
@@ -42,15 +74,42 @@ class Singleton(type):
         :param kwargs:  additional keyword arguments to be passed.
         :return:        singleton instance.
         """
+        # Once the instance exists, it is returned without taking the lock.
+        instance = cls.__singleton__
+        if instance is not None:
+            return instance
         # Now, imagine that the program has just been launched. Since there's no Singleton instance yet, multiple
         # threads can simultaneously pass the previous conditional and reach this point almost at the same time.
         # The first of them will acquire lock and will proceed further, while the rest will wait here.
-        with cls._lock:
+        with cls.__singleton_lock__:
             # The first thread to acquire the lock, reaches this conditional, goes inside and creates the Singleton
             # instance. Once it leaves the lock block, a thread that might have been waiting for the lock release may
             # then enter this section. But since the Singleton field is already initialized, the thread won't create a
             # new object.
-            if not cls._instance:
-                cls._instance = super().__call__(*args, **kwargs)
+            if cls.__singleton__ is None:
+                cls.__singleton__ = super().__call__(*args, **kwargs)
         # Finally, return the singleton instance.
-        return cls._instance
\ No newline at end of file
+        return cls.__singleton__
+
+    def reset(cls):
+        """
+        Drop the singleton instance, so it is created again on the next call.
+        """
+        with cls.__singleton_lock__:
+            cls.__singleton__ = None
+
+    @staticmethod
+    def _after_fork():
+        """
+        Renew locks, which may be held by threads that do not exist in the child, and reset instances.
+        """
+        for cls in list(Singleton._classes):
+            cls.__singleton_lock__ = Lock()
+            if cls.__singleton_fork__ == Singleton.RESET:
+                cls.__singleton__ = None
+
+
+# Singleton is a metaclass, so it is registered explicitly.
+metrics.register(Singleton)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=Singleton._after_fork)
@@ -19,4 +19,13 @@
 #  You should have received a copy of the GNU General Public License
 #  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
 # ------------------------------------------------------------------------------
-from __future__ import absolute_import
\ No newline at end of file
+from __future__ import absolute_import
+from pyarchitect.lazy import lazy_exports
+
+
+# Public names and their modules, imported on first use.
+EXPORTS = {
+    'FlatDict': 'flatdict'
+}
+__all__ = list(EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, EXPORTS)
@@ -20,28 +20,230 @@
 #  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
 # ------------------------------------------------------------------------------
 from pyarchitect.generic import examine
+from pyarchitect.utils.flatdict import FlatDict
 
 
 def update(x, y):
     """
-    Update a dictionary by another one.
+    Update a dictionary by another one, both of them can also be flat dicts.
     :params x:  input dict to be updated.
     :params y:  source dict.
     :return:    updated dict.
     ---------
     @author:    Hieu Pham.
     @created:   24th August, 2020.
+    @modified:  18th October, 2026.
     """
+    # Flat dicts are merged directly without converting them to nested dicts.
+    if isinstance(x, FlatDict) and isinstance(y, FlatDict):
+        return x.merge(y)
     examine(isinstance(x, dict) and isinstance(y, dict), 'inputs should be dict.')
-    # Assign dict keys.
-    keys = [set(x.keys()), set(y.keys())]
-    keys = [keys[0], keys[1], keys[0].union(keys[1]), keys[1].intersection(keys[0])]
-    keys.insert(len(keys), keys[2] - keys[3])
-    # Update keys which only belongs to one dict.
-    z = {k: x.get(k, y.get(k, None)) for k in keys[-1]}
-    # Update keys which belongs to both dict.
-    for k in keys[3]:
-        xk, yk = x.get(k, None), y.get(k, None)
-        z.update({k: update(xk, yk) if isinstance(xk, dict) and isinstance(yk, dict) else yk})
-    # Return updated dict.
+    return merge(x, y)
+
+
+def merge(x, y, inplace=False):
+    """
+    Deep merge a dictionary by another one, values of y win unless both values are dict.
+    Subtrees which only one side contains are shared instead of copied.
+    :param x:       input dict to be merged.
+    :param y:       source dict.
+    :param inplace: merge into x and its nested dicts instead of new dicts?
+    :return:        merged dict.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    return merge_many(x, y, inplace=inplace)
+
+
+def merge_many(*layers, inplace=False):
+    """
+    Deep merge many layers of dictionaries in one pass, later layers win. The result is the same as
+    folding update over the layers, but each layer is walked once and each nested dict is copied at most once.
+    :param layers:  dicts to be merged.
+    :param inplace: merge into the first layer and its nested dicts instead of new dicts?
+    :return:        merged dict.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    examine(all(isinstance(layer, dict) for layer in layers), 'inputs should be dict.')
+    if len(layers) == 0:
+        return dict()
+    z = layers[0] if inplace else dict(layers[0])
+    # Dicts created by this merge, and dicts taken from later layers. A dict which is not ours
+    # is copied once before merging into it, so no input other than the first in place layer is changed.
+    owned, foreign = {id(z): z}, dict()
+    for layer in layers[1:]:
+        # We use a stack instead of recursion to avoid stack-overflow when dicts are deep.
+        lookup = [(z, layer)]
+        while len(lookup) > 0:
+            target, source = lookup.pop()
+            for k, yk in source.items():
+                xk = target.get(k)
+                if isinstance(xk, dict) and isinstance(yk, dict):
+                    if len(yk) == 0:
+                        continue
+                    if (id(xk) in foreign) if inplace else (id(xk) not in owned):
+                        xk = target[k] = dict(xk)
+                        owned[id(xk)] = xk
+                        # Nested dicts of a foreign dict are foreign as well.
+                        if inplace:
+                            foreign.update((id(v), v) for v in xk.values() if isinstance(v, dict))
+                    lookup.append((xk, yk))
+                else:
+                    target[k] = yk
+                    if inplace and isinstance(yk, dict):
+                        foreign[id(yk)] = yk
     return z
+
+
+# Kinds of changes between two dicts.
+ADD, REMOVE, CHANGE = 'add', 'remove', 'change'
+
+
+def _hash(value):
+    """
+    Hash a value with its type.
+    :param value:   value to be hashed.
+    :return:        hash of value or None if it is unhashable.
+    """
+    try:
+        return hash((type(value), value))
+    except TypeError:
+        return None
+
+
+def fingerprints(x):
+    """
+    Fingerprint every nested dict of a dictionary in one pass. Fingerprints do not depend on key order,
+    they are only comparable within the same process since hashes of strings are salted per process.
+    Nested dicts holding an unhashable value, directly or deeper, have no fingerprint.
+    :param x:   dict to be fingerprinted.
+    :return:    dict of key path and fingerprint or None of each nested dict, the path of x itself is ().
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    examine(isinstance(x, dict), 'input should be dict.')
+    prints, order, lookup = dict(), [], [((), x)]
+    # Walk nested dicts in pre-order, then fingerprint them in reversed order so nested ones come first.
+    while len(lookup) > 0:
+        path, item = lookup.pop()
+        order.append((path, item))
+        lookup.extend((path + (k,), v) for k, v in item.items() if isinstance(v, dict))
+    for path, item in reversed(order):
+        prints[path] = _combine(path, item, prints)
+    return prints
+
+
+def _combine(path, item, prints):
+    """
+    Fingerprint a nested dict from fingerprints of its own nested dicts.
+    :param path:    key path of nested dict.
+    :param item:    nested dict.
+    :param prints:  fingerprints holding every nested dict of item.
+    :return:        fingerprint or None if some value is unhashable.
+    """
+    parts = [(k, prints[path + (k,)] if isinstance(v, dict) else _hash(v)) for k, v in item.items()]
+    return None if any(part is None for _, part in parts) else hash(frozenset(parts))
+
+
+def fingerprint(x):
+    """
+    Fingerprint a dictionary with all of its nested dicts.
+    :param x:   dict to be fingerprinted.
+    :return:    fingerprint or None if some value is unhashable.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    return fingerprints(x)[()]
+
+
+def diff(old, new, old_prints=None, new_prints=None):
+    """
+    Compute changes from a dictionary to another one. Nested dicts which are the same object are skipped.
+    When fingerprints of both sides are given, nested dicts of the same fingerprint are skipped without
+    being walked, so they are trusted to be equal.
+    :param old:         old dict.
+    :param new:         new dict.
+    :param old_prints:  fingerprints of old dict.
+    :param new_prints:  fingerprints of new dict.
+    :return:            list of changes, each is a tuple of kind, key path and value. Value is the new value
+                        of added and changed keys, and the old value of removed keys.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+    examine(isinstance(old, dict) and isinstance(new, dict), 'inputs should be dict.')
+    prints = old_prints is not None and new_prints is not None
+    changes, lookup = [], [((), old, new)]
+    # We use a stack instead of recursion to avoid stack-overflow when dicts are deep.
+    while len(lookup) > 0:
+        path, x, y = lookup.pop()
+        if x is y:
+            continue
+        if prints:
+            value = old_prints.get(path)
+            if value is not None and value == new_prints.get(path):
+                continue
+        for k, xk in x.items():
+            if k not in y:
+                changes.append((REMOVE, path + (k,), xk))
+        for k, yk in y.items():
+            if k not in x:
+                changes.append((ADD, path + (k,), yk))
+                continue
+            xk = x[k]
+            if xk is yk:
+                continue
+            if isinstance(xk, dict) and isinstance(yk, dict):
+                lookup.append((path + (k,), xk, yk))
+            elif type(xk) is not type(yk) or xk != yk:
+                changes.append((CHANGE, path + (k,), yk))
+    return changes
+
+
+def patch(x, changes, prints=None):
+    """
+    Apply changes computed by diff to a dictionary in place. When fingerprints of the dictionary are given,
+    they are kept up to date in place as well, only changed paths and their ancestors are fingerprinted again.
+    :param x:       dict to be patched.
+    :param changes: list of changes.
+    :param prints:  fingerprints of dict to be updated.
+    :return:        patched dict.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    @modified:  18th October, 2026.
+    """
+    examine(isinstance(x, dict), 'input should be dict.')
+    ancestors = set()
+    for kind, path, value in changes:
+        target = x
+        for k in path[:-1]:
+            target = target.setdefault(k, dict())
+        if kind == REMOVE:
+            old = target.pop(path[-1], None)
+        else:
+            old, target[path[-1]] = target.get(path[-1]), value
+        if prints is None:
+            continue
+        # Drop fingerprints of the replaced subtree, then fingerprint the new one alone.
+        lookup = [(path, old)] if isinstance(old, dict) else []
+        while len(lookup) > 0:
+            item_path, item = lookup.pop()
+            prints.pop(item_path, None)
+            lookup.extend((item_path + (k,), v) for k, v in item.items() if isinstance(v, dict))
+        if kind != REMOVE and isinstance(value, dict):
+            prints.update((path + item_path, item) for item_path, item in fingerprints(value).items())
+        ancestors.update(path[:i] for i in range(len(path)))
+    # Ancestors are fingerprinted again from the deepest, skipping those removed by later changes.
+    for path in sorted(ancestors, key=len, reverse=True):
+        item = x
+        for k in path:
+            item = item.get(k) if isinstance(item, dict) else None
+        if isinstance(item, dict):
+            prints[path] = _combine(path, item, prints)
+    return x
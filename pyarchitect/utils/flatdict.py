@@ -0,0 +1,208 @@
+# ------------------------------------------------------------------------------
+#  GNU General Public License
+#
+#  Copyright (c) 2020, Hieu Pham.
+#
+#  This file is part of Py-Architect.
+#  <https://github.com/hieupth/pyarchitect>
+#
+#  Py-Architect is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Py-Architect is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+from collections.abc import MutableMapping
+from pyarchitect.generic import Object
+
+
+class FlatDict(Object, MutableMapping):
+    """
+    Flattened view of a nested dictionary, which maps key paths (tuples of keys) to values.
+    Deep lookups are a single hash lookup, and nested dicts are tracked as branches for prefix iteration.
+    Empty nested dicts are kept as values, so converting back gives the same nested dict.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+
+    def __init__(self, data=None):
+        """
+        Class constructor.
+        :param data:    nested dict or flat dict to be flattened.
+        """
+        # Values by key path.
+        self._data = dict()
+        # Keys of each nested dict by its key path, each value is a dict used as ordered set.
+        self._branches = {(): dict()}
+        if isinstance(data, FlatDict):
+            self._data = dict(data._data)
+            self._branches = {path: dict(keys) for path, keys in data._branches.items()}
+        elif data is not None:
+            self.examine(isinstance(data, dict), 'data should be dict.')
+            self._flatten(data, ())
+
+    def _flatten(self, data, prefix):
+        """
+        Add a nested dict under a key path, without recursion.
+        :param data:    nested dict.
+        :param prefix:  key path of nested dict, it must be a branch.
+        """
+        lookup = [(prefix, data)]
+        while len(lookup) > 0:
+            path, item = lookup.pop()
+            keys = self._branches[path]
+            for k, v in item.items():
+                keys[k] = None
+                if isinstance(v, dict) and len(v) > 0:
+                    self._branches[path + (k,)] = dict()
+                    lookup.append((path + (k,), v))
+                else:
+                    self._data[path + (k,)] = v
+
+    def _drop(self, path):
+        """
+        Remove the branch at a key path with all of its values.
+        :param path:    key path of branch.
+        """
+        lookup = [path]
+        while len(lookup) > 0:
+            path = lookup.pop()
+            for k in self._branches.pop(path):
+                if path + (k,) in self._branches:
+                    lookup.append(path + (k,))
+                else:
+                    self._data.pop(path + (k,), None)
+
+    def _open(self, path):
+        """
+        Make sure all prefixes of a key path are branches, values found along the way are replaced.
+        :param path:    key path.
+        """
+        for i in range(len(path)):
+            prefix = path[:i]
+            if prefix not in self._branches:
+                self._data.pop(prefix, None)
+                self._branches[prefix] = dict()
+            self._branches[prefix][path[i]] = None
+
+    @staticmethod
+    def _path(path):
+        """
+        Get key path, a single key is a path of length one.
+        :param path:    key path or key.
+        """
+        return path if isinstance(path, tuple) else (path,)
+
+    def __getitem__(self, path):
+        return self._data[self._path(path)]
+
+    def __setitem__(self, path, value):
+        path = self._path(path)
+        self.examine(len(path) > 0, 'key path should not be empty.')
+        self._open(path)
+        if path in self._branches:
+            self._drop(path)
+        if isinstance(value, dict) and len(value) > 0:
+            self._branches[path] = dict()
+            self._flatten(value, path)
+        else:
+            self._data[path] = value
+
+    def __delitem__(self, path):
+        path = self._path(path)
+        del self._data[path]
+        parent = path[:-1]
+        keys = self._branches[parent]
+        del keys[path[-1]]
+        # Like nested dicts, a nested dict which has no more keys is left empty.
+        if len(keys) == 0 and len(parent) > 0:
+            del self._branches[parent]
+            self._data[parent] = dict()
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, self._data)
+
+    def copy(self):
+        """
+        Copy this flat dict.
+        """
+        return FlatDict(self)
+
+    def is_branch(self, path):
+        """
+        Check a key path is a nested dict or not?
+        :param path:    key path.
+        """
+        return self._path(path) in self._branches
+
+    def items(self, prefix=()):
+        """
+        Iterate over key paths and values, only under a prefix if it is given.
+        :param prefix:  key path prefix.
+        :return:        generator of key path and value pairs.
+        """
+        prefix = self._path(prefix)
+        if prefix not in self._branches:
+            if prefix in self._data:
+                yield prefix, self._data[prefix]
+            return
+        lookup = [prefix]
+        while len(lookup) > 0:
+            path = lookup.pop()
+            for k in self._branches[path]:
+                if path + (k,) in self._branches:
+                    lookup.append(path + (k,))
+                else:
+                    yield path + (k,), self._data[path + (k,)]
+
+    def to_dict(self, prefix=()):
+        """
+        Convert to nested dict, without recursion.
+        :param prefix:  only convert the nested dict at this key path.
+        :return:        nested dict.
+        """
+        prefix = self._path(prefix)
+        result, size = dict(), len(prefix)
+        for path, value in self.items(prefix):
+            target = result
+            for k in path[size:-1]:
+                target = target.setdefault(k, dict())
+            target[path[-1]] = dict() if isinstance(value, dict) else value
+        return result
+
+    def merge(self, other, inplace=False):
+        """
+        Deep merge another flat dict, with the same result as dicts.update on the nested dicts.
+        :param other:   flat dict to be merged.
+        :param inplace: merge into this flat dict instead of a new one?
+        :return:        merged flat dict.
+        """
+        self.examine(isinstance(other, FlatDict), 'input should be FlatDict.')
+        result = self if inplace else self.copy()
+        branches, data = result._branches, result._data
+        for path, value in other._data.items():
+            # A value of this side on the way is replaced by the nested dict of other side.
+            result._open(path)
+            if isinstance(value, dict):
+                # Merging an empty nested dict into a nested dict keeps it.
+                if path not in branches and not isinstance(data.get(path), dict):
+                    data[path] = value
+            else:
+                if path in branches:
+                    result._drop(path)
+                data[path] = value
+        return result
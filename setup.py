@@ -27,7 +27,7 @@ with open("README.md", "r") as fh:
 
 setup(
     name='pyarchitect',
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks', 'benchmarks.*', 'tests', 'tests.*']),
     version='0.0.6.3.2',
     license='GPLv3',
     description='Implementations of common data structures, design patterns and useful utilities',
@@ -39,13 +39,13 @@ setup(
     download_url='https://github.com/hieupth/pyarchitect/archive/v_01.tar.gz',
     keywords=['data structure', 'design pattern', 'software architect'],
     install_requires=[],
+    python_requires='>=3.7',
     classifiers=[
         'Development Status :: 1 - Planning',
         'Intended Audience :: Developers',
         'Topic :: Software Development :: Build Tools',
         'License :: OSI Approved :: GNU General Public License v3 (GPLv3)',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3.8',
     ]
@@ -0,0 +1,59 @@
+# ------------------------------------------------------------------------------
+#  GNU General Public License
+#
+#  Copyright (c) 2020, Hieu Pham.
+#
+#  This file is part of Py-Architect.
+#  <https://github.com/hieupth/pyarchitect>
+#
+#  Py-Architect is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Py-Architect is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import copy
+import unittest
+from pyarchitect.utils.dicts import fingerprints, diff, patch, ADD, REMOVE, CHANGE
+
+
+class TestPatch(unittest.TestCase):
+    """
+    Test diff and patch of nested dicts with their fingerprints.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+
+    def setUp(self):
+        self.old = {'a': {'b': 1, 'c': {'d': 2}}, 'e': {'f': [3]}, 'g': 4}
+        self.new = {'a': {'b': 1, 'c': {'d': 5}}, 'e': 6, 'h': {'i': {'j': 7}}}
+
+    def test_diff(self):
+        changes = diff(self.old, self.new, fingerprints(self.old), fingerprints(self.new))
+        self.assertEqual(sorted(changes, key=repr), sorted([
+            (REMOVE, ('g',), 4), (ADD, ('h',), {'i': {'j': 7}}),
+            (CHANGE, ('e',), 6), (CHANGE, ('a', 'c', 'd'), 5)], key=repr))
+
+    def test_patch_prints(self):
+        x, prints = copy.deepcopy(self.old), fingerprints(self.old)
+        patch(x, diff(self.old, self.new, prints, fingerprints(self.new)), prints)
+        self.assertEqual(x, self.new)
+        self.assertEqual(prints, fingerprints(self.new))
+
+    def test_patch_removed_subtree(self):
+        x, prints = copy.deepcopy(self.old), fingerprints(self.old)
+        patch(x, [(REMOVE, ('a',), None), (ADD, ('k', 'l'), {'m': 8})], prints)
+        self.assertEqual(prints, fingerprints(x))
+        self.assertNotIn(('a', 'c'), prints)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+# ------------------------------------------------------------------------------
+#  GNU General Public License
+#
+#  Copyright (c) 2020, Hieu Pham.
+#
+#  This file is part of Py-Architect.
+#  <https://github.com/hieupth/pyarchitect>
+#
+#  Py-Architect is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Py-Architect is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import unittest
+import threading
+from pyarchitect.generic import ValidationError, validation, trusted
+from pyarchitect.datastructs.gentree import Node
+
+
+class TestTrusted(unittest.TestCase):
+    """
+    Test trusted mode of validation.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+
+    def test_skip_checks(self):
+        with trusted(False):
+            with self.assertRaises(ValidationError):
+                Node('root').attach(1)
+            with trusted():
+                self.assertTrue(validation.trusted)
+                node = Node('root')
+                node.name = ['unchecked']
+                self.assertEqual(node.name, ['unchecked'])
+            self.assertFalse(validation.trusted)
+
+    def test_other_threads(self):
+        with trusted(False):
+            seen, entered, leave = [], threading.Event(), threading.Event()
+
+            def worker():
+                with trusted():
+                    entered.set()
+                    leave.wait(5)
+            thread = threading.Thread(target=worker)
+            thread.start()
+            entered.wait(5)
+            seen.append(validation.trusted)
+            with self.assertRaises(ValidationError):
+                Node('root').attach(1)
+            leave.set()
+            thread.join()
+            self.assertEqual(seen, [False])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+# ------------------------------------------------------------------------------
+#  GNU General Public License
+#
+#  Copyright (c) 2020, Hieu Pham.
+#
+#  This file is part of Py-Architect.
+#  <https://github.com/hieupth/pyarchitect>
+#
+#  Py-Architect is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Py-Architect is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import unittest
+from pyarchitect.datastructs.gentree import Node
+
+
+class TestPathIndex(unittest.TestCase):
+    """
+    Test path index of gentree nodes.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+
+    def setUp(self):
+        self.root = Node.from_dict({'x': {'c': {}, 'd': {}}, 'y': {}}, 'root')
+        self.x = self.root.get_path('x')
+        self.outer = self.root.index_paths()
+        self.inner = self.x.index_paths()
+
+    def test_nested_attach(self):
+        leaf = Node('new')
+        self.x.attach(leaf)
+        self.assertIs(self.root.get_path('x/new'), leaf)
+        self.assertIs(self.x.get_path('new'), leaf)
+        self.assertEqual(self.root.find('new'), [leaf])
+
+    def test_nested_detach(self):
+        _, c = self.x.detach('c')
+        self.assertIsNone(self.root.get_path('x/c'))
+        self.assertIsNone(self.x.get_path('c'))
+        self.assertEqual(c.__paths__, ())
+
+    def test_nested_rename(self):
+        c = self.root.get_path('x/c')
+        c.name = 'e'
+        self.assertIsNone(self.root.get_path('x/c'))
+        self.assertIs(self.root.get_path('x/e'), c)
+        self.assertIs(self.x.get_path('e'), c)
+        self.x.name = 'z'
+        self.assertIsNone(self.root.get_path('x/e'))
+        self.assertIs(self.root.get_path('z/e'), c)
+        self.assertIs(self.x.get_path('e'), c)
+
+    def test_attach_indexed_subtree(self):
+        other = Node.from_dict({'a': {'b': {}}}, 'other')
+        index = other.index_paths()
+        self.root.get_path('y').attach(other)
+        self.assertIs(self.root.get_path('y/other/a/b'), other.get_path('a/b'))
+        self.assertIs(other.index_paths(), index)
+        self.root.get_path('y').detach('other')
+        self.assertIsNone(self.root.get_path('y/other/a'))
+        self.assertIsNotNone(other.get_path('a/b'))
+
+
+class TestAggregates(unittest.TestCase):
+    """
+    Test tracked aggregates of gentree nodes.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+
+    def test_tops_order(self):
+        root = Node.from_dict({'x': {'c': {}, 'd': {}}, 'y': {}}, 'root')
+        untracked = [node.name for node in root.tops]
+        root.track()
+        self.assertEqual([node.name for node in root.tops], untracked)
+        root.get_path('y').attach(Node('e'))
+        root.get_path('x').detach('c')
+        root.get_path('x/d').attach(Node('f'))
+        self.assertEqual([node.name for node in root.tops], ['e', 'f'])
+        root.attach(Node('z'))
+        self.assertEqual([node.name for node in root.tops], ['z', 'e', 'f'])
+        self.assertEqual(root.top_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,253 @@
+# ------------------------------------------------------------------------------
+#  GNU General Public License
+#
+#  Copyright (c) 2020, Hieu Pham.
+#
+#  This file is part of Py-Architect.
+#  <https://github.com/hieupth/pyarchitect>
+#
+#  Py-Architect is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Py-Architect is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import unittest
+from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
+from pyarchitect.generic import ValidationError
+from pyarchitect.kwargparse import KwargParse
+
+
+def _schema():
+    """
+    Build a kwarg parse with renamed keys, defaults, nested and ignored levels.
+    :return:    root kwarg parse.
+    """
+    root = KwargParse('root', ignore=True)
+    root.attach('lr', key='learning_rate', default=0.1)
+    root.attach('epochs', default=10)
+    _, model = root.attach('model')
+    model.attach('layers', default=2)
+    _, dropout = model.attach('dropout', key='drop')
+    dropout.attach('rate', default=0.5)
+    _, hidden = model.attach('hidden', ignore=True)
+    hidden.attach('units', default=64)
+    return root
+
+
+# Keyword arguments of test, given fully, partly and not at all.
+KWARGS = [
+    dict(),
+    dict(lr=0.01),
+    dict(lr=0.01, epochs=3, model=dict(layers=4, dropout=dict(rate=0.2), units=128)),
+    dict(model=dict(dropout=dict()), unused=1),
+]
+
+
+class TestParsePlan(unittest.TestCase):
+    """
+    Test compiled parse plans of kwarg parses.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+
+    def setUp(self):
+        self.root = _schema()
+
+    def test_same_as_tree_walk(self):
+        walked = [self.root.parse(**kwargs) for kwargs in KWARGS]
+        plan = self.root.compile()
+        self.assertIs(self.root._plan, plan)
+        self.assertEqual([self.root.parse(**kwargs) for kwargs in KWARGS], walked)
+        self.assertEqual([plan(**kwargs) for kwargs in KWARGS], walked)
+
+    def test_from_dict(self):
+        other = KwargParse.from_dict(self.root.to_dict())
+        other.compile()
+        self.assertEqual([other.parse(**kwargs) for kwargs in KWARGS],
+                         [self.root.parse(**kwargs) for kwargs in KWARGS])
+
+    def test_from_dict_checks(self):
+        for data in ({'a': {'key': ['x']}}, {'a': {'name': ('x',)}}, {'a': {'name': 'b'}, 'b': {}}, {'a': 1}):
+            with self.assertRaises(ValidationError):
+                KwargParse.from_dict(data, name='root')
+
+    def _changed(self, change, kwargs):
+        plan = self.root.compile()
+        change()
+        self.assertIsNone(self.root._plan)
+        expected = self.root.parse(**kwargs)
+        self.assertIsNot(self.root.compile(), plan)
+        self.assertEqual(self.root.parse(**kwargs), expected)
+        return expected
+
+    def test_attach(self):
+        result = self._changed(lambda: self.root.attach('seed', default=7), dict())
+        self.assertEqual(result['seed'], 7)
+
+    def test_nested_attach(self):
+        model = self.root.leaf('model')
+        result = self._changed(lambda: model.leaf('dropout').attach('mode', default='up'), dict())
+        self.assertEqual(result['model']['drop']['mode'], 'up')
+
+    def test_detach(self):
+        result = self._changed(lambda: self.root.leaf('model').detach('layers'), dict())
+        self.assertNotIn('layers', result['model'])
+
+    def test_rename(self):
+        def rename():
+            self.root.leaf('epochs').name = 'steps'
+        result = self._changed(rename, dict(steps=5))
+        self.assertEqual(result['steps'], 5)
+
+    def test_key(self):
+        def rekey():
+            self.root.leaf('lr').key = 'rate'
+        result = self._changed(rekey, dict(lr=0.3))
+        self.assertEqual(result['rate'], 0.3)
+        self.assertNotIn('learning_rate', result)
+
+    def test_default_and_ignore(self):
+        def change():
+            self.root.leaf('epochs').default = 1
+        self.assertEqual(self._changed(change, dict())['epochs'], 1)
+
+        def ignore():
+            self.root.leaf('model').ignore = True
+        self.assertEqual(self._changed(ignore, dict(layers=3))['layers'], 3)
+
+
+class TestParseMany(unittest.TestCase):
+    """
+    Test parsing many records at once.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+
+    def setUp(self):
+        self.root = _schema()
+        self.records = KWARGS * 5
+        self.expected = [self.root.parse(**record) for record in self.records]
+
+    def test_parse_many(self):
+        self.assertEqual(list(self.root.parse_many(self.records)), self.expected)
+
+    def test_parse_many_executor(self):
+        with ThreadPoolExecutor(2) as executor:
+            parsed = self.root.parse_many(iter(self.records), executor, chunksize=3, prefetch=2)
+            self.assertEqual(list(parsed), self.expected)
+
+    def _columns(self, records):
+        # Top level arguments as columns, nested ones stay dicts.
+        names = set(name for record in records for name in record)
+        return {name: [record.get(name, {}) if name == 'model' else record[name] for record in records]
+                for name in names}
+
+    def _rows(self, columns, size):
+        # Turn parsed columns back to parsed records.
+        rows = [dict() for _ in range(size)]
+        lookup = [(columns, rows)]
+        while len(lookup) > 0:
+            item, targets = lookup.pop()
+            for key, value in item.items():
+                if isinstance(value, dict):
+                    nested = [target.setdefault(key, dict()) for target in targets]
+                    lookup.append((value, nested))
+                else:
+                    for target, part in zip(targets, value):
+                        target[key] = part
+        return rows
+
+    def test_parse_columns(self):
+        records = [dict(lr=0.1 * i, epochs=i, model=dict(layers=i)) for i in range(20)]
+        expected = [self.root.parse(**record) for record in records]
+        columns = self._columns(records)
+        self.assertEqual(self._rows(self.root.parse_columns(columns), 20), expected)
+        with ThreadPoolExecutor(2) as executor:
+            parsed = self.root.parse_columns(columns, executor, chunksize=6)
+        self.assertEqual(self._rows(parsed, 20), expected)
+
+
+class TestParseCache(unittest.TestCase):
+    """
+    Test cached results of kwarg parses.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+
+    def setUp(self):
+        self.root = _schema()
+        self.expected = [self.root.parse(**kwargs) for kwargs in KWARGS]
+
+    def test_hits_and_misses(self):
+        self.root.cache()
+        for _ in range(2):
+            self.assertEqual([self.root.parse(**kwargs) for kwargs in KWARGS], self.expected)
+        info = self.root.cache_info()
+        self.assertEqual((info.hits, info.misses, info.uncached), (len(KWARGS), len(KWARGS), 0))
+        self.assertEqual(info.currsize, len(KWARGS))
+
+    def test_maxsize(self):
+        self.root.cache(maxsize=2)
+        for kwargs in KWARGS + KWARGS[:1]:
+            self.root.parse(**kwargs)
+        info = self.root.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, len(KWARGS) + 1, 2))
+
+    def test_readonly(self):
+        self.root.cache()
+        result = self.root.parse(lr=0.01)
+        with self.assertRaises(TypeError):
+            result['epochs'] = 1
+        with self.assertRaises(TypeError):
+            result['model']['layers'] = 1
+        self.assertEqual(self.root.parse(lr=0.01), self.expected[1])
+
+    def test_copies(self):
+        self.root.cache(readonly=False)
+        for _ in range(2):
+            result = self.root.parse(lr=0.01)
+            self.assertEqual(result, self.expected[1])
+            result['model']['layers'] = 1
+        self.assertEqual(self.root.cache_info().hits, 1)
+
+    def test_tree_changes(self):
+        self.root.cache()
+        self.root.parse(lr=0.01)
+        self.root.attach('seed', default=7)
+        self.assertEqual(self.root.parse(lr=0.01)['seed'], 7)
+        self.root.get_path('model/layers').key = 'depth'
+        self.assertEqual(self.root.parse(lr=0.01)['model']['depth'], 2)
+        self.assertEqual(self.root.cache_info().hits, 0)
+
+    def test_equal_values_apart(self):
+        self.root.cache()
+        self.assertEqual(str(self.root.parse(lr=Decimal('1.0'))['learning_rate']), '1.0')
+        self.assertEqual(str(self.root.parse(lr=Decimal('1.00'))['learning_rate']), '1.00')
+        self.assertIs(self.root.parse(lr=True)['learning_rate'], True)
+        self.assertIs(type(self.root.parse(lr=1)['learning_rate']), int)
+        info = self.root.cache_info()
+        self.assertEqual((info.hits, info.misses, info.uncached), (0, 2, 2))
+
+    def test_mutable_values(self):
+        self.root.cache()
+        value = [1]
+        self.root.parse(lr=value)
+        value.append(2)
+        self.assertEqual(self.root.parse(lr=value)['learning_rate'], [1, 2])
+        self.assertEqual(self.root.cache_info().uncached, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
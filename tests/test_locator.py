@@ -0,0 +1,185 @@
+# ------------------------------------------------------------------------------
+#  GNU General Public License
+#
+#  Copyright (c) 2020, Hieu Pham.
+#
+#  This file is part of Py-Architect.
+#  <https://github.com/hieupth/pyarchitect>
+#
+#  Py-Architect is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Py-Architect is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import time
+import asyncio
+import unittest
+import threading
+import contextvars
+from pyarchitect.generic import ValidationError
+from pyarchitect.patterns.locator import Locator
+
+
+def _in_thread(call):
+    """
+    Run a callable in another thread.
+    :param call:    callable to be run.
+    :return:        its result.
+    """
+    result = []
+    thread = threading.Thread(target=lambda: result.append(call()))
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+class TestLocator(unittest.TestCase):
+    """
+    Test service lifetimes and registrations of locator.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+
+    def setUp(self):
+        self.locator = Locator()
+
+    def test_singleton(self):
+        self.locator.register('a', object)
+        self.assertIs(self.locator.get('a'), self.locator.get('a'))
+        self.assertIs(_in_thread(lambda: self.locator.get('a')), self.locator.get('a'))
+
+    def test_transient(self):
+        self.locator.register('a', object, Locator.TRANSIENT)
+        self.assertIsNot(self.locator.get('a'), self.locator.get('a'))
+
+    def test_thread(self):
+        self.locator.register('a', object, Locator.THREAD)
+        self.assertIs(self.locator.get('a'), self.locator.get('a'))
+        self.assertIsNot(_in_thread(lambda: self.locator.get('a')), self.locator.get('a'))
+
+    def test_context(self):
+        self.locator.register('a', object, Locator.CONTEXT)
+        outer = self.locator.get('a')
+        self.assertIs(self.locator.get('a'), outer)
+        with self.locator.scope():
+            inner = self.locator.get('a')
+            self.assertIsNot(inner, outer)
+            self.assertIs(self.locator.get('a'), inner)
+        self.assertIs(self.locator.get('a'), outer)
+
+    def test_scopes_of_locators(self):
+        other = Locator()
+        for locator in (self.locator, other):
+            locator.register('a', object, Locator.CONTEXT)
+        kept = other.get('a')
+        with self.locator.scope():
+            self.assertIsNot(self.locator.get('a'), other.get('a'))
+            self.assertIs(other.get('a'), kept)
+        self.assertIsNone(contextvars.copy_context().run(lambda: Locator().get('a')))
+
+    def test_depends(self):
+        self.locator.register('a', lambda b, c: (b, c), depends=('b', 'c'))
+        self.locator.register('b', lambda: 'b')
+        self.locator.set('c', 'c')
+        self.assertEqual(self.locator.get('a'), ('b', 'c'))
+        self.locator.register('d', lambda e: e, depends=('e',))
+        with self.assertRaises(ValidationError):
+            self.locator.get('d')
+
+    def test_overwrite(self):
+        for lifetime in Locator.LIFETIMES:
+            self.locator.register(lifetime, lambda: 1, lifetime)
+            self.assertEqual(self.locator.get(lifetime), 1)
+            self.locator.register(lifetime, lambda: 2, lifetime)
+            self.assertEqual(self.locator.get(lifetime), 1)
+            self.locator.register(lifetime, lambda: 3, lifetime, overwrite=True)
+            self.assertEqual(self.locator.get(lifetime), 3)
+
+    def test_cycle(self):
+        self.locator.register('a', lambda b: b, depends=('b',))
+        self.locator.register('b', lambda c: c, depends=('c',))
+        with self.assertRaises(ValidationError):
+            self.locator.register('c', lambda a: a, depends=('a',))
+        with self.assertRaises(ValidationError):
+            self.locator.register('d', lambda d: d, depends=('d',))
+        self.locator.register('c', lambda: 'c')
+        self.assertEqual(self.locator.get('a'), 'c')
+
+
+    def test_aget(self):
+        async def build(b):
+            return ('a', b)
+        self.locator.register('a', build, depends=('b',))
+        self.locator.register('b', lambda: 'b')
+        self.locator.register('c', object, Locator.TRANSIENT)
+
+        async def run():
+            return await self.locator.aget('a'), await self.locator.aget('c'), await self.locator.aget('c')
+        a, c, d = asyncio.run(run())
+        self.assertEqual(a, ('a', 'b'))
+        self.assertIs(self.locator.get('a'), a)
+        self.assertIsNot(c, d)
+        self.locator.register('e', build, depends=('b',))
+        with self.assertRaises(ValidationError):
+            self.locator.get('e')
+
+    def test_get_and_aget_build_once(self):
+        calls = []
+
+        def build():
+            calls.append(1)
+            time.sleep(0.05)
+            return object()
+
+        self.locator.register('a', build)
+
+        async def run():
+            task = asyncio.ensure_future(self.locator.aget('a'))
+            await asyncio.sleep(0.01)
+            thread = asyncio.get_running_loop().run_in_executor(None, self.locator.get, 'a')
+            return await asyncio.gather(task, thread, self.locator.aget('a'))
+        services = asyncio.run(run())
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(service is services[0] for service in services))
+
+    def test_failed_build(self):
+        calls = []
+
+        def build():
+            calls.append(1)
+            if len(calls) == 1:
+                raise ValueError('failed.')
+            return 'a'
+
+        self.locator.register('a', build)
+        with self.assertRaises(ValueError):
+            self.locator.get('a')
+        self.assertEqual(self.locator.get('a'), 'a')
+
+    def test_warm_up(self):
+        self.locator.register('a', lambda b: ('a', b), depends=('b',))
+        self.locator.register('b', lambda: 'b')
+        self.locator.register('c', object, Locator.TRANSIENT)
+        self.assertEqual(sorted(self.locator.warm_up(2)), ['a', 'b'])
+        self.assertEqual(self.locator.get('a'), ('a', 'b'))
+        self.assertEqual(self.locator.warm_up(2), dict())
+
+    def test_warm_up_async(self):
+        async def build(b):
+            return ('a', b)
+        self.locator.register('a', build, depends=('b',))
+        self.locator.register('b', lambda: 'b')
+        self.assertEqual(sorted(asyncio.run(self.locator.warm_up_async())), ['a', 'b'])
+        self.assertEqual(self.locator.get('a'), ('a', 'b'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+# ------------------------------------------------------------------------------
+#  GNU General Public License
+#
+#  Copyright (c) 2020, Hieu Pham.
+#
+#  This file is part of Py-Architect.
+#  <https://github.com/hieupth/pyarchitect>
+#
+#  Py-Architect is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Py-Architect is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import unittest
+from pyarchitect.patterns.multiton import Multiton
+
+
+class Point(metaclass=Multiton):
+    """
+    Multiton of test.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+
+
+class TestMultiton(unittest.TestCase):
+    """
+    Test multiton instance cache.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+
+    def setUp(self):
+        Point.cache_clear()
+
+    def test_same_arguments(self):
+        self.assertIs(Point(1, x=2), Point(1, x=2))
+        self.assertIs(Point(1, x=2, y=3), Point(1, y=3, x=2))
+
+    def test_call_shapes(self):
+        self.assertIsNot(Point((1,), (('x', 2),)), Point(1, x=2))
+        self.assertIsNot(Point(1, x=2), Point((1,), (('x', 2),)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+# ------------------------------------------------------------------------------
+#  GNU General Public License
+#
+#  Copyright (c) 2020, Hieu Pham.
+#
+#  This file is part of Py-Architect.
+#  <https://github.com/hieupth/pyarchitect>
+#
+#  Py-Architect is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Py-Architect is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import time
+import asyncio
+import unittest
+import threading
+from pyarchitect.patterns.pool import Pool
+
+
+class Resource:
+    """
+    Resource of test pools.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+
+    def __init__(self):
+        self.usable = True
+        self.destroyed = False
+
+
+class TestPool(unittest.TestCase):
+    """
+    Test checkouts, validation, eviction and closing of pool.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+
+    def pool(self, **kwargs):
+        kwargs.setdefault('destroy', lambda resource: setattr(resource, 'destroyed', True))
+        return Pool(Resource, **kwargs)
+
+    def test_reuse(self):
+        pool = self.pool(min_size=1, max_size=2)
+        with pool.checkout() as first:
+            self.assertEqual(pool.in_use, 1)
+        with pool.checkout() as second:
+            self.assertIs(second, first)
+        self.assertEqual((pool.size, pool.idle, pool.in_use), (1, 1, 0))
+
+    def test_timeout(self):
+        pool = self.pool(max_size=1)
+        resource = pool.acquire()
+        start = time.monotonic()
+        with self.assertRaises(TimeoutError):
+            pool.acquire(timeout=0.05)
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+        self.assertEqual(pool.stats['timeouts'], 1)
+        pool.release(resource)
+        self.assertIs(pool.acquire(timeout=0.05), resource)
+
+    def test_waiter_thread(self):
+        pool = self.pool(max_size=1)
+        resource, got = pool.acquire(), []
+        thread = threading.Thread(target=lambda: got.append(pool.acquire(timeout=5)))
+        thread.start()
+        time.sleep(0.02)
+        pool.release(resource)
+        thread.join()
+        self.assertEqual(got, [resource])
+
+    def test_validate(self):
+        pool = self.pool(max_size=1, validate=lambda resource: resource.usable)
+        resource = pool.acquire()
+        resource.usable = False
+        pool.release(resource)
+        self.assertTrue(resource.destroyed)
+        self.assertEqual(pool.size, 0)
+        self.assertIsNot(pool.acquire(), resource)
+
+    def test_discard(self):
+        pool = self.pool(max_size=1)
+        resource = pool.acquire()
+        pool.release(resource, discard=True)
+        self.assertTrue(resource.destroyed)
+        self.assertEqual(pool.stats['destroyed'], 1)
+
+    def test_idle_eviction(self):
+        pool = self.pool(min_size=1, max_size=3, idle_timeout=0.02)
+        resources = [pool.acquire() for _ in range(3)]
+        for resource in resources:
+            pool.release(resource)
+        time.sleep(0.05)
+        self.assertEqual(pool.evict(), 2)
+        self.assertEqual((pool.size, pool.idle), (1, 1))
+        self.assertEqual(sum(resource.destroyed for resource in resources), 2)
+
+    def test_close(self):
+        pool = self.pool(max_size=2)
+        idle, used = pool.acquire(), pool.acquire()
+        pool.release(idle)
+        pool.close()
+        self.assertTrue(pool.closed)
+        self.assertTrue(idle.destroyed)
+        with self.assertRaises(RuntimeError):
+            pool.acquire()
+        pool.release(used)
+        self.assertTrue(used.destroyed)
+        self.assertEqual(pool.size, 0)
+
+    def test_close_wakes_waiter(self):
+        pool = self.pool(max_size=1)
+        pool.acquire()
+        errors = []
+
+        def wait():
+            try:
+                pool.acquire(timeout=5)
+            except RuntimeError as error:
+                errors.append(error)
+        thread = threading.Thread(target=wait)
+        thread.start()
+        time.sleep(0.02)
+        pool.close()
+        thread.join()
+        self.assertEqual(len(errors), 1)
+
+    def test_async_waiters(self):
+        pool = self.pool(max_size=1)
+
+        async def run():
+            resource = await pool.aacquire()
+            waiters = [asyncio.ensure_future(pool.aacquire(timeout=5)) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            # Returning from another thread wakes the first waiter in its loop.
+            await asyncio.get_running_loop().run_in_executor(None, pool.release, resource)
+            first = await waiters[0]
+            self.assertIs(first, resource)
+            self.assertFalse(waiters[1].done())
+            pool.release(first)
+            return await waiters[1]
+        self.assertIsNotNone(asyncio.run(run()))
+        self.assertEqual(pool.stats['waits'], 2)
+
+    def test_async_timeout_and_close(self):
+        pool = self.pool(max_size=1)
+
+        async def run():
+            await pool.aacquire()
+            with self.assertRaises(TimeoutError):
+                await pool.aacquire(timeout=0.02)
+            waiter = asyncio.ensure_future(pool.aacquire())
+            await asyncio.sleep(0.01)
+            pool.close()
+            with self.assertRaises(RuntimeError):
+                await waiter
+        asyncio.run(run())
+        self.assertEqual(pool.stats['timeouts'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
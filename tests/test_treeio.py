@@ -0,0 +1,76 @@
+# ------------------------------------------------------------------------------
+#  GNU General Public License
+#
+#  Copyright (c) 2020, Hieu Pham.
+#
+#  This file is part of Py-Architect.
+#  <https://github.com/hieupth/pyarchitect>
+#
+#  Py-Architect is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Py-Architect is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Py-Architect. If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+from decimal import Decimal
+from pyarchitect.generic import ValidationError
+from pyarchitect.kwargparse import KwargParse
+from pyarchitect.datastructs import treeio
+
+
+class TestTreeFile(unittest.TestCase):
+    """
+    Test writing and reading tree files.
+    ---------
+    @author:    Hieu Pham.
+    @created:   18th October, 2026.
+    """
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'tree.bin')
+        self.root = KwargParse('root')
+        _, model = self.root.attach('model', key='net')
+        model.attach('shape', default=(3, 4))
+        model.attach('map', default={1: 'a', (2, 3): [4.5, None]})
+        self.root.attach('lr', default=0.1)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_values_keep_types(self):
+        treeio.dump(self.root, self.path)
+        other = treeio.load(self.path)
+        self.assertEqual(other.to_dict(), self.root.to_dict())
+        self.assertIs(type(other.get_path('model/shape').default), tuple)
+
+    def test_unsupported_value(self):
+        treeio.dump(self.root, self.path)
+        self.root.attach('bad', default=Decimal('1.0'))
+        with self.assertRaises(ValidationError):
+            treeio.dump(self.root, self.path)
+        # The previous file is left untouched.
+        self.assertEqual(os.listdir(self.folder), ['tree.bin'])
+        self.assertIsNone(treeio.load(self.path).get_path('bad'))
+
+    def test_stored_path(self):
+        treeio.dump(self.root, self.path)
+        with treeio.TreeFile(self.path) as file:
+            self.assertEqual(file.root.get_path('model/map').name, 'map')
+            self.assertEqual(file.root.get_path(['model', 'shape']).name, 'shape')
+            self.assertIsNone(file.root.get_path('model/none'))
+
+
+if __name__ == '__main__':
+    unittest.main()